@@ -0,0 +1,107 @@
+"""Measures cold import time of the library's entry points.
+
+Every import statement is executed in a fresh interpreter, so nothing is shared between measurements. Besides
+the wall time of the import, the script reports which heavy optional dependencies got loaded along with it.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --statements "from planning_library.strategies.simple import SimpleStrategy"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Sequence
+
+DEFAULT_STATEMENTS = (
+    "import planning_library",
+    "from planning_library.instrumentation import track_run_stats",
+    "from planning_library.components import RunnableComponent",
+    "from planning_library.function_calling_parsers import ParserRegistry",
+    "from planning_library.action_executors import LangchainActionExecutor",
+    "from planning_library.strategies.simple import SimpleStrategy",
+    "from planning_library.strategies.tot_dfs import TreeOfThoughtsDFSStrategy",
+    "from planning_library.strategies.adapt import ADaPTStrategy",
+    "from planning_library.strategies.reflexion import ReflexionStrategy",
+    "from planning_library.strategies.reflexion.components import ReflexionActor",
+)
+
+HEAVY_DEPENDENCIES = ("langchain.agents", "langgraph", "gymnasium", "multiprocessing", "http.server")
+"""Modules reported as loaded (or not) after importing each entry point."""
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+@dataclass
+class ImportTimeResult:
+    """Import time of a single import statement.
+
+    Args:
+        statement: Import statement.
+        median_ms: Median import time in a fresh interpreter in milliseconds.
+        min_ms: Minimum import time in milliseconds.
+        loaded: Heavy dependencies (from `HEAVY_DEPENDENCIES`) loaded by the import.
+    """
+
+    statement: str
+    median_ms: float
+    min_ms: float
+    loaded: List[str] = field(default_factory=list)
+
+
+def measure_import_time(statement: str, repeats: int = 5) -> ImportTimeResult:
+    """Executes an import statement in `repeats` fresh interpreters and reports the timings."""
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(statement=statement, heavy=HEAVY_DEPENDENCIES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["elapsed"])
+        loaded = result["loaded"]
+    return ImportTimeResult(
+        statement=statement,
+        median_ms=statistics.median(timings) * 1e3,
+        min_ms=min(timings) * 1e3,
+        loaded=loaded,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statements", nargs="+", default=list(DEFAULT_STATEMENTS))
+    parser.add_argument("--repeats", type=int, default=5, help="Number of fresh interpreters per statement.")
+    parser.add_argument("--output", help="Path to save results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = [measure_import_time(statement, repeats=args.repeats) for statement in args.statements]
+
+    width = max(len(r.statement) for r in results)
+    print(f"{'statement':<{width}} {'median ms':>10} {'min ms':>8}  heavy dependencies loaded")
+    for r in results:
+        print(f"{r.statement:<{width}} {r.median_ms:>10.1f} {r.min_ms:>8.1f}  {', '.join(r.loaded) or '-'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Load test for serving strategies: many concurrent `ainvoke` calls in a single event loop.
+
+Each concurrency level N starts N workers that run strategies concurrently against scripted models with
+simulated latency and in-process environments (see `benchmarks.scenarios`). For every level, the script reports:
+
+* throughput: completed runs per second;
+* latency percentiles of a single run;
+* event-loop lag: how late a probe task wakes up compared to its schedule. High lag means that some code
+  blocks the event loop (e.g., synchronous work inside async paths);
+* default executor usage: the number of `run_in_executor` calls per run and the peak number of busy
+  executor threads. These are serialization points: with the default executor limited in size,
+  async runs that fall back to threads queue up behind each other.
+
+Usage:
+    python -m benchmarks.load_test --strategy simple --concurrency 10 100 1000 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+from .scenarios import ENVIRONMENTS, STRATEGIES, StrategyRun, create_run
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Returns a given percentile (0-100) of values with the nearest-rank method."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class CountingThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted tasks and tracks the peak number of concurrently running ones."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.num_submitted = 0
+        self.num_running = 0
+        self.peak_running = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            self.num_submitted += 1
+
+        def _wrapped() -> Any:
+            with self._lock:
+                self.num_running += 1
+                self.peak_running = max(self.peak_running, self.num_running)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.num_running -= 1
+
+        return super().submit(_wrapped)
+
+
+class EventLoopLagMonitor:
+    """Periodically wakes up in the event loop and records how late it was.
+
+    Args:
+        interval: Time between probes in seconds.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(loop.time() - expected, 0.0))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+@dataclass
+class LoadTestResult:
+    """Results for a single concurrency level.
+
+    Args:
+        concurrency: Number of concurrent workers.
+        num_runs: Number of completed runs (including failed ones).
+        num_errors: Number of failed runs.
+        wall_s: Total wall time in seconds.
+        throughput: Completed runs per second.
+        p50_ms, p90_ms, p99_ms, max_ms: Latency percentiles of a single run in milliseconds.
+        lag_p50_ms, lag_p99_ms, lag_max_ms: Event-loop lag percentiles in milliseconds.
+        executor_calls_per_run: `run_in_executor` calls on the default executor per run.
+        executor_peak_threads: Peak number of busy threads of the default executor.
+    """
+
+    concurrency: int
+    num_runs: int
+    num_errors: int
+    wall_s: float
+    throughput: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    lag_p50_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    executor_calls_per_run: float
+    executor_peak_threads: int
+
+
+async def _run_level(
+    create: Callable[[], StrategyRun],
+    concurrency: int,
+    runs_per_worker: int,
+    lag_interval: float,
+    max_executor_workers: Optional[int],
+) -> LoadTestResult:
+    loop = asyncio.get_running_loop()
+    executor = CountingThreadPoolExecutor(max_workers=max_executor_workers)
+    loop.set_default_executor(executor)
+
+    # runs are created in advance, so only strategy execution is measured
+    runs = [create() for _ in range(concurrency * runs_per_worker)]
+    latencies: List[float] = []
+    num_errors = 0
+
+    async def _worker(worker_runs: List[StrategyRun]) -> None:
+        nonlocal num_errors
+        for run in worker_runs:
+            start = time.perf_counter()
+            try:
+                await run.ainvoke()
+            except Exception:
+                num_errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    monitor = EventLoopLagMonitor(interval=lag_interval)
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(runs[i::concurrency]) for i in range(concurrency)))
+    wall = time.perf_counter() - start
+    await monitor.stop()
+
+    return LoadTestResult(
+        concurrency=concurrency,
+        num_runs=len(latencies),
+        num_errors=num_errors,
+        wall_s=wall,
+        throughput=len(latencies) / wall,
+        p50_ms=percentile(latencies, 50) * 1e3,
+        p90_ms=percentile(latencies, 90) * 1e3,
+        p99_ms=percentile(latencies, 99) * 1e3,
+        max_ms=max(latencies) * 1e3,
+        lag_p50_ms=percentile(monitor.lags, 50) * 1e3,
+        lag_p99_ms=percentile(monitor.lags, 99) * 1e3,
+        lag_max_ms=max(monitor.lags, default=math.nan) * 1e3,
+        executor_calls_per_run=executor.num_submitted / len(latencies),
+        executor_peak_threads=executor.peak_running,
+    )
+
+
+def run_load_test(
+    strategy: str,
+    environment: str,
+    concurrency_levels: Sequence[int],
+    latency: float,
+    runs_per_worker: int = 1,
+    lag_interval: float = 0.01,
+    max_executor_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> List[LoadTestResult]:
+    """Runs the load test for each concurrency level in a fresh event loop.
+
+    Args:
+        strategy: Strategy to run (one of `STRATEGIES`).
+        environment: Environment to run in (one of `ENVIRONMENTS`).
+        concurrency_levels: Numbers of concurrent workers.
+        latency: Simulated latency of a single LLM call in seconds.
+        runs_per_worker: Number of sequential runs made by each worker.
+        lag_interval: Interval between event-loop lag probes in seconds.
+        max_executor_workers: Size of the default executor. If None, the asyncio default is used.
+        **kwargs: Options for `create_run` (e.g., `depth`, `branching`).
+    """
+    return [
+        asyncio.run(
+            _run_level(
+                lambda: create_run(strategy, environment, latency=latency, **kwargs),
+                concurrency=concurrency,
+                runs_per_worker=runs_per_worker,
+                lag_interval=lag_interval,
+                max_executor_workers=max_executor_workers,
+            )
+        )
+        for concurrency in concurrency_levels
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="simple")
+    parser.add_argument("--environment", choices=list(ENVIRONMENTS), default="frozen_lake")
+    parser.add_argument("--depth", type=int, default=None, help="Number of tool calls per run.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--runs-per-worker", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated LLM latency (s).")
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="Interval of event-loop lag probes (s).")
+    parser.add_argument("--max-executor-workers", type=int, default=None, help="Size of the default executor.")
+    parser.add_argument("--output", help="Path to save results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = run_load_test(
+        strategy=args.strategy,
+        environment=args.environment,
+        concurrency_levels=args.concurrency,
+        latency=args.latency,
+        runs_per_worker=args.runs_per_worker,
+        lag_interval=args.lag_interval,
+        max_executor_workers=args.max_executor_workers,
+        depth=args.depth,
+    )
+
+    print(f"{args.strategy}/{args.environment}, simulated LLM latency {args.latency * 1e3:.0f} ms")
+    header = (
+        f"{'concurrency':>11} {'runs':>6} {'errors':>6} {'runs/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+        f"{'max ms':>8} {'lag p99':>8} {'lag max':>8} {'exec/run':>8} {'threads':>7}"
+    )
+    print(header)
+    for r in results:
+        print(
+            f"{r.concurrency:>11} {r.num_runs:>6} {r.num_errors:>6} {r.throughput:>8.1f} {r.p50_ms:>8.1f} "
+            f"{r.p90_ms:>8.1f} {r.p99_ms:>8.1f} {r.max_ms:>8.1f} {r.lag_p99_ms:>8.1f} {r.lag_max_ms:>8.1f} "
+            f"{r.executor_calls_per_run:>8.1f} {r.executor_peak_threads:>7}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+    return 1 if any(r.num_errors for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""Memory profile of deep and wide searches with `tracemalloc`.
+
+Runs scripted scenarios (see `benchmarks.scenarios`) and reports, for each of them:
+
+* peak memory allocated during a run, in total and per unit of work: per tree node for ToT+DFS,
+  per trajectory step for the simple strategy and ADaPT, per reflection for Reflexion;
+* memory retained after the run has finished and its outputs were dropped, while the strategy instance is
+  still alive (as it is when a strategy is reused to serve requests), together with the allocation sites
+  responsible for it and the number of library objects (tree nodes, actions, messages) that survived.
+
+Scenarios with retained objects are flagged: this catches leaks such as search trees kept on strategy instances.
+
+Usage:
+    python -m benchmarks.memory_profile
+    python -m benchmarks.memory_profile --scenarios tot_dfs/wide reflexion/long --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from planning_library.instrumentation import track_run_stats
+from planning_library.instrumentation.metrics import TOT_NODES_CREATED
+
+from .scenarios import StrategyRun, create_run
+
+TRACKED_TYPES = (
+    "ToTNode",
+    "AgentAction",
+    "ToolAgentAction",
+    "AgentFinish",
+    "AgentStep",
+    "AIMessage",
+    "HumanMessage",
+    "ToolMessage",
+    "SystemMessage",
+    "ChatMessageHistory",
+)
+"""Names of types whose live instances are counted before and after each run."""
+
+
+def _tot_nodes_created() -> float:
+    return sum(TOT_NODES_CREATED.labels(kind).value for kind in ("intermediate", "terminal"))
+
+
+@dataclass
+class MemoryScenario:
+    """A scenario to profile.
+
+    Args:
+        name: Scenario name.
+        create: Creates a run.
+        unit: Name of a unit of work (e.g., node).
+        count_units: Returns the number of units of work done by a finished run, given the run and
+          the number of tool calls made during it.
+    """
+
+    name: str
+    create: Callable[[], StrategyRun]
+    unit: str
+    count_units: Callable[[StrategyRun, int], float]
+
+
+@dataclass
+class MemoryResult:
+    """Memory profile of a single scenario.
+
+    Args:
+        name: Scenario name.
+        unit: Name of a unit of work.
+        num_units: Number of units of work done by the run.
+        peak_kb: Peak memory allocated during the run in KiB.
+        peak_kb_per_unit: `peak_kb / num_units`.
+        retained_kb: Memory still allocated after the run in KiB.
+        retained_objects: Increase in the number of live objects of `TRACKED_TYPES` after the run.
+        top_retained: Allocation sites responsible for the most retained memory.
+        flagged: True when library objects created by the run are still alive.
+    """
+
+    name: str
+    unit: str
+    num_units: float
+    peak_kb: float
+    peak_kb_per_unit: float
+    retained_kb: float
+    retained_objects: Dict[str, int] = field(default_factory=dict)
+    top_retained: List[str] = field(default_factory=list)
+    flagged: bool = False
+
+
+def count_live_objects(type_names: Iterable[str] = TRACKED_TYPES) -> Dict[str, int]:
+    """Counts live objects (tracked by gc) of types with given names."""
+    names = set(type_names)
+    gc.collect()
+    counts = Counter(type(obj).__name__ for obj in gc.get_objects() if type(obj).__name__ in names)
+    return dict(counts)
+
+
+def _top_retained(after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, top: int) -> List[str]:
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    return [
+        f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}: +{stat.size_diff / 1024:.1f} KiB "
+        f"({stat.count_diff:+d} blocks)"
+        for stat in stats[:top]
+        if stat.size_diff > 0
+    ]
+
+
+def profile_scenario(scenario: MemoryScenario, top: int = 5) -> MemoryResult:
+    """Profiles a single run of a scenario.
+
+    A warm-up run is made first, so that one-off allocations (imports, caches of the libraries)
+    are not attributed to the measured run.
+    """
+    scenario.create().invoke()
+
+    run = scenario.create()
+    objects_before = count_live_objects()
+    snapshot_before = tracemalloc.take_snapshot()
+    current_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    with track_run_stats() as run_stats:
+        outputs: Optional[Any] = run.invoke()
+    _, peak = tracemalloc.get_traced_memory()
+    num_units = scenario.count_units(run, run_stats.totals["tool_calls"])
+
+    # drop everything the caller would drop, but keep the strategy instance itself
+    del outputs, run_stats
+    gc.collect()
+    current_after, _ = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    objects_after = count_live_objects()
+
+    retained_objects = {
+        name: objects_after.get(name, 0) - objects_before.get(name, 0)
+        for name in TRACKED_TYPES
+        if objects_after.get(name, 0) > objects_before.get(name, 0)
+    }
+    peak_kb = (peak - current_before) / 1024
+    return MemoryResult(
+        name=scenario.name,
+        unit=scenario.unit,
+        num_units=num_units,
+        peak_kb=peak_kb,
+        peak_kb_per_unit=peak_kb / max(num_units, 1),
+        retained_kb=(current_after - current_before) / 1024,
+        retained_objects=retained_objects,
+        top_retained=_top_retained(snapshot_after, snapshot_before, top) if retained_objects else [],
+        flagged=bool(retained_objects),
+    )
+
+
+def _tot_scenario(name: str, depth: int, branching: int) -> MemoryScenario:
+    counter: Dict[str, float] = {}
+
+    def _create() -> StrategyRun:
+        counter["before"] = _tot_nodes_created()
+        return create_run("tot_dfs", "frozen_lake", depth=depth, branching=branching)
+
+    return MemoryScenario(
+        name=name,
+        create=_create,
+        unit="node",
+        # +1 for the root node
+        count_units=lambda run, tool_calls: _tot_nodes_created() - counter["before"] + 1,
+    )
+
+
+def default_scenarios() -> List[MemoryScenario]:
+    return [
+        _tot_scenario("tot_dfs/deep", depth=16, branching=1),
+        _tot_scenario("tot_dfs/wide", depth=2, branching=4),
+        MemoryScenario(
+            name="simple/deep",
+            create=lambda: create_run("simple", "frozen_lake", depth=32),
+            unit="step",
+            count_units=lambda run, tool_calls: tool_calls,
+        ),
+        MemoryScenario(
+            name="adapt/wide",
+            create=lambda: create_run("adapt", "frozen_lake", depth=4, num_subtasks=8),
+            unit="step",
+            count_units=lambda run, tool_calls: tool_calls,
+        ),
+        MemoryScenario(
+            name="reflexion/long",
+            create=lambda: create_run("reflexion", "frozen_lake", depth=4, num_iterations=8),
+            unit="reflection",
+            # the last model of a Reflexion run is the self-reflection one
+            count_units=lambda run, tool_calls: run.models[-1].num_calls,
+        ),
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    scenarios = {scenario.name: scenario for scenario in default_scenarios()}
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=list(scenarios), default=list(scenarios))
+    parser.add_argument("--top", type=int, default=5, help="Number of allocation sites to show for retained memory.")
+    parser.add_argument("--frames", type=int, default=1, help="Number of frames stored by tracemalloc.")
+    parser.add_argument("--output", help="Path to save results as JSON.")
+    parser.add_argument(
+        "--fail-on-retained", action="store_true", help="Exit with non-zero code if any run is flagged."
+    )
+    args = parser.parse_args(argv)
+
+    tracemalloc.start(args.frames)
+    results = [profile_scenario(scenarios[name], top=args.top) for name in args.scenarios]
+    tracemalloc.stop()
+
+    print(
+        f"{'scenario':<16} {'units':>7} {'unit':<10} {'peak KiB':>10} {'KiB/unit':>9} {'retained KiB':>12}  retained objects"
+    )
+    for r in results:
+        objects = ", ".join(f"{name}: +{count}" for name, count in r.retained_objects.items()) or "-"
+        print(
+            f"{r.name:<16} {r.num_units:>7.0f} {r.unit:<10} {r.peak_kb:>10.1f} {r.peak_kb_per_unit:>9.2f} "
+            f"{r.retained_kb:>12.1f}  {'[RETAINED] ' if r.flagged else ''}{objects}"
+        )
+        for site in r.top_retained:
+            print(f"    {site}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+    return 1 if args.fail_on_retained and any(r.flagged for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
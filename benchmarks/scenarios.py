@@ -0,0 +1,348 @@
+"""Offline benchmark scenarios: strategies from the library on bundled environments, driven by scripted models.
+
+Every scenario is fully deterministic: scripted models decide on the next reply based on the input messages
+(the number of tool results in the scratchpad), so the same run always makes the same LLM and tool calls.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from gymnasium.envs.toy_text.frozen_lake import FrozenLakeEnv
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool
+
+from environments.frozen_lake.common import FrozenLakeEnvWrapper
+from environments.game_of_24.environment import GameOf24Env
+from planning_library.action_executors import BaseActionExecutor, LangchainActionExecutor, MetaTools
+from planning_library.components.agent_component import AgentFactory
+from planning_library.strategies.adapt import ADaPTStrategy
+from planning_library.strategies.adapt.components import ADaPTExecutor, ADaPTPlanner
+from planning_library.strategies.reflexion import ReflexionStrategy
+from planning_library.strategies.reflexion.components import (
+    ReflexionActor,
+    ReflexionEvaluator,
+    ReflexionSelfReflection,
+)
+from planning_library.strategies.simple import SimpleStrategy
+from planning_library.strategies.tot_dfs import TreeOfThoughtsDFSStrategy
+from planning_library.strategies.tot_dfs.components import ThoughtEvaluatorConfig, ThoughtGeneratorConfig
+from planning_library.testing import ScriptedChatModel, tool_calls_message
+from planning_library.utils.gym_env_reset_tool import GymEnvResetTool
+
+ToolCall = Tuple[str, Dict[str, Any]]
+
+PARSER_NAME = "openai-tools"
+STRATEGIES = ("simple", "tot_dfs", "adapt", "reflexion")
+
+
+@dataclass
+class EnvironmentSpec:
+    """Describes how to create an environment and what a scripted agent does in it.
+
+    Args:
+        name: Environment name.
+        create_env: Creates a fresh environment.
+        reset_env: Resets a given environment to the initial state of a task.
+        inputs: Inputs of a task (variables of `user_message`).
+        user_message: User message for all prompts.
+        plan: Returns tool calls that the scripted agent makes before giving an answer, given the maximum depth.
+        answer: Final answer of the scripted agent.
+        max_depth: Maximum length of the plan (None means unlimited).
+    """
+
+    name: str
+    create_env: Callable[[], Any]
+    reset_env: Callable[[Any], None]
+    inputs: Dict[str, Any]
+    user_message: str
+    plan: Callable[[int], List[ToolCall]]
+    answer: str
+    max_depth: Optional[int] = None
+
+
+def _game_of_24_plan(depth: int) -> List[ToolCall]:
+    steps = [
+        ("multiply", {"number1": 1, "number2": 2}),
+        ("multiply", {"number1": 2, "number2": 3}),
+        ("multiply", {"number1": 6, "number2": 4}),
+    ]
+    return steps[:depth]
+
+
+def _frozen_lake_plan(depth: int) -> List[ToolCall]:
+    # walking back and forth along the top row never reaches the goal, so the plan can be arbitrarily long
+    return [("move", {"direction": "right" if i % 2 == 0 else "left"}) for i in range(depth)]
+
+
+GAME_OF_24 = EnvironmentSpec(
+    name="game_of_24",
+    create_env=GameOf24Env,
+    reset_env=lambda env: env.reset(options={"numbers": [1, 2, 3, 4]}),
+    inputs={"numbers": "1 2 3 4"},
+    user_message="Obtain 24 from the given numbers via basic arithmetic operations. Inputs: {numbers}",
+    plan=_game_of_24_plan,
+    answer="1 * 2 * 3 * 4 = 24",
+    max_depth=3,
+)
+
+FROZEN_LAKE = EnvironmentSpec(
+    name="frozen_lake",
+    create_env=lambda: FrozenLakeEnvWrapper(
+        FrozenLakeEnv(desc=["SFFF", "FFFF", "FFFF", "FFFG"], is_slippery=False)  # type: ignore[arg-type]
+    ),
+    reset_env=lambda env: env.reset(seed=0),
+    inputs={"board": "SFFF FFFF FFFF FFFG"},
+    user_message="Find a path from S to G on the board. Board: {board}",
+    plan=_frozen_lake_plan,
+    answer="I have reached the goal.",
+)
+
+ENVIRONMENTS = {spec.name: spec for spec in (GAME_OF_24, FROZEN_LAKE)}
+
+
+def _count_tool_results(messages: Sequence[BaseMessage]) -> int:
+    return sum(isinstance(message, ToolMessage) for message in messages)
+
+
+def _is_subtask(messages: Sequence[BaseMessage]) -> bool:
+    return any(isinstance(message, HumanMessage) and "Subtask" in str(message.content) for message in messages)
+
+
+def create_agent_model(
+    plan: List[ToolCall], answer: str, latency: float = 0.0, final_answer_suffix: str = ""
+) -> ScriptedChatModel:
+    """Creates a scripted agent: it follows the plan one tool call at a time and then gives the answer."""
+
+    def _respond(messages: List[BaseMessage]) -> AIMessage:
+        num_steps = _count_tool_results(messages)
+        if num_steps < len(plan):
+            return tool_calls_message(plan[num_steps])
+        return AIMessage(content=answer + final_answer_suffix)
+
+    return ScriptedChatModel(respond=_respond, latency=latency)
+
+
+@dataclass
+class StrategyRun:
+    """A single run of a strategy, ready to be invoked.
+
+    Args:
+        runnable: Strategy (or graph) to invoke.
+        inputs: Inputs for the runnable.
+        models: All scripted models used by the run (to count LLM calls).
+        config: Config for the runnable.
+    """
+
+    runnable: Runnable
+    inputs: Dict[str, Any]
+    models: List[ScriptedChatModel]
+    config: RunnableConfig = field(default_factory=lambda: RunnableConfig(recursion_limit=1000))
+
+    @property
+    def num_llm_calls(self) -> int:
+        return sum(model.num_calls for model in self.models)
+
+    def invoke(self) -> Any:
+        return self.runnable.invoke(self.inputs, self.config)
+
+    async def ainvoke(self) -> Any:
+        return await self.runnable.ainvoke(self.inputs, self.config)
+
+
+def _create_action_executor(env: Any) -> BaseActionExecutor:
+    # resets of the bundled toy environments are cheap, so they are run inline
+    return LangchainActionExecutor(env.tools, meta_tools=MetaTools(reset=GymEnvResetTool(env=env, offload=False)))
+
+
+def _tools(env: Any) -> Sequence[BaseTool]:
+    return env.tools
+
+
+def create_simple_run(env_spec: EnvironmentSpec, depth: int, latency: float = 0.0, **kwargs) -> StrategyRun:
+    """Simple strategy: the agent makes `depth` tool calls and finishes."""
+    env = env_spec.create_env()
+    env_spec.reset_env(env)
+
+    model = create_agent_model(env_spec.plan(depth), env_spec.answer, latency=latency)
+    prompt = ChatPromptTemplate.from_messages(
+        [("human", env_spec.user_message), MessagesPlaceholder("agent_scratchpad")]
+    )
+    agent = AgentFactory.create_agent(llm=model, tools=_tools(env), prompt=prompt, parser_name=PARSER_NAME)
+    strategy = SimpleStrategy.create(
+        agent=agent,
+        action_executor=_create_action_executor(env),
+        max_iterations=depth + 1,
+        verbose=False,
+    )
+    return StrategyRun(runnable=strategy, inputs=env_spec.inputs, models=[model])
+
+
+def tot_max_iterations(depth: int, branching: int) -> int:
+    """Number of DFS iterations needed to expand the full tree of a given depth and branching factor."""
+    return sum(branching**level for level in range(depth + 1))
+
+
+def create_tot_run(
+    env_spec: EnvironmentSpec, depth: int, latency: float = 0.0, branching: int = 2, num_votes: int = 1, **kwargs
+) -> StrategyRun:
+    """Tree of Thoughts + DFS: `branching` thoughts on each step, all of them accepted, leaves at `depth`.
+    With `num_votes` > 1, each thought is evaluated by a self-consistency vote."""
+    env = env_spec.create_env()
+    env_spec.reset_env(env)
+
+    generator_model = create_agent_model(env_spec.plan(depth), env_spec.answer, latency=latency)
+    evaluator_model = ScriptedChatModel(responses=["The step looks promising. [[1.0]]"], latency=latency)
+
+    strategy = TreeOfThoughtsDFSStrategy.create(
+        action_executor=_create_action_executor(env),
+        generator_config=ThoughtGeneratorConfig(
+            tools=_tools(env),
+            max_num_thoughts=branching,
+            llm=generator_model,
+            user_message=env_spec.user_message,
+            parser_name=PARSER_NAME,
+        ),
+        evaluator_config=ThoughtEvaluatorConfig(
+            value_threshold=0.5,
+            llm=evaluator_model,
+            user_message=env_spec.user_message,
+            parser_name=PARSER_NAME,
+            num_votes=num_votes,
+        ),
+        max_iterations=tot_max_iterations(depth, branching),
+        verbose=False,
+    )
+    return StrategyRun(runnable=strategy, inputs=env_spec.inputs, models=[generator_model, evaluator_model])
+
+
+def create_adapt_run(
+    env_spec: EnvironmentSpec, depth: int, latency: float = 0.0, num_subtasks: int = 2, **kwargs
+) -> StrategyRun:
+    """ADaPT: the executor fails on the original task, the planner splits it into `num_subtasks` subtasks
+    (AND logic), the executor completes each subtask with `depth` tool calls."""
+    env = env_spec.create_env()
+    env_spec.reset_env(env)
+    action_executor = _create_action_executor(env)
+    plan, answer = env_spec.plan(depth), env_spec.answer
+
+    def _respond_executor(messages: List[BaseMessage]) -> AIMessage:
+        num_steps = _count_tool_results(messages)
+        if num_steps < len(plan):
+            return tool_calls_message(plan[num_steps])
+        if _is_subtask(messages):
+            return AIMessage(content=f"{answer} Task completed.")
+        return AIMessage(content="The task is too complex to solve at once.")
+
+    planner_output = {
+        "subtasks": [{"task": f"Subtask {i + 1}"} for i in range(num_subtasks)],
+        "aggregation_mode": "and",
+    }
+    executor_model = ScriptedChatModel(respond=_respond_executor, latency=latency)
+    planner_model = ScriptedChatModel(
+        responses=[f"```json\n{json.dumps(planner_output)}\n```"],
+        latency=latency,
+    )
+
+    executor = ADaPTExecutor.create_simple_strategy(
+        llm=executor_model,
+        action_executor=action_executor,
+        user_message="{task}",
+        parser_name=PARSER_NAME,
+        return_intermediate_steps=True,
+        return_finish_log=True,
+        max_iterations=depth + 1,
+        verbose=False,
+    )
+    planner = ADaPTPlanner.create(
+        llm=planner_model,
+        # the planner receives the inputs of the current ADaPT step as a whole
+        user_message="Split the task into subtasks. Task: {inputs}",
+        executor_parser_name=PARSER_NAME,
+    )
+    strategy = ADaPTStrategy(
+        executor=executor,
+        planner=planner,
+        max_depth=1,
+        action_executor=action_executor,
+        verbose=False,
+    )  # type: ignore[call-arg]
+    return StrategyRun(
+        runnable=strategy,
+        inputs={"inputs": {"task": f"Solve the task. {env_spec.user_message.format(**env_spec.inputs)}"}},
+        models=[executor_model, planner_model],
+    )
+
+
+def create_reflexion_run(
+    env_spec: EnvironmentSpec, depth: int, latency: float = 0.0, num_iterations: int = 2, **kwargs
+) -> StrategyRun:
+    """Reflexion graph: the actor makes `depth` tool calls and answers, the evaluator always rejects the answer,
+    so the loop runs for exactly `num_iterations` iterations."""
+    env = env_spec.create_env()
+    env_spec.reset_env(env)
+
+    actor_model = create_agent_model(env_spec.plan(depth), env_spec.answer, latency=latency)
+    evaluator_model = ScriptedChatModel(responses=["The answer is incorrect. [[0.0]]"], latency=latency)
+    self_reflection_model = ScriptedChatModel(
+        responses=["I should double-check the intermediate results before answering."], latency=latency
+    )
+
+    graph = ReflexionStrategy.create_from_components(
+        actor=ReflexionActor.create(  # type: ignore[arg-type]
+            llm=actor_model, tools=_tools(env), user_message=env_spec.user_message, parser_name=PARSER_NAME
+        ),
+        evaluator=ReflexionEvaluator.create(
+            llm=evaluator_model, threshold=0.5, user_message=env_spec.user_message, parser_name=PARSER_NAME
+        ),
+        self_reflection=ReflexionSelfReflection.create(
+            llm=self_reflection_model,
+            user_message=env_spec.user_message,
+            parser_name=PARSER_NAME,
+        ),
+        action_executor=_create_action_executor(env),
+        max_iterations=num_iterations,
+        reset_environment=lambda inputs: env_spec.reset_env(env),
+    )
+    return StrategyRun(
+        runnable=graph,
+        inputs={"inputs": env_spec.inputs},
+        models=[actor_model, evaluator_model, self_reflection_model],
+    )
+
+
+RUN_FACTORIES: Dict[str, Callable[..., StrategyRun]] = {
+    "simple": create_simple_run,
+    "tot_dfs": create_tot_run,
+    "adapt": create_adapt_run,
+    "reflexion": create_reflexion_run,
+}
+
+
+def create_run(strategy: str, environment: str, depth: Optional[int] = None, **kwargs) -> StrategyRun:
+    """Creates a run of a given strategy on a given environment.
+
+    Args:
+        strategy: One of `STRATEGIES`.
+        environment: One of `ENVIRONMENTS`.
+        depth: Number of tool calls the scripted agent makes before answering. If None, the environment's
+          maximum depth (or 3) is used.
+        **kwargs: Strategy-specific options (`branching` and `num_votes` for ToT, `num_subtasks` for ADaPT,
+          `num_iterations` for Reflexion) and `latency` of scripted models.
+    """
+    if strategy not in RUN_FACTORIES:
+        raise ValueError(f"Unknown strategy {strategy}; expected one of {list(RUN_FACTORIES)}.")
+    if environment not in ENVIRONMENTS:
+        raise ValueError(f"Unknown environment {environment}; expected one of {list(ENVIRONMENTS)}.")
+
+    env_spec = ENVIRONMENTS[environment]
+    if depth is None:
+        depth = env_spec.max_depth if env_spec.max_depth is not None else 3
+    if env_spec.max_depth is not None and depth > env_spec.max_depth:
+        raise ValueError(f"Maximum depth for {environment} is {env_spec.max_depth}, got {depth}.")
+
+    return RUN_FACTORIES[strategy](env_spec, depth=depth, **kwargs)
@@ -0,0 +1,266 @@
+"""Measures the overhead of the library itself, separately from model latency.
+
+Strategies are driven by scripted models (see `benchmarks.scenarios`), so the benchmark runs offline and is
+deterministic: every run makes exactly the same LLM and tool calls. Three sections are reported:
+
+* overhead: time per LLM/tool call for each strategy and environment with zero simulated model latency;
+* scaling: how ToT+DFS and the simple strategy scale with depth and branching factor;
+* concurrency: speedup of concurrent async runs over sequential sync runs with simulated model latency.
+
+Usage:
+    python -m benchmarks.strategy_overhead --output results.json
+    python -m benchmarks.strategy_overhead --baseline results.json --tolerance 0.25
+
+When `--baseline` is given, the script exits with a non-zero code if the overhead per step of any scenario
+has grown by more than `--tolerance` relative to the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from planning_library.instrumentation import track_run_stats
+
+from .scenarios import ENVIRONMENTS, STRATEGIES, StrategyRun, create_run, tot_max_iterations
+
+SECTIONS = ("overhead", "scaling", "concurrency")
+
+
+@dataclass
+class OverheadResult:
+    """Timings for a single scenario.
+
+    Args:
+        name: Scenario name.
+        num_runs: Number of measured runs.
+        llm_calls: LLM calls per run.
+        tool_calls: Tool calls per run (including replays on resets).
+        median_ms: Median wall time of a run in milliseconds.
+        us_per_step: Median wall time per step (LLM or tool call) in microseconds.
+    """
+
+    name: str
+    num_runs: int
+    llm_calls: int
+    tool_calls: int
+    median_ms: float
+    us_per_step: float
+
+
+@dataclass
+class ConcurrencyResult:
+    """Timings for sequential sync runs vs concurrent async runs.
+
+    Args:
+        name: Scenario name.
+        num_runs: Number of runs.
+        latency_ms: Simulated latency of a single LLM call in milliseconds.
+        sequential_ms: Total wall time of sequential sync runs in milliseconds.
+        concurrent_ms: Total wall time of concurrent async runs in milliseconds.
+        speedup: `sequential_ms / concurrent_ms`.
+        efficiency: Speedup relative to the ideal one (`num_runs`).
+    """
+
+    name: str
+    num_runs: int
+    latency_ms: float
+    sequential_ms: float
+    concurrent_ms: float
+    speedup: float
+    efficiency: float
+
+
+def measure_overhead(
+    name: str, create: Callable[[], StrategyRun], num_runs: int, num_warmup: int = 1
+) -> OverheadResult:
+    """Runs a scenario `num_runs` times (after `num_warmup` unmeasured runs) and reports median timings.
+
+    Runs are created before the timer starts, so only the strategy execution is measured.
+    """
+    for _ in range(num_warmup):
+        create().invoke()
+
+    timings: List[float] = []
+    llm_calls, tool_calls = 0, 0
+    for _ in range(num_runs):
+        run = create()
+        gc.collect()
+        with track_run_stats() as run_stats:
+            start = time.perf_counter()
+            run.invoke()
+            timings.append(time.perf_counter() - start)
+        llm_calls, tool_calls = run.num_llm_calls, run_stats.totals["tool_calls"]
+
+    median = statistics.median(timings)
+    return OverheadResult(
+        name=name,
+        num_runs=num_runs,
+        llm_calls=llm_calls,
+        tool_calls=tool_calls,
+        median_ms=median * 1e3,
+        us_per_step=median * 1e6 / max(llm_calls + tool_calls, 1),
+    )
+
+
+def measure_concurrency(
+    name: str, create: Callable[[], StrategyRun], num_runs: int, latency: float
+) -> ConcurrencyResult:
+    """Compares `num_runs` sequential sync runs to the same number of concurrent async runs."""
+    runs = [create() for _ in range(num_runs)]
+    start = time.perf_counter()
+    for run in runs:
+        run.invoke()
+    sequential = time.perf_counter() - start
+
+    async def _run_concurrently(runs: Sequence[StrategyRun]) -> None:
+        await asyncio.gather(*(run.ainvoke() for run in runs))
+
+    runs = [create() for _ in range(num_runs)]
+    start = time.perf_counter()
+    asyncio.run(_run_concurrently(runs))
+    concurrent = time.perf_counter() - start
+
+    speedup = sequential / concurrent
+    return ConcurrencyResult(
+        name=name,
+        num_runs=num_runs,
+        latency_ms=latency * 1e3,
+        sequential_ms=sequential * 1e3,
+        concurrent_ms=concurrent * 1e3,
+        speedup=speedup,
+        efficiency=speedup / num_runs,
+    )
+
+
+def run_overhead(num_runs: int) -> List[OverheadResult]:
+    return [
+        measure_overhead(f"{strategy}/{environment}", lambda: create_run(strategy, environment), num_runs)
+        for strategy in STRATEGIES
+        for environment in ENVIRONMENTS
+    ]
+
+
+def run_scaling(num_runs: int, depths: Sequence[int], branchings: Sequence[int]) -> List[OverheadResult]:
+    results: List[OverheadResult] = []
+    for depth in depths:
+        results.append(
+            measure_overhead(
+                f"simple/frozen_lake/depth={depth}",
+                lambda: create_run("simple", "frozen_lake", depth=depth),
+                num_runs,
+            )
+        )
+    for depth in depths:
+        for branching in branchings:
+            # the full tree grows exponentially, keep the benchmark reasonably fast
+            if tot_max_iterations(depth, branching) > 40:
+                continue
+            results.append(
+                measure_overhead(
+                    f"tot_dfs/frozen_lake/depth={depth}/branching={branching}",
+                    lambda: create_run("tot_dfs", "frozen_lake", depth=depth, branching=branching),
+                    num_runs,
+                )
+            )
+    return results
+
+
+def run_concurrency(num_runs: int, latency: float) -> List[ConcurrencyResult]:
+    return [
+        measure_concurrency(
+            f"{strategy}/frozen_lake",
+            lambda: create_run(strategy, "frozen_lake", latency=latency),
+            num_runs=num_runs,
+            latency=latency,
+        )
+        for strategy in STRATEGIES
+    ]
+
+
+def _print_table(title: str, rows: Sequence[Any]) -> None:
+    if not rows:
+        return
+    columns = list(asdict(rows[0]))
+    values = [[f"{v:.2f}" if isinstance(v, float) else str(v) for v in asdict(row).values()] for row in rows]
+    widths = [max(len(column), *(len(row[i]) for row in values)) for i, column in enumerate(columns)]
+    print(f"\n== {title} ==")
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in values:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
+
+def find_regressions(
+    results: Dict[str, List[Dict[str, Any]]], baseline: Dict[str, List[Dict[str, Any]]], tolerance: float
+) -> List[str]:
+    """Returns descriptions of scenarios whose overhead per step has grown by more than `tolerance`."""
+    regressions: List[str] = []
+    for section in ("overhead", "scaling"):
+        baseline_rows = {row["name"]: row for row in baseline.get(section, [])}
+        for row in results.get(section, []):
+            baseline_row = baseline_rows.get(row["name"])
+            if baseline_row is None:
+                continue
+            ratio = row["us_per_step"] / baseline_row["us_per_step"]
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{row['name']}: {baseline_row['us_per_step']:.1f} -> {row['us_per_step']:.1f} us/step "
+                    f"(+{(ratio - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument("--runs", type=int, default=5, help="Number of measured runs per scenario.")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--branchings", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent runs.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated LLM latency for concurrency runs (s).")
+    parser.add_argument("--output", help="Path to save results as JSON.")
+    parser.add_argument("--baseline", help="Path to results of a previous run to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative growth of overhead per step.")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    if "overhead" in args.sections:
+        overhead = run_overhead(args.runs)
+        _print_table("Overhead per step (no model latency)", overhead)
+        results["overhead"] = [asdict(row) for row in overhead]
+    if "scaling" in args.sections:
+        scaling = run_scaling(args.runs, args.depths, args.branchings)
+        _print_table("Scaling with depth and branching factor", scaling)
+        results["scaling"] = [asdict(row) for row in scaling]
+    if "concurrency" in args.sections:
+        concurrency = run_concurrency(args.concurrency, args.latency)
+        _print_table("Async concurrency gains", concurrency)
+        results["concurrency"] = [asdict(row) for row in concurrency]
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print("\nPerformance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo performance regressions found.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence, SupportsFloat, Tuple
+from typing import Any, Dict, List, Optional, Sequence, SupportsFloat, Tuple
 
 import gymnasium as gym
 import yaml  # type: ignore[import-untyped]
 from langchain_core.agents import AgentAction
 from langchain_core.callbacks import CallbackManager
 from langchain_core.tools import BaseTool
+from textworld.envs.batch import AsyncBatchEnv  # type: ignore[import-untyped]
 from textworld.gym.envs.textworld_batch import TextworldBatchGymEnv  # type: ignore[import-untyped]
 
 import alfworld.agents.environment as environment  # type: ignore[import-untyped]
 from alfworld.agents.environment.alfred_tw_env import AlfredTWEnv  # type: ignore[import-untyped]
-from planning_library.action_executors import LangchainActionExecutor
+from planning_library.action_executors import LangchainActionExecutor, VectorizedActionExecutor
 
 from .tools import get_alfworld_tools
+from .tools_utils import BaseALFWorldTool
 
 
 class ALFWorldEnv(gym.Env[str, Tuple[AgentAction, Optional[CallbackManager]]]):
@@ -73,3 +75,103 @@ class ALFWorldEnv(gym.Env[str, Tuple[AgentAction, Optional[CallbackManager]]]):
                     )
                 )
         return observation, info
+
+
+class ALFWorldBatchEnv:
+    """A batch of independent ALFWorld games that are played at the same time.
+
+    Actions for all games are sent to TextWorld in a single vectorized step via `action_executor.execute_batch`.
+    When only some of the games have actions, just these games are stepped (one by one), so idle games
+    don't spend their step budget.
+    """
+
+    def __init__(self, config_path: str, batch_size: int):
+        with open(config_path) as reader:
+            config = yaml.safe_load(reader)
+        self._alfworld_env: AlfredTWEnv = getattr(environment, config["env"]["type"])(config, train_eval="train")
+        self.batch_size = batch_size
+        self.env: TextworldBatchGymEnv = self._alfworld_env.init_env(batch_size=batch_size)
+        self._tools = get_alfworld_tools(env=self.env)
+        self._name_to_tool = {tool.name: tool for tool in self._tools}
+        self._action_executor = VectorizedActionExecutor(
+            tools=self._tools,
+            convert_action=self._convert_action,
+            step_batch=self._step_batch,
+            batch_size=batch_size,
+            reset_batch=self._reset_batch,
+        )
+
+    @property
+    def tools(self) -> Sequence[BaseTool]:
+        return self._tools
+
+    @property
+    def action_executor(self) -> VectorizedActionExecutor:
+        return self._action_executor
+
+    def seed(self, seed: Optional[int] = None):
+        self.env.seed(seed)
+
+    def _convert_action(self, action: AgentAction) -> str:
+        tool = self._name_to_tool[action.tool]
+        assert isinstance(tool, BaseALFWorldTool) and tool.args_schema is not None
+        tool_input = action.tool_input if isinstance(action.tool_input, dict) else {}
+        return tool.get_command(**tool.args_schema.parse_obj(tool_input).dict())
+
+    def _step_batch(
+        self, commands: List[Optional[str]]
+    ) -> List[Optional[Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]]]:
+        if all(command is not None for command in commands):
+            obs, scores, dones, infos = self.env.step(commands)
+            return [
+                (obs[i], scores[i], dones[i], False, {key: infos[key][i] for key in infos})
+                for i in range(self.batch_size)
+            ]
+        return self._step_games(commands)
+
+    def _step_games(
+        self, commands: List[Optional[str]]
+    ) -> List[Optional[Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]]]:
+        """Steps only the games that have commands. TextWorld batch environments always step every game,
+        so their games are stepped directly (in parallel for asynchronous environments)."""
+        batch_env = self.env.batch_env
+        is_async = isinstance(batch_env, AsyncBatchEnv)
+        results: List[Optional[Tuple[str, SupportsFloat, bool, Dict[str, Any]]]] = [None] * self.batch_size
+        for i, command in enumerate(commands):
+            if command is None:
+                continue
+            if batch_env.last[i] is not None and batch_env.last[i][2]:
+                # the game has ended, TextWorld keeps returning its last state
+                results[i] = batch_env.last[i]
+            elif is_async:
+                batch_env.envs[i].call("step", command)
+            else:
+                results[i] = batch_env.envs[i].step(command)
+
+        for i, command in enumerate(commands):
+            if command is not None and results[i] is None:
+                results[i] = batch_env.envs[i].result()
+            if results[i] is not None:
+                batch_env.last[i] = results[i]
+
+        return [
+            (result[0], result[1], result[2], False, result[3]) if result is not None else None for result in results
+        ]
+
+    def _reset_batch(self, session_ids: Optional[List[int]]) -> None:
+        if session_ids is None or sorted(session_ids) == list(range(self.batch_size)):
+            self.env.reset()
+            return
+
+        # restarts the current games of the given sessions
+        batch_env = self.env.batch_env
+        for session_id in session_ids:
+            if isinstance(batch_env, AsyncBatchEnv):
+                batch_env.envs[session_id].call_sync("reset")
+            else:
+                batch_env.envs[session_id].reset()
+            batch_env.last[session_id] = None
+
+    def reset(self) -> Tuple[List[str], Dict[str, List[Any]]]:
+        """Starts the next batch of games."""
+        return self.env.reset()
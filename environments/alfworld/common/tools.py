@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, SupportsFloat, Tuple, Type
+from typing import Any, List, Type
 
 from langchain.pydantic_v1 import BaseModel
 from langchain.tools import BaseTool
@@ -35,15 +35,14 @@ class GoToTool(BaseALFWorldTool, BaseTool):
     description = """Go to the specified receptable (static object)."""
     args_schema: Type[BaseModel] = ReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         receptable_type: str,
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step([f"go to {receptable_type} {receptable_id}"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"go to {receptable_type} {receptable_id}"
 
 
 class OpenTool(BaseALFWorldTool, BaseTool):
@@ -51,15 +50,14 @@ class OpenTool(BaseALFWorldTool, BaseTool):
     description = """Open a specified receptable (static object). Only works when you're near a receptable and when it is closed."""
     args_schema: Type[BaseModel] = ReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         receptable_type: str,
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step([f"open {receptable_type} {receptable_id}"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"open {receptable_type} {receptable_id}"
 
 
 class CloseTool(BaseALFWorldTool, BaseTool):
@@ -67,15 +65,14 @@ class CloseTool(BaseALFWorldTool, BaseTool):
     description = """Close a specified receptable (static object). Only available when you're near a receptable and when it is closed."""
     args_schema: Type[BaseModel] = ReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         receptable_type: str,
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step([f"close {receptable_type} {receptable_id}"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"close {receptable_type} {receptable_id}"
 
 
 class TakeTool(BaseALFWorldTool, BaseTool):
@@ -83,7 +80,7 @@ class TakeTool(BaseALFWorldTool, BaseTool):
     description = """Pick up the specified portable object from the specified receptable (static object). Only works when you're near the specified receptable and the specified object is present in/on the receptable."""
     args_schema: Type[BaseModel] = ObjectAndReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         object_type: str,
         object_id: int,
@@ -91,11 +88,8 @@ class TakeTool(BaseALFWorldTool, BaseTool):
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(
-            [f"take {object_type} {object_id} from {receptable_type} {receptable_id}"]
-        )
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"take {object_type} {object_id} from {receptable_type} {receptable_id}"
 
 
 class PutTool(BaseALFWorldTool, BaseTool):
@@ -103,7 +97,7 @@ class PutTool(BaseALFWorldTool, BaseTool):
     description = """Put the specified portable object in/on the specified receptable (static object). Only available when you're near the specified receptable and carry the specified portable object in your inventory."""
     args_schema: Type[BaseModel] = ObjectAndReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         object_type: str,
         object_id: int,
@@ -111,11 +105,8 @@ class PutTool(BaseALFWorldTool, BaseTool):
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(
-            [f"put {object_type} {object_id} in/on {receptable_type} {receptable_id}"]
-        )
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"put {object_type} {object_id} in/on {receptable_type} {receptable_id}"
 
 
 class ToggleTool(BaseALFWorldTool, BaseTool):
@@ -123,15 +114,14 @@ class ToggleTool(BaseALFWorldTool, BaseTool):
     description = """Toggle the specified object on/off (can be either a portable object or a static receptable). Only available when you're near the specified receptable/portable object or carry the specified portable object."""
     args_schema: Type[BaseModel] = ObjectOrReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         type: str,
         id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step([f"toggle {type} {id}"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"toggle {type} {id}"
 
 
 class HeatTool(BaseALFWorldTool, BaseTool):
@@ -139,7 +129,7 @@ class HeatTool(BaseALFWorldTool, BaseTool):
     description = """Heat the portable object via the receptable (static object). Only available when you're already near the receptable and the portable object is in/on the receptable."""
     args_schema: Type[BaseModel] = ObjectAndReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         object_type: str,
         object_id: int,
@@ -147,11 +137,8 @@ class HeatTool(BaseALFWorldTool, BaseTool):
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(
-            [f"heat {object_type} {object_id} with {receptable_type} {receptable_id}"]
-        )
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"heat {object_type} {object_id} with {receptable_type} {receptable_id}"
 
 
 class CoolTool(BaseALFWorldTool, BaseTool):
@@ -159,7 +146,7 @@ class CoolTool(BaseALFWorldTool, BaseTool):
     description = """Cool the portable object via the receptable (static object). Only available when you're already near a receptable and the portable object is in/on the receptable."""
     args_schema: Type[BaseModel] = ObjectAndReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         object_type: str,
         object_id: int,
@@ -167,11 +154,8 @@ class CoolTool(BaseALFWorldTool, BaseTool):
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(
-            [f"cool {object_type} {object_id} with {receptable_type} {receptable_id}"]
-        )
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"cool {object_type} {object_id} with {receptable_type} {receptable_id}"
 
 
 class CleanTool(BaseALFWorldTool, BaseTool):
@@ -179,7 +163,7 @@ class CleanTool(BaseALFWorldTool, BaseTool):
     description = """Clean the portable object via the receptable (static object). Only available when you're already near a receptable and the portable object is in/on the receptable."""
     args_schema: Type[BaseModel] = ObjectAndReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         object_type: str,
         object_id: int,
@@ -187,11 +171,8 @@ class CleanTool(BaseALFWorldTool, BaseTool):
         receptable_id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(
-            [f"clean {object_type} {object_id} with {receptable_type} {receptable_id}"]
-        )
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"clean {object_type} {object_id} with {receptable_type} {receptable_id}"
 
 
 class ExamineTool(BaseALFWorldTool, BaseTool):
@@ -199,15 +180,14 @@ class ExamineTool(BaseALFWorldTool, BaseTool):
     description = """Examine the specified object (can be either a portable object or a static receptable). Only available when you're near the receptable/portable object or carry the specified portable object."""
     args_schema: Type[BaseModel] = ObjectOrReceptableInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         type: str,
         id: int,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step([f"examine {type} {id}"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return f"examine {type} {id}"
 
 
 class InventoryTool(BaseALFWorldTool, BaseTool):
@@ -215,13 +195,12 @@ class InventoryTool(BaseALFWorldTool, BaseTool):
     description = """Check if you are carrying any portable objects."""
     args_schema: Type[BaseModel] = EmptyInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(["inventory"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return "inventory"
 
 
 class LookTool(BaseALFWorldTool, BaseTool):
@@ -229,10 +208,9 @@ class LookTool(BaseALFWorldTool, BaseTool):
     description = """Check your surroundings."""
     args_schema: Type[BaseModel] = EmptyInput  # type: ignore
 
-    def _run(
+    def get_command(
         self,
         *args: Any,
         **kwargs: Any,
-    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
-        obs, scores, dones, infos = self.env.step(["look"])
-        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+    ) -> str:
+        return "look"
@@ -1,7 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, SupportsFloat, Tuple
+
 from langchain.pydantic_v1 import BaseModel, Field
 from langchain.tools import BaseTool
 from textworld.gym.envs.textworld_batch import TextworldBatchGymEnv  # type: ignore[import-untyped]
 
+from planning_library.utils import arun_in_env_worker
+
 
 class EmptyInput(BaseModel): ...
 
@@ -57,7 +62,7 @@ class ObjectOrReceptableInput(BaseModel):
     )
 
 
-class BaseALFWorldTool(BaseModel):
+class BaseALFWorldTool(BaseModel, ABC):
     """Base tool for an ALFWorld environment.
 
     Environment is present as a field, but it won't be shown to models."""
@@ -66,3 +71,24 @@ class BaseALFWorldTool(BaseModel):
 
     class Config(BaseTool.Config):
         pass
+
+    @abstractmethod
+    def get_command(self, *args: Any, **kwargs: Any) -> str:
+        """Returns a text command for ALFWorld corresponding to the given tool input."""
+        ...
+
+    def _run(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
+        obs, scores, dones, infos = self.env.step([self.get_command(*args, **kwargs)])
+        return obs[0], scores[0], dones[0], False, {key: infos[key][0] for key in infos}
+
+    async def _arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
+        # TextWorld steps are heavy: run them in a dedicated thread of the environment to keep the event loop free
+        return await arun_in_env_worker(self.env, self._run, *args, **kwargs)
@@ -1,5 +1,6 @@
 from .environment import FrozenLakeEnvWrapper
 from .evaluate_output_parser import FrozenMapEvaluateOutputParser
+from .heuristics import FrozenLakeHeuristics
 from .tools import CheckMapTool, CheckPositionTool, MoveTool
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "CheckPositionTool",
     "FrozenLakeEnvWrapper",
     "FrozenMapEvaluateOutputParser",
+    "FrozenLakeHeuristics",
 ]
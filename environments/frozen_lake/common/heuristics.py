@@ -0,0 +1,106 @@
+"""Cheap rule-based evaluators for FrozenLake, meant as the first stages of cascade evaluators.
+
+Each method returns a value in a 0-1 range when the verdict is certain and None otherwise,
+so that the LLM evaluator is only called for uncertain cases.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import gymnasium as gym
+from langchain_core.agents import AgentAction, AgentFinish
+
+_DIRECTIONS = {"left": (0, -1), "down": (1, 0), "right": (0, 1), "up": (-1, 0)}
+
+
+class FrozenLakeHeuristics:
+    """Rule-based evaluators for a given FrozenLake board.
+
+    Positions are taken from observations of the `move` tool in the trajectory (so they are correct
+    on slippery ice too), moves are judged by their intended destination.
+
+    Args:
+        board: Rows of the board, e.g., `["SFFF", "FHFH", "FFFH", "HFFG"]`.
+    """
+
+    def __init__(self, board: Sequence[str]):
+        self.board = [str(row) for row in board]
+
+    @classmethod
+    def from_env(cls, env: gym.Env) -> FrozenLakeHeuristics:
+        return cls(board=["".join(cell.decode() for cell in row) for row in env.get_wrapper_attr("desc")])
+
+    def _cell(self, position: Tuple[int, int]) -> str:
+        row, col = position
+        return self.board[row][col]
+
+    def _start(self) -> Tuple[int, int]:
+        for row, cells in enumerate(self.board):
+            col = cells.find("S")
+            if col != -1:
+                return row, col
+        return 0, 0
+
+    def _position(self, intermediate_steps: List[Tuple[AgentAction, Any]]) -> Tuple[int, int]:
+        """Returns the current position (row, column) based on the last observation of the `move` tool."""
+        for action, observation in reversed(intermediate_steps):
+            if action.tool == "move" and isinstance(observation, tuple) and isinstance(observation[0], tuple):
+                # MoveTool reports positions as (column, row)
+                col, row = observation[0]
+                return row, col
+        return self._start()
+
+    def _move(self, position: Tuple[int, int], action: AgentAction) -> Optional[Tuple[int, int]]:
+        direction = action.tool_input.get("direction") if isinstance(action.tool_input, dict) else action.tool_input
+        if direction not in _DIRECTIONS:
+            return None
+        d_row, d_col = _DIRECTIONS[direction]
+        row = min(max(position[0] + d_row, 0), len(self.board) - 1)
+        col = min(max(position[1] + d_col, 0), len(self.board[0]) - 1)
+        return row, col
+
+    def evaluate_thought(self, inputs: Dict[str, Any]) -> Optional[float]:
+        """Evaluates the next thought of Tree of Thoughts (`ThoughtEvaluatorInput`).
+
+        * 0.0 when the thought moves into a known hole, moves after the episode has ended
+          or finishes without reaching the goal;
+        * 1.0 when the thought moves to the goal or finishes after reaching it;
+        * None otherwise.
+        """
+        position = self._position(inputs["intermediate_steps"])
+
+        next_thought = inputs["next_thought"]
+        if isinstance(next_thought, AgentFinish):
+            return 1.0 if self._cell(position) == "G" else 0.0
+
+        if self._cell(position) in ("H", "G"):
+            return 0.0
+
+        for action in next_thought if isinstance(next_thought, list) else [next_thought]:
+            if action.tool != "move":
+                continue
+            new_position = self._move(position, action)
+            if new_position is None:
+                return None
+            position = new_position
+            if self._cell(position) == "H":
+                return 0.0
+            if self._cell(position) == "G":
+                return 1.0
+        return None
+
+    def evaluate_episode(self, inputs: Dict[str, Any]) -> Optional[float]:
+        """Evaluates a finished episode of Reflexion (`ReflexionEvaluatorInput`).
+
+        * 1.0 when the episode ended with a reward (the goal has been reached);
+        * 0.0 when the episode ended without a reward (the player has fallen into a hole);
+        * None otherwise.
+        """
+        for action, observation in reversed(inputs["intermediate_steps"]):
+            if action.tool == "move" and isinstance(observation, tuple) and len(observation) == 5:
+                _, reward, terminated, _, _ = observation
+                if float(reward) > 0:
+                    return 1.0
+                return 0.0 if terminated else None
+        return None
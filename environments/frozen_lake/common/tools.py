@@ -16,6 +16,10 @@ class BaseFrozenLakeTool(BaseModel):
     class Config(BaseTool.Config):
         pass
 
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        # FrozenLake steps are cheap: run them inline instead of offloading to a thread
+        return self._run(*args, **kwargs)  # type: ignore[attr-defined]
+
 
 class MoveInput(BaseModel):
     direction: Literal["left", "right", "down", "up"] = Field(description="Which direction to move.")
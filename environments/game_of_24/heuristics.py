@@ -0,0 +1,148 @@
+"""Cheap rule-based evaluators for Game of 24, meant as the first stages of cascade evaluators.
+
+Each function returns a value in a 0-1 range when the verdict is certain and None otherwise,
+so that the LLM evaluator is only called for uncertain cases.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.agents import AgentAction, AgentFinish
+
+TARGET = 24.0
+
+_OPERATIONS = {
+    "add": lambda a, b: a + b,
+    "subtract": lambda a, b: a - b,
+    "multiply": lambda a, b: a * b,
+    "divide": lambda a, b: a / b,
+}
+
+
+def _is_close(a: float, b: float) -> bool:
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+
+
+@lru_cache(maxsize=4096)
+def _is_solvable(numbers: Tuple[float, ...], target: float) -> bool:
+    if len(numbers) == 1:
+        return _is_close(numbers[0], target)
+
+    for i in range(len(numbers)):
+        for j in range(len(numbers)):
+            if i == j:
+                continue
+            a, b = numbers[i], numbers[j]
+            rest = [numbers[k] for k in range(len(numbers)) if k not in (i, j)]
+            results = [a + b, a - b, a * b]
+            if b != 0:
+                results.append(a / b)
+            for result in results:
+                if _is_solvable(tuple(sorted(rest + [result])), target):
+                    return True
+    return False
+
+
+def is_solvable(numbers: Sequence[float], target: float = TARGET) -> bool:
+    """Checks whether `target` can be obtained from all given numbers via basic arithmetic operations."""
+    return _is_solvable(tuple(sorted(float(number) for number in numbers)), target)
+
+
+def parse_numbers(numbers: str | Sequence[float]) -> List[float]:
+    """Parses numbers given as a whitespace-separated string (as in environment observations and task inputs)."""
+    if isinstance(numbers, str):
+        return [float(number) for number in numbers.split()]
+    return [float(number) for number in numbers]
+
+
+def apply_action(numbers: List[float], action: AgentAction) -> Optional[List[float]]:
+    """Applies a tool call to given numbers the same way the environment does.
+
+    Returns:
+        Remaining numbers or None if the action is not valid (unknown tool, unavailable arguments, division by zero).
+    """
+    operation = _OPERATIONS.get(action.tool)
+    if operation is None or not isinstance(action.tool_input, dict):
+        return None
+
+    try:
+        number1, number2 = float(action.tool_input["number1"]), float(action.tool_input["number2"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    remaining = list(numbers)
+    for number in (number1, number2):
+        if number not in remaining:
+            return None
+        remaining.remove(number)
+
+    try:
+        result = operation(number1, number2)
+    except ZeroDivisionError:
+        return None
+    return remaining + [result]
+
+
+def _replay(numbers: List[float], actions: Iterable[AgentAction]) -> List[float]:
+    # invalid actions don't change the state of the environment
+    for action in actions:
+        new_numbers = apply_action(numbers, action)
+        if new_numbers is not None:
+            numbers = new_numbers
+    return numbers
+
+
+def _get_numbers(inputs: Dict[str, Any], numbers_key: str) -> List[float]:
+    return parse_numbers(inputs["inputs"][numbers_key])
+
+
+def evaluate_thought(
+    inputs: Dict[str, Any], numbers_key: str = "numbers", solvable_value: Optional[float] = None
+) -> Optional[float]:
+    """Evaluates the next thought of Tree of Thoughts (`ThoughtEvaluatorInput`).
+
+    * 0.0 when the thought contains an invalid action, leaves numbers from which 24 can't be obtained
+      or finishes without obtaining 24;
+    * 1.0 when the thought obtains 24 or finishes after it has been obtained;
+    * `solvable_value` (None by default, i.e., the decision is deferred) when 24 can still be obtained.
+
+    Args:
+        inputs: Evaluator inputs.
+        numbers_key: Key of the initial numbers in the task inputs.
+        solvable_value: Value for thoughts after which 24 can still be obtained.
+    """
+    numbers = _replay(_get_numbers(inputs, numbers_key), (action for action, _ in inputs["intermediate_steps"]))
+
+    next_thought = inputs["next_thought"]
+    if isinstance(next_thought, AgentFinish):
+        return 1.0 if len(numbers) == 1 and _is_close(numbers[0], TARGET) else 0.0
+
+    for action in next_thought if isinstance(next_thought, list) else [next_thought]:
+        new_numbers = apply_action(numbers, action)
+        if new_numbers is None:
+            return 0.0
+        numbers = new_numbers
+
+    if len(numbers) == 1:
+        return 1.0 if _is_close(numbers[0], TARGET) else 0.0
+    return solvable_value if is_solvable(numbers) else 0.0
+
+
+def evaluate_episode(inputs: Dict[str, Any], numbers_key: str = "numbers") -> Optional[float]:
+    """Evaluates a finished episode of Reflexion (`ReflexionEvaluatorInput`).
+
+    * 1.0 when 24 has been obtained;
+    * 0.0 when 24 can't be obtained from the remaining numbers anymore;
+    * None otherwise (e.g., the answer has been given without using the tools).
+
+    Args:
+        inputs: Evaluator inputs.
+        numbers_key: Key of the initial numbers in the task inputs.
+    """
+    numbers = _replay(_get_numbers(inputs, numbers_key), (action for action, _ in inputs["intermediate_steps"]))
+    if len(numbers) == 1 and _is_close(numbers[0], TARGET):
+        return 1.0
+    return None if is_solvable(numbers) else 0.0
@@ -54,6 +54,16 @@ class BaseGameof24Tool(BaseModel, ABC):
 
         return observation, reward, terminated, truncated, info
 
+    async def _arun(
+        self,
+        number1: int,
+        number2: int,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[str, SupportsFloat, bool, bool, Dict[str, Any]]:
+        # Game of 24 steps are cheap: run them inline instead of offloading to a thread
+        return self._run(number1, number2, *args, **kwargs)
+
 
 class CalculatorInput(BaseModel):
     number1: float = Field(description="The first argument in an arithmetical operation.")
@@ -1,5 +1,30 @@
-from .base_action_executor import BaseActionExecutor
-from .default_action_executor import LangchainActionExecutor
-from .meta_tools import MetaTools
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseActionExecutor", "LangchainActionExecutor", "MetaTools"]
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_action_executor import BaseActionExecutor
+    from .default_action_executor import LangchainActionExecutor
+    from .meta_tools import MetaTools
+    from .process_action_executor import ProcessActionExecutor
+    from .vectorized_action_executor import VectorizedActionExecutor
+
+__all__ = [
+    "BaseActionExecutor",
+    "LangchainActionExecutor",
+    "MetaTools",
+    "ProcessActionExecutor",
+    "VectorizedActionExecutor",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseActionExecutor": ".base_action_executor",
+        "LangchainActionExecutor": ".default_action_executor",
+        "MetaTools": ".meta_tools",
+        "ProcessActionExecutor": ".process_action_executor",
+        "VectorizedActionExecutor": ".vectorized_action_executor",
+    },
+)
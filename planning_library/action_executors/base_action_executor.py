@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Sequence, overload
+from typing import Any, List, Optional, Sequence, Union, overload
 
 from langchain_core.agents import AgentAction, AgentStep
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
@@ -104,3 +104,66 @@ class BaseActionExecutor(ABC):
               * AgentStep - for single-action thoughts (AgentAction)
         """
         ...
+
+    def _check_single_session(self, actions: Sequence[Any]) -> None:
+        if len(actions) > 1:
+            raise NotImplementedError(
+                f"{type(self).__name__} doesn't manage independent sessions, so it can't execute actions "
+                f"for {len(actions)} sessions; use an executor with several sessions (e.g., VectorizedActionExecutor)."
+            )
+
+    def execute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[Union[List[AgentStep], AgentStep]]]:
+        """Performs actions for a batch of independent sessions.
+
+        The default implementation only supports a single session (executed via `execute`): the executor has
+        a single environment, so several sessions would share it. Executors that manage several sessions (e.g.,
+        backed by vectorized environments) override it.
+
+        Args:
+            actions: Currently proposed actions for each session: i-th element corresponds to i-th session.
+              Each element can be: multi-action, single action or None (the session is not stepped).
+
+        Returns:
+            List where i-th element contains the results for i-th session:
+              * List[AgentStep] - for multi-action thoughts (List[AgentAction])
+              * AgentStep - for single-action thoughts (AgentAction)
+              * None - for sessions without actions
+        """
+        self._check_single_session(actions)
+        return [
+            self.execute(cur_actions, run_manager=run_manager, **kwargs) if cur_actions is not None else None
+            for cur_actions in actions
+        ]
+
+    async def aexecute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[Union[List[AgentStep], AgentStep]]]:
+        """Performs actions for a batch of independent sessions asynchronously.
+
+        The default implementation only supports a single session (executed via `aexecute`): the executor has
+        a single environment, so several sessions would share it. Executors that manage several sessions (e.g.,
+        backed by vectorized environments) override it.
+
+        Args:
+            actions: Currently proposed actions for each session: i-th element corresponds to i-th session.
+              Each element can be: multi-action, single action or None (the session is not stepped).
+
+        Returns:
+            List where i-th element contains the results for i-th session:
+              * List[AgentStep] - for multi-action thoughts (List[AgentAction])
+              * AgentStep - for single-action thoughts (AgentAction)
+              * None - for sessions without actions
+        """
+        self._check_single_session(actions)
+        return [
+            await self.aexecute(cur_actions, run_manager=run_manager, **kwargs) if cur_actions is not None else None
+            for cur_actions in actions
+        ]
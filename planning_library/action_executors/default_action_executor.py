@@ -1,24 +1,206 @@
 from __future__ import annotations
 
-from typing import List, Optional, Sequence, overload
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from dataclasses import dataclass
+from inspect import signature
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union, overload
 
 from langchain_core.agents import AgentAction, AgentStep
 from langchain_core.callbacks import (
     AsyncCallbackManager,
     CallbackManager,
 )
-from langchain_core.tools import BaseTool
-from langgraph.prebuilt.tool_executor import ToolExecutor  # type: ignore[import-untyped]
+from langchain_core.pydantic_v1 import BaseModel, ValidationError, validate_model
+from langchain_core.tools import BaseTool, ToolException
 
+from ..instrumentation import record_tool_calls
+from ..instrumentation.metrics import RESET_REPLAY_LENGTH, TOOL_CALL_DURATION, TOOL_CALL_TIMEOUTS
 from .base_action_executor import BaseActionExecutor
 from .meta_tools import MetaTools
 
+if TYPE_CHECKING:
+    from langgraph.prebuilt.tool_executor import ToolExecutor  # type: ignore[import-untyped]
+
+TIMEOUT_MSG_TEMPLATE = "Tool `{tool_name}` timed out after {timeout} seconds."
+
+
+class _ToolTimeout(Exception):
+    """Raised when a tool call exceeds its timeout. Unlike `TimeoutError`, it can't come from the tool itself."""
+
+
+def _call_with_timeout(func: Callable[[], Any], timeout: Optional[float]) -> Any:
+    """Calls `func` in a separate daemon thread and waits for at most `timeout` seconds.
+
+    Note that Python threads can't be forcibly stopped: on timeout, the thread is abandoned and
+    keeps running in the background until the tool returns.
+
+    Raises:
+        _ToolTimeout: If the call didn't finish in time.
+    """
+    if timeout is None:
+        return func()
+
+    outcome: Dict[str, Any] = {}
+
+    def _target() -> None:
+        try:
+            outcome["result"] = func()
+        except BaseException as e:
+            outcome["error"] = e
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(_target,), daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    if thread.is_alive():
+        raise _ToolTimeout
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def _await_with_timeout(awaitable: Awaitable[Any], timeout: Optional[float]) -> Any:
+    """Awaits `awaitable` for at most `timeout` seconds; on timeout, the tool coroutine is cancelled.
+
+    Raises:
+        _ToolTimeout: If the call didn't finish in time.
+    """
+    if timeout is None:
+        return await awaitable
+
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if not done:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+        raise _ToolTimeout
+    return task.result()
+
+
+@dataclass
+class _FastTool:
+    """Precomputed information for calling a tool directly, without callbacks and runnable machinery."""
+
+    tool: BaseTool
+    args_schema: Optional[Type[BaseModel]]
+    field_names: Tuple[str, ...]
+    run_manager_supported: bool
+    arun_manager_supported: bool
+
+    @classmethod
+    def from_tool(cls, tool: BaseTool) -> Optional[_FastTool]:
+        """Returns None if the tool customizes the calling logic and, consequently, can't be called directly."""
+        tool_cls = type(tool)
+        for method in ("invoke", "ainvoke", "run", "arun", "_parse_input", "_to_args_and_kwargs"):
+            if getattr(tool_cls, method) is not getattr(BaseTool, method):
+                return None
+        return cls(
+            tool=tool,
+            args_schema=tool.args_schema,
+            field_names=tuple(tool.args_schema.__fields__) if tool.args_schema is not None else (),
+            run_manager_supported=signature(tool._run).parameters.get("run_manager") is not None,
+            arun_manager_supported=signature(tool._arun).parameters.get("run_manager") is not None,
+        )
+
+    def parse_input(self, tool_input: Union[str, Dict[str, Any]]) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Validates the input against the args schema (without building the model object) and
+        converts it to args and kwargs, the same way as BaseTool does."""
+        if isinstance(tool_input, str) or self.args_schema is None:
+            return self.tool._to_args_and_kwargs(self.tool._parse_input(tool_input))
+        values, _, error = validate_model(self.args_schema, tool_input)
+        if error:
+            raise error
+        return (), {name: values[name] for name in self.field_names if name in tool_input}
+
+    def handle_error(self, e: Exception) -> Any:
+        """Converts input validation error or tool exception into an observation, the same way as BaseTool does."""
+        handler: Any
+        if isinstance(e, ValidationError):
+            handler, default_observation = self.tool.handle_validation_error, "Tool input validation error"
+        else:
+            handler, default_observation = self.tool.handle_tool_error, "Tool execution error"
+            if isinstance(handler, bool) and handler and e.args:
+                return e.args[0]
+
+        if not handler:
+            raise e
+        if isinstance(handler, bool):
+            return default_observation
+        if isinstance(handler, str):
+            return handler
+        return handler(e)
+
+    def run(self, tool_input: Union[str, Dict[str, Any]]) -> Any:
+        try:
+            args, kwargs = self.parse_input(tool_input)
+            if self.run_manager_supported:
+                kwargs["run_manager"] = None
+            return self.tool._run(*args, **kwargs)
+        except (ValidationError, ToolException) as e:
+            return self.handle_error(e)
+
+    async def arun(self, tool_input: Union[str, Dict[str, Any]]) -> Any:
+        try:
+            args, kwargs = self.parse_input(tool_input)
+            if self.arun_manager_supported:
+                kwargs["run_manager"] = None
+            return await self.tool._arun(*args, **kwargs)
+        except (ValidationError, ToolException) as e:
+            return self.handle_error(e)
+
 
 class LangchainActionExecutor(BaseActionExecutor):
-    def __init__(self, tools: Sequence[BaseTool], meta_tools: Optional[MetaTools] = None):
+    """Default action executor that runs LangChain tools.
+
+    Args:
+        tools: The valid tools the agent can call.
+        meta_tools: Auxiliary tools that are not exposed to the agent (e.g., reset tool).
+        timeout: Default timeout for a single tool call (in seconds). If None, tool calls are not limited in time.
+          Note that a sync tool that timed out keeps running in a background thread, so it can still change
+          the state of the environment while the next actions (or reset) are executed. Use timeouts
+          for tools without side effects or with environments that tolerate this (e.g., each call works
+          on its own copy of the state); async tools are cancelled on timeout.
+        tool_timeouts: Mapping from tool names to timeouts (in seconds) that override the default one.
+        fast_path: If True, tools are called directly when no callback handlers would receive the events
+          (no handlers in run manager and tool itself, verbose, debug and tracing are off). This skips
+          the callbacks and runnable machinery and validates inputs without building pydantic models.
+          If False, tools are always called via ToolExecutor.
+    """
+
+    timeout_msg_template: str = TIMEOUT_MSG_TEMPLATE
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        meta_tools: Optional[MetaTools] = None,
+        timeout: Optional[float] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+        fast_path: bool = True,
+    ):
+        # langgraph is fairly heavy to import, so it's only imported once an executor is created
+        from langgraph.prebuilt.tool_executor import ToolExecutor  # type: ignore[import-untyped]
+
         self._tool_executor = ToolExecutor(tools)
         self._meta_tool_executor = ToolExecutor(meta_tools.tools) if meta_tools else None
+        self._fast_path = fast_path
+        self._fast_tools: Dict[int, Dict[str, Optional[_FastTool]]] = {
+            id(tool_executor): {tool.name: _FastTool.from_tool(tool) for tool in tool_executor.tools}
+            for tool_executor in (self._tool_executor, self._meta_tool_executor)
+            if tool_executor is not None
+        }
         self._meta_tool_names = meta_tools.tool_names_map if meta_tools else {}
+        self._timeout = timeout
+        self._tool_timeouts = tool_timeouts if tool_timeouts is not None else {}
 
     @property
     def tools(self) -> Sequence[BaseTool]:
@@ -30,6 +212,43 @@ class LangchainActionExecutor(BaseActionExecutor):
             return self._meta_tool_names["reset"]
         return None
 
+    def _get_timeout(self, tool_name: str, timeout: Optional[float] = None) -> Optional[float]:
+        """Returns the timeout for a given tool: explicitly passed one takes precedence over per-tool one,
+        and per-tool one takes precedence over the default one."""
+        if timeout is not None:
+            return timeout
+        return self._tool_timeouts.get(tool_name, self._timeout)
+
+    def _timeout_observation(self, action: AgentAction, timeout: float) -> str:
+        return self.timeout_msg_template.format(tool_name=action.tool, timeout=timeout)
+
+    def _get_fast_tool(
+        self,
+        action: AgentAction,
+        tool_executor: ToolExecutor,
+        run_manager: Optional[Union[CallbackManager, AsyncCallbackManager]] = None,
+    ) -> Optional[_FastTool]:
+        """Returns the tool to call directly or None if the call has to go through ToolExecutor
+        (e.g., there are callback handlers that should receive the events or the tool is not valid)."""
+        if not self._fast_path:
+            return None
+        fast_tool = self._fast_tools[id(tool_executor)].get(action.tool)
+        if fast_tool is None:
+            return None
+        # resolves the handlers the same way as BaseTool does (including the ones from verbose, debug and tracing)
+        callback_manager = CallbackManager.configure(
+            run_manager,  # type: ignore[arg-type]
+            fast_tool.tool.callbacks,
+            fast_tool.tool.verbose,
+            None,
+            fast_tool.tool.tags,
+            None,
+            fast_tool.tool.metadata,
+        )
+        if callback_manager.handlers or callback_manager.inheritable_handlers:
+            return None
+        return fast_tool
+
     def reset(
         self,
         actions: Optional[List[AgentAction]] = None,
@@ -38,6 +257,7 @@ class LangchainActionExecutor(BaseActionExecutor):
     ) -> None:
         """Resets the current state. If actions are passed, will also execute them."""
         if self.reset_tool_name is not None:
+            RESET_REPLAY_LENGTH.observe(len(actions) if actions else 0)
             self._execute(
                 actions=[
                     AgentAction(
@@ -50,7 +270,7 @@ class LangchainActionExecutor(BaseActionExecutor):
                 run_manager=run_manager,
             )
             if actions:
-                self.execute(actions, run_manager=run_manager)
+                self.execute(actions, run_manager=run_manager, **kwargs)
 
     @overload
     def execute(
@@ -74,29 +294,60 @@ class LangchainActionExecutor(BaseActionExecutor):
         run_manager: Optional[CallbackManager] = None,
         **kwargs,
     ) -> List[AgentStep] | AgentStep:
-        return self._execute(actions, self._tool_executor, run_manager)
+        """Performs actions.
+
+        Args:
+            actions: Currently proposed actions. Can be: multi-action, single action.
+            run_manager: Callback for the current run.
+            timeout: (optional) Timeout for each tool call (in seconds), overrides both default and per-tool timeouts.
+        """
+        return self._execute(actions, self._tool_executor, run_manager, **kwargs)
 
     def _execute(
         self,
         actions: List[AgentAction] | AgentAction,
         tool_executor: ToolExecutor,
         run_manager: Optional[CallbackManager] = None,
+        timeout: Optional[float] = None,
         **kwargs,
     ) -> List[AgentStep] | AgentStep:
         if isinstance(actions, list):
             steps = []
             for action in actions:
                 assert isinstance(action, AgentAction)
-                observation = self.execute(action, run_manager=run_manager)
-                steps.append(AgentStep(action=action, observation=observation))
+                steps.append(self._execute_action(action, tool_executor, run_manager=run_manager, timeout=timeout))
             return steps
 
         assert isinstance(actions, AgentAction)
-        observation = tool_executor.invoke(
-            actions,
-            config={"callbacks": run_manager} if run_manager else {},
-        )
-        return AgentStep(action=actions, observation=observation)
+        return self._execute_action(actions, tool_executor, run_manager=run_manager, timeout=timeout)
+
+    def _execute_action(
+        self,
+        action: AgentAction,
+        tool_executor: ToolExecutor,
+        run_manager: Optional[CallbackManager] = None,
+        timeout: Optional[float] = None,
+    ) -> AgentStep:
+        record_tool_calls()
+        cur_timeout = self._get_timeout(action.tool, timeout)
+        fast_tool = self._get_fast_tool(action, tool_executor, run_manager)
+        start = time.perf_counter()
+        try:
+            observation = _call_with_timeout(
+                (lambda: fast_tool.run(action.tool_input))  # type: ignore[union-attr]
+                if fast_tool is not None
+                else lambda: tool_executor.invoke(
+                    action,
+                    config={"callbacks": run_manager} if run_manager else {},
+                ),
+                timeout=cur_timeout,
+            )
+        except _ToolTimeout:
+            assert cur_timeout is not None
+            TOOL_CALL_TIMEOUTS.labels(action.tool).inc()
+            observation = self._timeout_observation(action, cur_timeout)
+        TOOL_CALL_DURATION.labels(action.tool).observe(time.perf_counter() - start)
+        return AgentStep(action=action, observation=observation)
 
     async def areset(
         self,
@@ -106,6 +357,7 @@ class LangchainActionExecutor(BaseActionExecutor):
     ) -> None:
         """Resets the current state. If actions are passed, will also execute them."""
         if self.reset_tool_name is not None:
+            RESET_REPLAY_LENGTH.observe(len(actions) if actions else 0)
             await self._aexecute(
                 actions=[
                     AgentAction(
@@ -118,7 +370,7 @@ class LangchainActionExecutor(BaseActionExecutor):
                 run_manager=run_manager,
             )
             if actions:
-                await self.aexecute(actions, run_manager=run_manager)
+                await self.aexecute(actions, run_manager=run_manager, **kwargs)
 
     @overload
     async def aexecute(
@@ -142,27 +394,59 @@ class LangchainActionExecutor(BaseActionExecutor):
         run_manager: Optional[AsyncCallbackManager] = None,
         **kwargs,
     ) -> List[AgentStep] | AgentStep:
-        return await self._aexecute(actions, self._tool_executor, run_manager)
+        """Performs actions asynchronously.
+
+        Args:
+            actions: Currently proposed actions. Can be: multi-action, single action.
+            run_manager: Callback for the current run.
+            timeout: (optional) Timeout for each tool call (in seconds), overrides both default and per-tool timeouts.
+        """
+        return await self._aexecute(actions, self._tool_executor, run_manager, **kwargs)
 
     async def _aexecute(
         self,
         actions: List[AgentAction] | AgentAction,
         tool_executor: ToolExecutor,
         run_manager: Optional[AsyncCallbackManager] = None,
+        timeout: Optional[float] = None,
         **kwargs,
     ) -> List[AgentStep] | AgentStep:
         if isinstance(actions, list):
             steps = []
             for action in actions:
-                observation = await tool_executor.ainvoke(
-                    action,
-                    config={"callbacks": run_manager} if run_manager else {},
+                assert isinstance(action, AgentAction)
+                steps.append(
+                    await self._aexecute_action(action, tool_executor, run_manager=run_manager, timeout=timeout)
                 )
-                steps.append(AgentStep(action=action, observation=observation))
             return steps
+
         assert isinstance(actions, AgentAction)
-        observation = await tool_executor.ainvoke(
-            actions,
-            config={"callbacks": run_manager} if run_manager else {},
-        )
-        return AgentStep(action=actions, observation=observation)
+        return await self._aexecute_action(actions, tool_executor, run_manager=run_manager, timeout=timeout)
+
+    async def _aexecute_action(
+        self,
+        action: AgentAction,
+        tool_executor: ToolExecutor,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        timeout: Optional[float] = None,
+    ) -> AgentStep:
+        record_tool_calls()
+        cur_timeout = self._get_timeout(action.tool, timeout)
+        fast_tool = self._get_fast_tool(action, tool_executor, run_manager)
+        start = time.perf_counter()
+        try:
+            observation = await _await_with_timeout(
+                fast_tool.arun(action.tool_input)
+                if fast_tool is not None
+                else tool_executor.ainvoke(
+                    action,
+                    config={"callbacks": run_manager} if run_manager else {},
+                ),
+                timeout=cur_timeout,
+            )
+        except _ToolTimeout:
+            assert cur_timeout is not None
+            TOOL_CALL_TIMEOUTS.labels(action.tool).inc()
+            observation = self._timeout_observation(action, cur_timeout)
+        TOOL_CALL_DURATION.labels(action.tool).observe(time.perf_counter() - start)
+        return AgentStep(action=action, observation=observation)
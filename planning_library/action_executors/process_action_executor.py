@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import pickle
+import threading
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, overload
+
+from langchain_core.agents import AgentAction, AgentStep
+from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
+from langchain_core.pydantic_v1 import BaseModel, Field, create_model
+from langchain_core.tools import BaseTool
+
+from ..instrumentation import record_tool_calls
+from .base_action_executor import BaseActionExecutor
+
+ToolSpec = Tuple[str, str, Optional[Type[BaseModel]], Optional[Dict[str, Any]]]
+
+
+def _get_tool_spec(tool: BaseTool) -> ToolSpec:
+    """Returns tool name, description and either args schema (when it can be pickled) or its JSON schema."""
+    if tool.args_schema is None:
+        return tool.name, tool.description, None, None
+    try:
+        pickle.dumps(tool.args_schema)
+        return tool.name, tool.description, tool.args_schema, None
+    except Exception:
+        # e.g., schemas created on the fly by `@tool` decorator
+        return tool.name, tool.description, None, tool.args_schema.schema()
+
+
+def _create_args_schema(name: str, json_schema: Dict[str, Any]) -> Type[BaseModel]:
+    """Creates a model that accepts any arguments and reports the given JSON schema."""
+    fields: Dict[str, Any] = {
+        field: (Any, ... if field in json_schema.get("required", []) else None)
+        for field in json_schema.get("properties", {})
+    }
+    model = create_model(f"{name}Schema", **fields)  # type: ignore[call-overload]
+    model.schema = classmethod(lambda cls, *args, **kwargs: json_schema)  # type: ignore[method-assign, assignment]
+    return model
+
+
+def _pack_error(e: BaseException) -> BaseException:
+    """Makes sure that the exception can be sent to the parent process."""
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return RuntimeError("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+
+
+def _serve(conn: Connection, executor_factory: Callable[[], BaseActionExecutor]) -> None:
+    """Main loop of a worker process: creates an action executor and executes the requests from the parent."""
+    try:
+        executor = executor_factory()
+        conn.send(("ok", [_get_tool_spec(tool) for tool in executor.tools]))
+    except BaseException as e:
+        conn.send(("error", _pack_error(e)))
+        return
+
+    while True:
+        try:
+            method, args, kwargs = conn.recv()
+        except EOFError:
+            break
+
+        if method is None:
+            conn.send(("ok", None))
+            break
+
+        try:
+            result = getattr(executor, method)(*args, **kwargs)
+        except BaseException as e:
+            conn.send(("error", _pack_error(e)))
+            continue
+
+        try:
+            conn.send(("ok", result))
+        except Exception as e:
+            # results are pickled before anything is sent, so the pipe is still usable
+            conn.send(("error", _pack_error(RuntimeError(f"Couldn't send the result of `{method}`: {e!r}"))))
+
+    conn.close()
+
+
+class _ProxyTool(BaseTool):
+    """Tool that mirrors the name and the schema of a tool hosted in a worker process."""
+
+    action_executor: Any = Field(exclude=True)
+
+    class Config(BaseTool.Config):
+        pass
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        step = self.action_executor.execute(AgentAction(tool=self.name, tool_input=kwargs, log=""))
+        return step.observation
+
+
+class ProcessActionExecutor(BaseActionExecutor):
+    """Action executor that hosts an environment in a separate worker process.
+
+    The worker process creates its own action executor (and, consequently, its own environment) via
+    `executor_factory`. The current process only holds a lightweight proxy: calls to `execute`, `reset`
+    and any other method of the hosted executor (see `call_method`) are forwarded over a pipe.
+
+    Note:
+        * `executor_factory` has to be picklable (e.g., a top-level function or a `functools.partial` of one);
+        * actions and observations have to be picklable;
+        * callbacks are not propagated to the worker process.
+
+    Args:
+        executor_factory: Callable that creates an action executor inside the worker process.
+        start_method: Multiprocessing start method (`spawn`, `fork` or `forkserver`). If None, the default one is used.
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[], BaseActionExecutor],
+        start_method: Optional[str] = None,
+    ):
+        context = multiprocessing.get_context(start_method)
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child_conn, executor_factory), daemon=True)  # type: ignore[attr-defined]
+        self._process.start()
+        child_conn.close()
+        self._lock = threading.Lock()
+
+        tool_specs: List[ToolSpec] = self._receive()
+        self._tools: List[BaseTool] = [
+            _ProxyTool(
+                name=name,
+                description=description,
+                args_schema=args_schema
+                if args_schema is not None or json_schema is None
+                else _create_args_schema(name, json_schema),
+                action_executor=self,
+            )  # type: ignore[call-arg]
+            for name, description, args_schema, json_schema in tool_specs
+        ]
+
+    def _receive(self) -> Any:
+        status, result = self._conn.recv()
+        if status == "error":
+            raise result
+        return result
+
+    def call_method(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Calls a method of the action executor hosted in the worker process and returns its result."""
+        if not self._process.is_alive():
+            raise RuntimeError("Worker process of ProcessActionExecutor is not running.")
+
+        with self._lock:
+            try:
+                self._conn.send((method, args, kwargs))
+                return self._receive()
+            except (EOFError, OSError) as e:
+                raise RuntimeError(
+                    f"Worker process of ProcessActionExecutor has died while calling `{method}` "
+                    f"(exit code: {self._process.exitcode})."
+                ) from e
+
+    async def acall_method(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Calls a method of the action executor hosted in the worker process asynchronously and returns its result.
+
+        The pipe is waited on in a thread, so the event loop is not blocked while the worker is busy.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.call_method(method, *args, **kwargs))
+
+    def close(self) -> None:
+        """Stops the worker process."""
+        if self._process.is_alive():
+            with self._lock:
+                try:
+                    self._conn.send((None, (), {}))
+                    self._conn.recv()
+                except (EOFError, OSError):
+                    pass
+            self._process.join()
+        self._conn.close()
+
+    def __enter__(self) -> ProcessActionExecutor:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def tools(self) -> Sequence[BaseTool]:
+        return self._tools
+
+    def reset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> None:
+        """Resets the current state. If actions are passed, will also execute them."""
+        self.call_method("reset", actions=actions, **kwargs)
+
+    async def areset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> None:
+        """Resets the current state. If actions are passed, will also execute them."""
+        await self.acall_method("reset", actions=actions, **kwargs)
+
+    @overload
+    def execute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    def execute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    def execute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        # tool calls are made in the worker process, so they are counted here
+        record_tool_calls(len(actions) if isinstance(actions, list) else 1)
+        return self.call_method("execute", actions, **kwargs)
+
+    @overload
+    async def aexecute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    async def aexecute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    async def aexecute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        # tool calls are made in the worker process, so they are counted here
+        record_tool_calls(len(actions) if isinstance(actions, list) else 1)
+        return await self.acall_method("execute", actions, **kwargs)
+
+    def execute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[List[AgentStep] | AgentStep]]:
+        return self.call_method("execute_batch", list(actions), **kwargs)
+
+    async def aexecute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[List[AgentStep] | AgentStep]]:
+        return await self.acall_method("execute_batch", list(actions), **kwargs)
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Union, overload
+
+from langchain_core.agents import AgentAction, AgentStep
+from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
+from langchain_core.tools import BaseTool
+
+from .base_action_executor import BaseActionExecutor
+
+if TYPE_CHECKING:
+    import gymnasium as gym
+
+INVALID_TOOL_MSG_TEMPLATE = "{requested_tool_name} is not a valid tool, try one of [{available_tool_names_str}]."
+
+
+class VectorizedActionExecutor(BaseActionExecutor):
+    """Action executor for a batch of independent sessions backed by a single vectorized environment.
+
+    Instead of calling tools one by one, it converts actions from all sessions into environment actions
+    and issues one vectorized environment step per round. Multi-action thoughts take several rounds;
+    sessions that have no action in the current round receive None and must not be stepped (masked step).
+
+    `execute` and `reset` accept `session_id`, and `session(session_id)` returns an executor bound
+    to a single session, so it can also be passed to strategies that don't use `execute_batch`.
+
+    Args:
+        tools: The valid tools the agent can call. They are only used for their names and schemas.
+        convert_action: Converts an agent action into an environment action.
+        step_batch: Performs one vectorized step. Accepts a list of environment actions
+          (one per session, None for idle sessions) and returns a list of observations
+          (one per session; observations of idle sessions are ignored).
+        batch_size: Number of independent sessions.
+        reset_batch: Resets the environment. Accepts a list of sessions to reset (None means all sessions).
+          If None, reset is a no-op.
+    """
+
+    invalid_tool_msg_template: str = INVALID_TOOL_MSG_TEMPLATE
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        convert_action: Callable[[AgentAction], Any],
+        step_batch: Callable[[List[Optional[Any]]], Sequence[Any]],
+        batch_size: int,
+        reset_batch: Optional[Callable[[Optional[List[int]]], None]] = None,
+    ):
+        self._tools = tools
+        self._tool_names = {tool.name for tool in tools}
+        self._convert_action = convert_action
+        self._step_batch = step_batch
+        self._reset_batch = reset_batch
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_gym_vector_env(
+        cls,
+        env: gym.vector.VectorEnv,
+        tools: Sequence[BaseTool],
+        convert_action: Callable[[AgentAction], Any],
+    ) -> "VectorizedActionExecutor":
+        """Creates an action executor over gymnasium vector environment.
+
+        Observations follow the format of the single-environment tools: (observation, reward, terminated, truncated, info).
+
+        Note:
+            gymnasium vector environments step and reset all sub-environments at once. When only some of
+            the sessions are stepped or reset, sub-environments of `SyncVectorEnv` are stepped (reset) directly;
+            other vector environments (e.g., `AsyncVectorEnv`) don't support it and raise an error.
+            Sub-environments stepped directly are not reset automatically once their episodes end.
+        """
+
+        def _sub_envs(what: str) -> List[gym.Env]:
+            sub_envs = getattr(env, "envs", None)
+            if sub_envs is None:
+                raise ValueError(
+                    f"{type(env).__name__} can only {what} all sessions at once; use SyncVectorEnv to {what} "
+                    "some of them."
+                )
+            return sub_envs
+
+        def _step_batch(env_actions: List[Optional[Any]]) -> List[Any]:
+            if all(env_action is not None for env_action in env_actions):
+                observations, rewards, terminated, truncated, infos = env.step(env_actions)
+                return [
+                    (
+                        observations[i],
+                        rewards[i],
+                        terminated[i],
+                        truncated[i],
+                        {key: value[i] for key, value in infos.items() if not key.startswith("_")},
+                    )
+                    for i in range(env.num_envs)
+                ]
+
+            sub_envs = _sub_envs("step")
+            return [
+                sub_envs[i].step(env_action) if env_action is not None else None
+                for i, env_action in enumerate(env_actions)
+            ]
+
+        def _reset_batch(session_ids: Optional[List[int]]) -> None:
+            if session_ids is None or sorted(session_ids) == list(range(env.num_envs)):
+                env.reset()
+                return
+
+            sub_envs = _sub_envs("reset")
+            for session_id in session_ids:
+                sub_envs[session_id].reset()
+
+        return cls(
+            tools=tools,
+            convert_action=convert_action,
+            step_batch=_step_batch,
+            batch_size=env.num_envs,
+            reset_batch=_reset_batch,
+        )
+
+    @property
+    def tools(self) -> Sequence[BaseTool]:
+        return self._tools
+
+    def session(self, session_id: int) -> BaseActionExecutor:
+        """Returns an action executor bound to a single session, e.g., to run a separate strategy in each session."""
+        if not 0 <= session_id < self.batch_size:
+            raise ValueError(f"Expected session id in [0, {self.batch_size}), got {session_id}.")
+        return _SessionActionExecutor(self, session_id)
+
+    def _invalid_tool_observation(self, action: AgentAction) -> str:
+        return self.invalid_tool_msg_template.format(
+            requested_tool_name=action.tool,
+            available_tool_names_str=", ".join([tool.name for tool in self._tools]),
+        )
+
+    def _run_batch(
+        self,
+        actions: Sequence[Optional[Union[List[AgentAction], AgentAction]]],
+    ) -> List[Optional[Union[List[AgentStep], AgentStep]]]:
+        if len(actions) > self.batch_size:
+            raise ValueError(f"Expected actions for at most {self.batch_size} sessions, got {len(actions)}.")
+
+        # sessions beyond the given actions are idle
+        per_session: List[List[AgentAction]] = [
+            [] if cur_actions is None else cur_actions if isinstance(cur_actions, list) else [cur_actions]
+            for cur_actions in actions
+        ] + [[] for _ in range(self.batch_size - len(actions))]
+        steps: List[List[AgentStep]] = [[] for _ in per_session]
+
+        num_rounds = max((len(cur_actions) for cur_actions in per_session), default=0)
+        for cur_round in range(num_rounds):
+            env_actions: List[Optional[Any]] = [None] * self.batch_size
+            invalid: Dict[int, str] = {}
+            for session_id, cur_actions in enumerate(per_session):
+                if cur_round >= len(cur_actions):
+                    continue
+                action = cur_actions[cur_round]
+                if action.tool not in self._tool_names:
+                    invalid[session_id] = self._invalid_tool_observation(action)
+                else:
+                    env_actions[session_id] = self._convert_action(action)
+
+            # rounds with invalid tools only don't step the environment
+            observations = (
+                self._step_batch(env_actions)
+                if any(env_action is not None for env_action in env_actions)
+                else [None] * self.batch_size
+            )
+
+            for session_id, cur_actions in enumerate(per_session):
+                if cur_round >= len(cur_actions):
+                    continue
+                observation = invalid[session_id] if session_id in invalid else observations[session_id]
+                steps[session_id].append(AgentStep(action=cur_actions[cur_round], observation=observation))
+
+        results: List[Optional[Union[List[AgentStep], AgentStep]]] = []
+        for session_actions, cur_steps in zip(actions, steps):
+            if session_actions is None:
+                results.append(None)
+            elif isinstance(session_actions, list):
+                results.append(cur_steps)
+            else:
+                results.append(cur_steps[0])
+        return results
+
+    def execute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[Union[List[AgentStep], AgentStep]]]:
+        """Performs actions for all sessions with one vectorized environment step per round.
+        Sessions without actions (None or beyond the given list) are not stepped."""
+        return self._run_batch(actions)
+
+    async def aexecute_batch(
+        self,
+        actions: Sequence[Optional[List[AgentAction] | AgentAction]],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[Optional[Union[List[AgentStep], AgentStep]]]:
+        """Performs actions for all sessions with one vectorized environment step per round asynchronously.
+        Sessions without actions (None or beyond the given list) are not stepped."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._run_batch, list(actions))
+
+    def _session_actions(
+        self, actions: List[AgentAction] | AgentAction, session_id: int
+    ) -> List[Optional[Union[List[AgentAction], AgentAction]]]:
+        batch_actions: List[Optional[Union[List[AgentAction], AgentAction]]] = [None] * self.batch_size
+        batch_actions[session_id] = actions
+        return batch_actions
+
+    @overload
+    def execute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    def execute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    def execute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        session_id: int = 0,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        """Performs actions for a single session (the first one by default)."""
+        result = self._run_batch(self._session_actions(actions, session_id))[session_id]
+        assert result is not None
+        return result
+
+    @overload
+    async def aexecute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    async def aexecute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    async def aexecute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        session_id: int = 0,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        """Performs actions for a single session (the first one by default) asynchronously."""
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, self._run_batch, self._session_actions(actions, session_id))
+        result = results[session_id]
+        assert result is not None
+        return result
+
+    def reset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[CallbackManager] = None,
+        session_id: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """Resets the given session (all sessions by default). If actions are passed, will also execute them."""
+        if self._reset_batch is not None:
+            self._reset_batch(None if session_id is None else [session_id])
+        if actions:
+            self.execute(actions, session_id=session_id if session_id is not None else 0)
+
+    async def areset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        session_id: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """Resets the given session (all sessions by default). If actions are passed, will also execute them."""
+        if self._reset_batch is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._reset_batch, None if session_id is None else [session_id])
+        if actions:
+            await self.aexecute(actions, session_id=session_id if session_id is not None else 0)
+
+
+class _SessionActionExecutor(BaseActionExecutor):
+    """A view of a single session of VectorizedActionExecutor."""
+
+    def __init__(self, action_executor: VectorizedActionExecutor, session_id: int):
+        self._action_executor = action_executor
+        self._session_id = session_id
+
+    @property
+    def tools(self) -> Sequence[BaseTool]:
+        return self._action_executor.tools
+
+    @overload
+    def execute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    def execute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    def execute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        return self._action_executor.execute(actions, run_manager, session_id=self._session_id, **kwargs)
+
+    @overload
+    async def aexecute(
+        self,
+        actions: List[AgentAction],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep]: ...
+
+    @overload
+    async def aexecute(
+        self,
+        actions: AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> AgentStep: ...
+
+    async def aexecute(
+        self,
+        actions: List[AgentAction] | AgentAction,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[AgentStep] | AgentStep:
+        return await self._action_executor.aexecute(actions, run_manager, session_id=self._session_id, **kwargs)
+
+    def reset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[CallbackManager] = None,
+        **kwargs,
+    ) -> None:
+        self._action_executor.reset(actions, run_manager, session_id=self._session_id, **kwargs)
+
+    async def areset(
+        self,
+        actions: Optional[List[AgentAction]] = None,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> None:
+        await self._action_executor.areset(actions, run_manager, session_id=self._session_id, **kwargs)
@@ -1,9 +1,27 @@
-from .agent_component import AgentComponent
-from .base_component import BaseComponent
-from .runnable_component import RunnableComponent
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent_component import AgentComponent
+    from .base_component import BaseComponent
+    from .caching import CachedComponent
+    from .runnable_component import RunnableComponent
 
 __all__ = [
     "BaseComponent",
     "RunnableComponent",
     "AgentComponent",
+    "CachedComponent",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentComponent": ".agent_component",
+        "BaseComponent": ".base_component",
+        "CachedComponent": ".caching",
+        "RunnableComponent": ".runnable_component",
+    },
+)
@@ -19,7 +19,9 @@ from planning_library.utils import (
     convert_runnable_to_agent,
 )
 
+from ..instrumentation.metrics import COMPONENT_INVOCATIONS
 from .base_component import BaseComponent, InputType
+from .preprocessing import PreprocessingPipeline
 
 
 class AgentFactory:
@@ -35,26 +37,63 @@ class AgentFactory:
             ]
         ] = None,
         parser_name: Optional[str] = None,
+        format_inputs: bool = True,
     ) -> Union[RunnableAgent, RunnableMultiActionAgent]:
-        if parser is None:
-            if parser_name is None:
-                raise ValueError("Either parser or parser_name should be provided to instantiate an agent.")
-            parser = ParserRegistry.get_parser(parser_name)
+        """Creates an agent: `parser.format_inputs | prompt | llm with tools | parser.output_parser`.
 
+        Args:
+            format_inputs: If False, the agent expects inputs already formatted by `parser.format_inputs`.
+        """
+        parser = AgentFactory.get_parser(parser=parser, parser_name=parser_name)
         llm_with_tools = parser.prepare_llm(llm=llm, tools=tools)
 
-        runnable: Runnable = RunnableLambda(parser.format_inputs) | prompt | llm_with_tools | parser.output_parser
+        runnable: Runnable = prompt | llm_with_tools | parser.output_parser
+        if format_inputs:
+            runnable = RunnableLambda(parser.format_inputs) | runnable
         agent = convert_runnable_to_agent(runnable)
         return agent
 
+    @staticmethod
+    def get_parser(
+        parser: Optional[Union[BaseFunctionCallingSingleActionParser, BaseFunctionCallingMultiActionParser]] = None,
+        parser_name: Optional[str] = None,
+    ) -> Union[BaseFunctionCallingSingleActionParser, BaseFunctionCallingMultiActionParser]:
+        if parser is None:
+            if parser_name is None:
+                raise ValueError("Either parser or parser_name should be provided to instantiate an agent.")
+            parser = ParserRegistry.get_parser(parser_name)
+        return parser
+
 
 class AgentComponent(BaseComponent[InputType, Union[List[AgentAction], AgentAction, AgentFinish]]):
+    """Component powered by an agent.
+
+    For runnable-based agents, input and output preprocessing steps are fused into a single step before
+    and after the agent's runnable (see `PreprocessingPipeline`). Preprocessing is not supported for other agents.
+
+    Args:
+        agent: The agent to call.
+        flatten_inputs: If True, keys from `inputs` are moved to the top level of the agent inputs.
+        trace_preprocessing: If False, preprocessing steps don't start runs of their own,
+          so callback handlers (e.g., tracers) only see the agent's runnable itself.
+        format_inputs: Function that formats inputs right before they are passed to the agent's runnable
+          (e.g., `format_inputs` of a function calling parser for agents created without it).
+    """
+
     def __init__(
         self,
         agent: BaseSingleActionAgent | BaseMultiActionAgent,
         flatten_inputs: bool = True,
+        trace_preprocessing: bool = True,
+        format_inputs: Optional[Callable[[Dict], Dict]] = None,
     ):
         self.agent = agent
+        self._base_runnable: Optional[Runnable] = getattr(agent, "runnable", None)
+        self._input_preprocessing = PreprocessingPipeline()
+        self._output_preprocessing = PreprocessingPipeline()
+        self._trace_preprocessing = trace_preprocessing
+        if format_inputs is not None:
+            self.add_input_preprocessing(format_inputs)  # type: ignore[arg-type]
         if flatten_inputs:
             self.add_input_preprocessing(
                 lambda x: {
@@ -63,13 +102,27 @@ class AgentComponent(BaseComponent[InputType, Union[List[AgentAction], AgentActi
                 }
             )
 
+    def _build_runnable(self) -> None:
+        if self._base_runnable is None:
+            return
+        runnable = self._base_runnable
+        if self._input_preprocessing:
+            runnable = (
+                self._input_preprocessing.as_runnable("preprocess_inputs", trace=self._trace_preprocessing) | runnable
+            )
+        if self._output_preprocessing:
+            runnable = runnable | self._output_preprocessing.as_runnable(
+                "preprocess_outputs", trace=self._trace_preprocessing
+            )
+        self.agent.runnable = runnable  # type: ignore[union-attr]
+
     def add_input_preprocessing(
         self,
         preprocess: Callable[[InputType], Dict],
         apreprocess: Optional[Callable[[InputType], Awaitable[Dict]]] = None,
     ) -> None:
-        if hasattr(self.agent, "runnable"):
-            self.agent.runnable = RunnableLambda(preprocess, afunc=apreprocess) | self.agent.runnable  # type: ignore[reportAttributeAccessIssue]
+        self._input_preprocessing.prepend(preprocess, apreprocess)
+        self._build_runnable()
 
     def add_output_preprocessing(
         self,
@@ -84,14 +137,15 @@ class AgentComponent(BaseComponent[InputType, Union[List[AgentAction], AgentActi
             ]
         ] = None,
     ) -> None:
-        if hasattr(self.agent, "runnable"):
-            self.agent.runnable = self.agent.runnable | RunnableLambda(preprocess, afunc=apreprocess)  # type: ignore[reportAttributeAccessIssue]
+        self._output_preprocessing.append(preprocess, apreprocess)
+        self._build_runnable()
 
     def invoke(
         self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs
     ) -> Union[List[AgentAction], AgentAction, AgentFinish]:
         # TODO: no way to pass name to plan?
         # TODO: intermediate_steps?
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc()
         return self.agent.plan(**inputs, callbacks=run_manager)  # type: ignore[reportCallIssue]
 
     async def ainvoke(
@@ -101,9 +155,39 @@ class AgentComponent(BaseComponent[InputType, Union[List[AgentAction], AgentActi
         **kwargs,
     ) -> Union[List[AgentAction], AgentAction, AgentFinish]:
         # TODO: no way to pass name to plan?
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc()
         outputs = await self.agent.aplan(**inputs, callbacks=run_manager)  # type: ignore[reportCallIssue]
         return outputs
 
+    def batch(
+        self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs
+    ) -> List[Union[List[AgentAction], AgentAction, AgentFinish]]:
+        """Passes a list of inputs through the agent's runnable in a single `batch` call.
+        Agents that are not runnable-based process inputs one by one."""
+        if not isinstance(self.agent, (RunnableAgent, RunnableMultiActionAgent)):
+            return super().batch(inputs, run_manager, **kwargs)
+        if not inputs:
+            return []
+
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc(len(inputs))
+        return self.agent.runnable.batch(inputs, config={"callbacks": run_manager})  # type: ignore[arg-type, return-value]
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[Union[List[AgentAction], AgentAction, AgentFinish]]:
+        """Passes a list of inputs through the agent's runnable in a single `abatch` call.
+        Agents that are not runnable-based process inputs concurrently."""
+        if not isinstance(self.agent, (RunnableAgent, RunnableMultiActionAgent)):
+            return await super().abatch(inputs, run_manager, **kwargs)
+        if not inputs:
+            return []
+
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc(len(inputs))
+        return await self.agent.runnable.abatch(inputs, config={"callbacks": run_manager})  # type: ignore[arg-type, return-value]
+
     @classmethod
     def create(
         cls,
@@ -119,15 +203,20 @@ class AgentComponent(BaseComponent[InputType, Union[List[AgentAction], AgentActi
             ]
         ] = None,
         parser_name: Optional[str] = None,
+        trace_preprocessing: bool = True,
     ) -> "AgentComponent[InputType]":
         prompt = cls._process_prompt(prompt=prompt, user_message=user_message, system_message=system_message)
+        parser = AgentFactory.get_parser(parser=parser, parser_name=parser_name)
 
+        # parser's formatting is fused with the rest of preprocessing instead of being a separate step
         return cls(
             agent=AgentFactory.create_agent(
                 llm=llm,
                 tools=tools,
                 prompt=prompt,
                 parser=parser,
-                parser_name=parser_name,
-            )
+                format_inputs=False,
+            ),
+            trace_preprocessing=trace_preprocessing,
+            format_inputs=parser.format_inputs,  # type: ignore[arg-type]
         )
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Awaitable, Callable, Dict, Generic, Mapping, Optional, Set, TypeVar
+from typing import Awaitable, Callable, Dict, Generic, List, Mapping, Optional, Set, TypeVar
 
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
 from langchain_core.prompts import ChatPromptTemplate
@@ -59,3 +60,20 @@ class BaseComponent(Generic[InputType, OutputType], ABC):
         run_manager: Optional[AsyncCallbackManager] = None,
         **kwargs,
     ) -> OutputType: ...
+
+    def batch(
+        self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs
+    ) -> List[OutputType]:
+        """Processes a list of inputs. Components that can do it in a single call should override this method;
+        by default, inputs are processed one by one."""
+        return [self.invoke(cur_inputs, run_manager, **kwargs) for cur_inputs in inputs]
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[OutputType]:
+        """Processes a list of inputs asynchronously. Components that can do it in a single call should override
+        this method; by default, inputs are processed concurrently."""
+        return list(await asyncio.gather(*(self.ainvoke(cur_inputs, run_manager, **kwargs) for cur_inputs in inputs)))
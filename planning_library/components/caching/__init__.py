@@ -0,0 +1,13 @@
+from .cache_backends import ComponentCache, InMemoryComponentCache, SQLiteComponentCache
+from .cached_component import CachedComponent, is_deterministic
+from .hashing import canonical_hash, canonicalize
+
+__all__ = [
+    "CachedComponent",
+    "ComponentCache",
+    "InMemoryComponentCache",
+    "SQLiteComponentCache",
+    "canonical_hash",
+    "canonicalize",
+    "is_deterministic",
+]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class ComponentCache(ABC):
+    """Storage for results of component calls."""
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns a pair (whether the key is present, the value or None)."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class InMemoryComponentCache(ComponentCache):
+    """In-memory cache with the least recently used eviction and optional expiration.
+
+    Values are copied when stored and when returned, so callers can't modify cached results.
+
+    Args:
+        max_size: Maximum number of stored values. If None, the size is unlimited.
+        ttl: Time to live of stored values in seconds. If None, values don't expire.
+    """
+
+    def __init__(self, max_size: Optional[int] = 1024, ttl: Optional[float] = None):
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"`max_size` should be positive, got {max_size}.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: OrderedDict[str, Tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if key not in self._values:
+                return False, None
+            expires_at, value = self._values[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[key]
+                return False, None
+            self._values.move_to_end(key)
+        return True, copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._values[key] = (expires_at, value)
+            self._values.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._values) > self.max_size:
+                    self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class SQLiteComponentCache(ComponentCache):
+    """Persistent cache in an SQLite database, e.g., to reuse results across reruns of a dataset.
+    Values are pickled.
+
+    Args:
+        path: Path to the database file.
+        ttl: Time to live of stored values in seconds. If None, values don't expire.
+        table_name: Name of the table with cached values.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None, table_name: str = "component_cache"):
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid `table_name` {table_name}.")
+        self.path = path
+        self.ttl = ttl
+        self.table_name = table_name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+            )
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            with self._lock, self._connection:
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+            return False, None
+        return True, pickle.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, pickle.dumps(value), expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        self._connection.close()
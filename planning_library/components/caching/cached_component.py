@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.pydantic_v1 import BaseModel
+from langchain_core.runnables import Runnable
+
+from ...instrumentation.metrics import COMPONENT_CACHE_REQUESTS
+from ..base_component import BaseComponent, InputType, OutputType
+from .cache_backends import ComponentCache, InMemoryComponentCache
+from .hashing import canonical_hash
+
+
+def is_deterministic(obj: Any, _seen: Optional[Set[int]] = None) -> bool:
+    """Checks whether all the language models reachable from a given component (or runnable) sample
+    deterministically, i.e., have a temperature of 0. Models without a `temperature` are considered deterministic.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return True
+    seen.add(id(obj))
+
+    if isinstance(obj, BaseLanguageModel) and (getattr(obj, "temperature", None) or 0) > 0:
+        return False
+    if isinstance(obj, (list, tuple, set)):
+        return all(is_deterministic(item, seen) for item in obj)
+    if isinstance(obj, dict):
+        return all(is_deterministic(item, seen) for item in obj.values())
+    if isinstance(obj, (BaseComponent, Runnable, BaseModel)):
+        return all(is_deterministic(item, seen) for item in getattr(obj, "__dict__", {}).values())
+    return True
+
+
+class CachedComponent(BaseComponent[InputType, OutputType]):
+    """Wraps a component and caches the results of its calls by a canonical hash of inputs (see `canonical_hash`),
+    so repeated calls with identical inputs (e.g., across retries, trials or dataset reruns) skip the LLM work.
+
+    Keyword arguments of calls (e.g., callbacks and other config) are not a part of a key.
+    Calls with inputs that can't be hashed are passed to the component as is.
+
+    Args:
+        component: The component to wrap.
+        cache: Storage for results. Defaults to an in-memory LRU cache.
+        deterministic_only: If True, results are only cached when all the language models of the component
+          have a temperature of 0; other components are called as is.
+        namespace: Prefix of cache keys, to share a single cache between components.
+          Defaults to the name of the component (or its class).
+    """
+
+    def __init__(
+        self,
+        component: BaseComponent[InputType, OutputType],
+        cache: Optional[ComponentCache] = None,
+        deterministic_only: bool = False,
+        namespace: Optional[str] = None,
+    ):
+        self.component = component
+        self.cache = cache if cache is not None else InMemoryComponentCache()
+        self.namespace = namespace or component.name or type(component).__name__
+        self.name = component.name
+        self.enabled = not deterministic_only or is_deterministic(component)
+
+    def add_input_preprocessing(
+        self,
+        preprocess: Callable[[InputType], Dict],
+        apreprocess: Optional[Callable[[InputType], Awaitable[Dict]]] = None,
+    ) -> None:
+        self.component.add_input_preprocessing(preprocess, apreprocess)
+
+    def add_output_preprocessing(
+        self,
+        preprocess: Callable[[OutputType], OutputType],
+        apreprocess: Optional[Callable[[OutputType], Awaitable[OutputType]]] = None,
+    ) -> None:
+        self.component.add_output_preprocessing(preprocess, apreprocess)
+
+    def _key(self, inputs: InputType) -> Optional[str]:
+        if not self.enabled:
+            COMPONENT_CACHE_REQUESTS.labels(self.namespace, "bypass").inc()
+            return None
+        try:
+            return f"{self.namespace}:{canonical_hash(inputs)}"
+        except TypeError:
+            COMPONENT_CACHE_REQUESTS.labels(self.namespace, "bypass").inc()
+            return None
+
+    def _lookup(self, key: Optional[str]) -> Tuple[bool, Any]:
+        if key is None:
+            return False, None
+        found, value = self.cache.get(key)
+        COMPONENT_CACHE_REQUESTS.labels(self.namespace, "hit" if found else "miss").inc()
+        return found, value
+
+    def _store(self, key: Optional[str], value: OutputType) -> None:
+        if key is not None:
+            self.cache.set(key, value)
+
+    def invoke(self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs) -> OutputType:
+        key = self._key(inputs)
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        outputs = self.component.invoke(inputs, run_manager, **kwargs)
+        self._store(key, outputs)
+        return outputs
+
+    async def ainvoke(
+        self,
+        inputs: InputType,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> OutputType:
+        key = self._key(inputs)
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        outputs = await self.component.ainvoke(inputs, run_manager, **kwargs)
+        self._store(key, outputs)
+        return outputs
+
+    def _split_batch(self, inputs: List[InputType]) -> Tuple[List[Any], List[Optional[str]], Dict[Any, int]]:
+        """Looks up all the inputs; returns outputs found in the cache, keys and positions of inputs to compute.
+        Identical inputs are computed once."""
+        outputs: List[Any] = [None] * len(inputs)
+        keys = [self._key(cur_inputs) for cur_inputs in inputs]
+        to_compute: Dict[Any, int] = {}
+        for i, key in enumerate(keys):
+            found, value = self._lookup(key)
+            if found:
+                outputs[i] = value
+            elif key is None or key not in to_compute:
+                to_compute[key if key is not None else (i,)] = i
+        return outputs, keys, to_compute
+
+    def _merge_batch(
+        self,
+        outputs: List[Any],
+        keys: List[Optional[str]],
+        to_compute: Dict[Any, int],
+        computed: List[OutputType],
+    ) -> List[OutputType]:
+        computed_by_key = dict(zip(to_compute, computed))
+        for key, value in computed_by_key.items():
+            self._store(key if isinstance(key, str) else None, value)
+        for i, key in enumerate(keys):
+            if key is None and (i,) in computed_by_key:
+                outputs[i] = computed_by_key[(i,)]
+            elif key in computed_by_key:
+                outputs[i] = computed_by_key[key]
+        return outputs
+
+    def batch(
+        self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs
+    ) -> List[OutputType]:
+        """Computes the inputs missing from the cache in a single batched call of the component."""
+        outputs, keys, to_compute = self._split_batch(inputs)
+        computed = (
+            self.component.batch([inputs[i] for i in to_compute.values()], run_manager, **kwargs) if to_compute else []
+        )
+        return self._merge_batch(outputs, keys, to_compute, computed)
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[OutputType]:
+        """Computes the inputs missing from the cache in a single batched call of the component."""
+        outputs, keys, to_compute = self._split_batch(inputs)
+        computed = (
+            await self.component.abatch([inputs[i] for i in to_compute.values()], run_manager, **kwargs)
+            if to_compute
+            else []
+        )
+        return self._merge_batch(outputs, keys, to_compute, computed)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from enum import Enum
+from typing import Any, Dict, Mapping, Tuple
+
+from langchain_core.agents import AgentAction
+from langchain_core.messages import BaseMessage
+from langchain_core.pydantic_v1 import BaseModel
+
+# fields of messages that differ between otherwise identical runs (generated by providers or by langchain)
+_VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "tool_call_id")
+# fields of agent actions that differ between otherwise identical runs (ids of tool calls, e.g., in OpenAIToolAgentAction)
+_VOLATILE_ACTION_FIELDS = ("tool_call_id",)
+
+
+def _canonicalize_model(value: BaseModel, exclude: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    # fields are traversed one by one (not via `.dict()`) so that nested messages are canonicalized as messages
+    fields = {name: canonicalize(getattr(value, name)) for name in value.__fields__ if name not in exclude}
+    return {"__type__": type(value).__name__, **fields}
+
+
+def _drop_call_ids(tool_calls: Any) -> Any:
+    return [{key: value for key, value in call.items() if key != "id"} for call in tool_calls]
+
+
+def _canonicalize_message(message: BaseMessage) -> Dict[str, Any]:
+    fields = _canonicalize_model(message, exclude=_VOLATILE_MESSAGE_FIELDS)
+    tool_calls = fields.get("additional_kwargs", {}).get("tool_calls")
+    if tool_calls:
+        fields["additional_kwargs"] = {**fields["additional_kwargs"], "tool_calls": _drop_call_ids(tool_calls)}
+    # parsed tool calls of AI messages (and their chunks)
+    for name in ("tool_calls", "invalid_tool_calls", "tool_call_chunks"):
+        if fields.get(name):
+            fields[name] = _drop_call_ids(fields[name])
+    return fields
+
+
+def canonicalize(value: Any) -> Any:
+    """Converts a value into a JSON-serializable form that only depends on its contents.
+
+    Supports primitive types, mappings, sequences, sets, enums, dataclasses and pydantic models
+    (including langchain messages, AgentAction and AgentFinish). Fields of messages and agent actions that change
+    from run to run for the same contents (message ids, response metadata, ids of tool calls) are dropped.
+
+    Raises:
+        TypeError: If the value (or any of its items) is of an unsupported type.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+    if isinstance(value, BaseMessage):
+        return _canonicalize_message(value)
+    if isinstance(value, AgentAction):
+        return _canonicalize_model(value, exclude=_VOLATILE_ACTION_FIELDS)
+    if isinstance(value, BaseModel):
+        return _canonicalize_model(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {"__type__": type(value).__name__, **canonicalize(dataclasses.asdict(value))}
+    if isinstance(value, Mapping):
+        return {str(key): canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonicalize(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True))
+    raise TypeError(f"Can't canonicalize a value of type {type(value).__name__}.")
+
+
+def canonical_hash(value: Any) -> str:
+    """Returns a stable hash of a value: equal for values with equal contents, across processes and runs."""
+    serialized = json.dumps(canonicalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
@@ -1,4 +1,15 @@
+from .cascade_component import CascadeComponent, CascadeStage
+from .cascade_evaluator_component import CascadeEvaluatorComponent
 from .evaluator_component import EvaluatorComponent
+from .self_consistency_evaluator_component import SelfConsistencyEvaluatorComponent
 from .threshold_judge import GeqThresholdJudge, LeqThresholdJudge
 
-__all__ = ["EvaluatorComponent", "LeqThresholdJudge", "GeqThresholdJudge"]
+__all__ = [
+    "EvaluatorComponent",
+    "LeqThresholdJudge",
+    "GeqThresholdJudge",
+    "CascadeComponent",
+    "CascadeEvaluatorComponent",
+    "CascadeStage",
+    "SelfConsistencyEvaluatorComponent",
+]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Union
+
+from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
+
+from ...instrumentation.metrics import CASCADE_VERDICTS
+from ..base_component import BaseComponent, InputType, OutputType
+from ..preprocessing import PreprocessingPipeline
+
+
+def _is_not_none(output: Any) -> bool:
+    return output is not None
+
+
+@dataclass
+class CascadeStage(Generic[InputType, OutputType]):
+    """A single stage of a cascade.
+
+    Args:
+        backbone: Component or plain function that accepts the inputs and returns an output (e.g., a score),
+          or None when it can't make a decision. Plain functions are meant for cheap rules and heuristics:
+          they are called directly, without callbacks.
+        is_confident: Returns True when an output is confident enough to stop the cascade.
+          By default, any output other than None is.
+        name: Name of the stage (used in metrics). Defaults to the name of the component or the function.
+    """
+
+    backbone: Union[BaseComponent[InputType, Optional[OutputType]], Callable[[InputType], Optional[OutputType]]]
+    is_confident: Callable[[Optional[OutputType]], bool] = _is_not_none
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.name is None:
+            if isinstance(self.backbone, BaseComponent):
+                self.name = self.backbone.name or type(self.backbone).__name__
+            else:
+                self.name = getattr(self.backbone, "__name__", type(self.backbone).__name__)
+
+    def batch(self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs) -> List[Any]:
+        if isinstance(self.backbone, BaseComponent):
+            return self.backbone.batch(inputs, run_manager, **kwargs)
+        return [self.backbone(cur_inputs) for cur_inputs in inputs]
+
+    async def abatch(
+        self, inputs: List[InputType], run_manager: Optional[AsyncCallbackManager] = None, **kwargs
+    ) -> List[Any]:
+        if isinstance(self.backbone, BaseComponent):
+            return await self.backbone.abatch(inputs, run_manager, **kwargs)
+        return [self.backbone(cur_inputs) for cur_inputs in inputs]
+
+
+class CascadeComponent(BaseComponent[InputType, OutputType]):
+    """Runs an ordered list of stages – from cheap rules and heuristics to small models to large LLMs –
+    and returns the output of the first stage that is confident about it. Later stages are only called
+    for inputs that earlier stages couldn't decide on. The output of the last stage is always accepted.
+
+    Input preprocessing is applied once, before all the stages.
+
+    Args:
+        stages: Stages in the order of calling. Components and plain functions are converted to stages
+          with default settings.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[
+            Union[
+                CascadeStage[InputType, OutputType],
+                BaseComponent[InputType, Optional[OutputType]],
+                Callable[[InputType], Optional[OutputType]],
+            ]
+        ],
+    ):
+        if not stages:
+            raise ValueError("At least one stage is required for a cascade.")
+        self.stages: List[CascadeStage[InputType, OutputType]] = [
+            stage if isinstance(stage, CascadeStage) else CascadeStage(backbone=stage) for stage in stages
+        ]
+        self._input_preprocessing = PreprocessingPipeline()
+
+    def add_input_preprocessing(
+        self,
+        preprocess: Callable[[InputType], Dict],
+        apreprocess: Optional[Callable[[InputType], Awaitable[Dict]]] = None,
+    ) -> None:
+        self._input_preprocessing.prepend(preprocess, apreprocess)
+
+    def _accept(self, stage_idx: int, output: Any) -> bool:
+        stage = self.stages[stage_idx]
+        if stage_idx == len(self.stages) - 1 or stage.is_confident(output):
+            CASCADE_VERDICTS.labels(stage.name or str(stage_idx)).inc()
+            return True
+        return False
+
+    def invoke(self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs) -> OutputType:
+        return self.batch([inputs], run_manager, **kwargs)[0]
+
+    async def ainvoke(
+        self,
+        inputs: InputType,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> OutputType:
+        return (await self.abatch([inputs], run_manager, **kwargs))[0]
+
+    def batch(
+        self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs
+    ) -> List[OutputType]:
+        """Passes the inputs through the stages; each stage is called once, in a batch, for all undecided inputs."""
+        inputs = [self._input_preprocessing(cur_inputs) for cur_inputs in inputs]
+        outputs: List[Any] = [None] * len(inputs)
+        pending = list(range(len(inputs)))
+        for stage_idx, stage in enumerate(self.stages):
+            if not pending:
+                break
+            stage_outputs = stage.batch([inputs[i] for i in pending], run_manager, **kwargs)
+            still_pending = []
+            for i, output in zip(pending, stage_outputs):
+                if self._accept(stage_idx, output):
+                    outputs[i] = output
+                else:
+                    still_pending.append(i)
+            pending = still_pending
+        return outputs
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[OutputType]:
+        """Passes the inputs through the stages; each stage is called once, in a batch, for all undecided inputs."""
+        inputs = [await self._input_preprocessing.acall(cur_inputs) for cur_inputs in inputs]
+        outputs: List[Any] = [None] * len(inputs)
+        pending = list(range(len(inputs)))
+        for stage_idx, stage in enumerate(self.stages):
+            if not pending:
+                break
+            stage_outputs = await stage.abatch([inputs[i] for i in pending], run_manager, **kwargs)
+            still_pending = []
+            for i, output in zip(pending, stage_outputs):
+                if self._accept(stage_idx, output):
+                    outputs[i] = output
+                else:
+                    still_pending.append(i)
+            pending = still_pending
+        return outputs
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Sequence, Type, Union
+
+from ..base_component import BaseComponent, InputType, OutputType
+from .cascade_component import CascadeComponent, CascadeStage
+from .evaluator_component import EvaluatorComponent
+from .threshold_judge import GeqThresholdJudge, LeqThresholdJudge
+
+
+class CascadeEvaluatorComponent(EvaluatorComponent[InputType, OutputType]):
+    """Evaluator that makes a verdict with the first confident stage of a cascade (see `CascadeComponent`)
+    and judges it. Put cheap rules and heuristics first, so that LLMs are only called when they are uncertain.
+
+    Args:
+        stages: Stages in the order of calling.
+        judge: Component that makes the final verdict from the output of a stage.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[
+            Union[
+                CascadeStage[InputType, OutputType],
+                BaseComponent[InputType, Optional[OutputType]],
+                Callable[[InputType], Optional[OutputType]],
+            ]
+        ],
+        judge: BaseComponent[Dict[str, OutputType], bool],
+    ):
+        super().__init__(backbone=CascadeComponent(stages), judge=judge)
+
+    @property
+    def stages(self) -> List[CascadeStage[InputType, OutputType]]:
+        return self.backbone.stages  # type: ignore[attr-defined]
+
+    @classmethod
+    def create_threshold_cascade(
+        cls: Type["CascadeEvaluatorComponent"],
+        stages: Sequence[
+            Union[
+                CascadeStage[InputType, float],
+                BaseComponent[InputType, Optional[float]],
+                Callable[[InputType], Optional[float]],
+            ]
+        ],
+        threshold: float,
+        threshold_mode: str,
+    ) -> "CascadeEvaluatorComponent[InputType, float]":
+        if threshold_mode == "leq":
+            judge: BaseComponent[Dict[str, float], bool] = LeqThresholdJudge(threshold=threshold)
+        elif threshold_mode == "geq":
+            judge = GeqThresholdJudge(threshold=threshold)
+        else:
+            raise ValueError(f"Unknown `threshold_mode` {threshold_mode} when initializing {cls.__name__}.")
+
+        return cls(stages=stages, judge=judge)
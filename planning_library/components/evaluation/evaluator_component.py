@@ -1,4 +1,4 @@
-from typing import Awaitable, Callable, Dict, Generic, Optional, Type
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Type, Union
 
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
 from langchain_core.language_models import BaseChatModel
@@ -7,9 +7,10 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 
 from planning_library.components.runnable_component import RunnableComponent
-from planning_library.primitives.output_parsers import SimpleEvaluateOutputParser
+from planning_library.primitives.output_parsers import SimpleEvaluateOutputParser, StreamingOutputParser
 
 from ..base_component import BaseComponent, InputType, OutputType
+from .cascade_component import CascadeComponent, CascadeStage
 from .threshold_judge import GeqThresholdJudge, LeqThresholdJudge
 
 
@@ -36,6 +37,26 @@ class EvaluatorComponent(Generic[InputType, OutputType], BaseComponent[InputType
     ) -> None:
         self.judge.add_output_preprocessing(preprocess, apreprocess)
 
+    def add_cascade_stages(
+        self,
+        stages: Sequence[
+            Union[
+                CascadeStage[InputType, OutputType],
+                BaseComponent[InputType, Optional[OutputType]],
+                Callable[[InputType], Optional[OutputType]],
+            ]
+        ],
+    ) -> None:
+        """Makes the evaluator try given stages (e.g., cheap heuristics) before the current backbone:
+        the backbone becomes the last stage of a cascade and is only called for inputs that the given stages
+        are not confident about (see `CascadeComponent`).
+
+        Given stages receive the evaluator inputs as is: input preprocessing added before this call
+        only applies to the current backbone.
+        """
+        if stages:
+            self.backbone = CascadeComponent([*stages, self.backbone])  # type: ignore[list-item]
+
     def invoke(self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs) -> bool:
         if "run_name" not in kwargs and self.name:
             kwargs["run_name"] = self.name
@@ -57,6 +78,29 @@ class EvaluatorComponent(Generic[InputType, OutputType], BaseComponent[InputType
         should_continue = await self.judge.ainvoke({"backbone_output": backbone_output}, run_manager)
         return should_continue
 
+    def batch(self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs) -> List[bool]:
+        """Evaluates a list of inputs: passes them through the backbone in a single batched call
+        and judges all the outputs at once."""
+        if "run_name" not in kwargs and self.name:
+            kwargs["run_name"] = self.name
+
+        backbone_outputs = self.backbone.batch(inputs, run_manager, **kwargs)
+        return self.judge.batch([{"backbone_output": output} for output in backbone_outputs], run_manager)
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[bool]:
+        """Evaluates a list of inputs asynchronously: passes them through the backbone in a single batched call
+        and judges all the outputs at once."""
+        if "run_name" not in kwargs and self.name:
+            kwargs["run_name"] = self.name
+
+        backbone_outputs = await self.backbone.abatch(inputs, run_manager, **kwargs)
+        return await self.judge.abatch([{"backbone_output": output} for output in backbone_outputs], run_manager)
+
     @classmethod
     def create_threshold_evaluator(
         cls: Type["EvaluatorComponent"],
@@ -67,14 +111,20 @@ class EvaluatorComponent(Generic[InputType, OutputType], BaseComponent[InputType
         user_message: Optional[str] = None,
         system_message: Optional[str] = None,
         output_parser: Optional[BaseOutputParser[float]] = None,
+        stream_parsing: bool = False,
     ) -> "EvaluatorComponent[InputType, float]":
         prompt = cls._process_prompt(prompt=prompt, user_message=user_message, system_message=system_message)
 
         if output_parser is None:
             output_parser = SimpleEvaluateOutputParser()
 
+        # stop generating as soon as the score is found in the output
+        runnable = (
+            prompt | StreamingOutputParser(llm, output_parser) if stream_parsing else prompt | llm | output_parser
+        )
+
         return cls.create_threshold_evaluator_from_runnable(
-            runnable=prompt | llm | output_parser,
+            runnable=runnable,
             threshold=threshold,
             threshold_mode=threshold_mode,
         )
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Type
+
+from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
+
+from ...instrumentation.metrics import SELF_CONSISTENCY_VOTES
+from ..base_component import BaseComponent, InputType
+from .evaluator_component import EvaluatorComponent
+
+AGGREGATIONS = ("majority", "mean")
+
+
+class _Votes:
+    """Collects scores and tells when the verdict can't be changed by the remaining votes anymore."""
+
+    def __init__(self, evaluator: SelfConsistencyEvaluatorComponent, run_manager: Any = None):
+        self.evaluator = evaluator
+        self.run_manager = run_manager
+        self.scores: List[float] = []
+        self.num_passed = 0
+
+    def _judge(self, score: float, report: bool = True) -> bool:
+        return self.evaluator.judge.invoke({"backbone_output": score}, self.run_manager if report else None)
+
+    def add(self, score: float) -> None:
+        self.scores.append(score)
+        if self.evaluator.aggregation == "majority":
+            self.num_passed += self._judge(score)
+
+    def verdict(self) -> Optional[bool]:
+        """Returns the final verdict or None if it's not known yet."""
+        num_votes = self.evaluator.num_votes
+        num_remaining = num_votes - len(self.scores)
+
+        if self.evaluator.aggregation == "majority":
+            if 2 * self.num_passed > num_votes:
+                return True
+            if 2 * (self.num_passed + num_remaining) <= num_votes:
+                return False
+            return None
+
+        # mean: the verdict is known when it's the same for the lowest and for the highest possible mean
+        total = sum(self.scores)
+        lowest = self._judge((total + num_remaining * self.evaluator.min_score) / num_votes)
+        highest = self._judge((total + num_remaining * self.evaluator.max_score) / num_votes)
+        return lowest if lowest == highest else None
+
+    def num_needed(self) -> int:
+        """Returns the smallest number of further votes that can settle the verdict (when it's not known yet)."""
+        num_votes = self.evaluator.num_votes
+        num_remaining = num_votes - len(self.scores)
+
+        if self.evaluator.aggregation == "majority":
+            num_to_pass = num_votes // 2 + 1 - self.num_passed
+            num_to_fail = self.num_passed + num_remaining - num_votes // 2
+            return max(1, min(num_to_pass, num_to_fail))
+
+        # mean: the verdict is settled by k votes with the same extreme score if the remaining ones can't change it
+        total = sum(self.scores)
+        min_score, max_score = self.evaluator.min_score, self.evaluator.max_score
+        for k in range(1, num_remaining):
+            for score in (min_score, max_score):
+                lowest = (total + k * score + (num_remaining - k) * min_score) / num_votes
+                highest = (total + k * score + (num_remaining - k) * max_score) / num_votes
+                if self._judge(lowest, report=False) == self._judge(highest, report=False):
+                    return k
+        return num_remaining
+
+
+class SelfConsistencyEvaluatorComponent(EvaluatorComponent[InputType, float]):
+    """Evaluator that samples several scores from the backbone concurrently and aggregates them.
+
+    Two aggregations are supported:
+      * majority: each score is judged separately, the verdict is the one of the majority of votes
+        (a tie counts as a negative verdict);
+      * mean: the mean of all scores is judged.
+
+    Scores are sampled in waves: each wave has as many samples as could settle the verdict (e.g., 3 of 5 votes
+    with majority aggregation at first), and no more samples are requested once the remaining votes can't change
+    the verdict, so fewer than `num_votes` backbone calls are made on average.
+
+    Note:
+        Votes only differ when the backbone is sampled, e.g., an LLM with a non-zero temperature.
+
+    Args:
+        backbone: Component that returns a score.
+        judge: Monotone judge of a score (e.g., a threshold judge).
+        num_votes: Maximum number of scores to sample.
+        aggregation: How scores are aggregated: `majority` or `mean`.
+        max_concurrency: Maximum number of scores sampled at the same time. Defaults to `num_votes`.
+          Sync calls share a single thread pool of this size.
+        min_score: The lowest possible score (used for early stopping with `mean` aggregation).
+        max_score: The highest possible score (used for early stopping with `mean` aggregation).
+    """
+
+    def __init__(
+        self,
+        backbone: BaseComponent[InputType, float],
+        judge: BaseComponent[Dict[str, float], bool],
+        num_votes: int = 5,
+        aggregation: str = "majority",
+        max_concurrency: Optional[int] = None,
+        min_score: float = 0.0,
+        max_score: float = 1.0,
+    ):
+        if num_votes < 1:
+            raise ValueError(f"`num_votes` should be positive, got {num_votes}.")
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unknown `aggregation` {aggregation}. Currently available are: {AGGREGATIONS}")
+        super().__init__(backbone=backbone, judge=judge)
+        self.num_votes = num_votes
+        self.aggregation = aggregation
+        self.max_concurrency = max_concurrency if max_concurrency is not None else num_votes
+        self.min_score = min_score
+        self.max_score = max_score
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_evaluator(
+        cls: Type["SelfConsistencyEvaluatorComponent"],
+        evaluator: EvaluatorComponent[InputType, float],
+        num_votes: int = 5,
+        aggregation: str = "majority",
+        max_concurrency: Optional[int] = None,
+    ) -> "SelfConsistencyEvaluatorComponent[InputType]":
+        """Creates a self-consistency evaluator with the same backbone and judge as a given evaluator."""
+        self_consistency = cls(
+            backbone=evaluator.backbone,
+            judge=evaluator.judge,
+            num_votes=num_votes,
+            aggregation=aggregation,
+            max_concurrency=max_concurrency,
+        )
+        self_consistency.name = evaluator.name
+        return self_consistency
+
+    def _count_votes(self, num_used: int, num_cancelled: int = 0, num_abandoned: int = 0) -> None:
+        SELF_CONSISTENCY_VOTES.labels("used").inc(num_used)
+        if num_cancelled:
+            SELF_CONSISTENCY_VOTES.labels("cancelled").inc(num_cancelled)
+        if num_abandoned:
+            SELF_CONSISTENCY_VOTES.labels("abandoned").inc(num_abandoned)
+        num_skipped = self.num_votes - num_used - num_cancelled - num_abandoned
+        if num_skipped:
+            SELF_CONSISTENCY_VOTES.labels("skipped").inc(num_skipped)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="self-consistency"
+                )
+            return self._executor
+
+    def invoke(self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs) -> bool:
+        if "run_name" not in kwargs and self.name:
+            kwargs["run_name"] = self.name
+
+        votes = _Votes(self, run_manager)
+        executor = self._get_executor()
+        verdict = votes.verdict()
+        while verdict is None:
+            wave = [
+                executor.submit(
+                    contextvars.copy_context().run, partial(self.backbone.invoke, inputs, run_manager, **kwargs)
+                )
+                for _ in range(min(votes.num_needed(), self.max_concurrency))
+            ]
+            try:
+                scores = [future.result() for future in wave]
+            except BaseException:
+                # samples in flight can't be interrupted: they finish in the background and are ignored
+                pending = [future for future in wave if not future.done()]
+                num_cancelled = sum(future.cancel() for future in pending)
+                self._count_votes(len(votes.scores), num_cancelled, len(pending) - num_cancelled)
+                raise
+            for score in scores:
+                votes.add(score)
+            verdict = votes.verdict()
+
+        self._count_votes(num_used=len(votes.scores))
+        return verdict
+
+    async def ainvoke(
+        self,
+        inputs: InputType,
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> bool:
+        if "run_name" not in kwargs and self.name:
+            kwargs["run_name"] = self.name
+
+        votes = _Votes(self, run_manager)
+        verdict = votes.verdict()
+        while verdict is None:
+            wave = [
+                asyncio.ensure_future(self.backbone.ainvoke(inputs, run_manager, **kwargs))
+                for _ in range(min(votes.num_needed(), self.max_concurrency))
+            ]
+            try:
+                scores = await asyncio.gather(*wave)
+            except BaseException:
+                pending = [task for task in wave if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                self._count_votes(len(votes.scores), num_cancelled=len(pending))
+                raise
+            for score in scores:
+                votes.add(score)
+            verdict = votes.verdict()
+
+        self._count_votes(num_used=len(votes.scores))
+        return verdict
+
+    def batch(self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs) -> List[bool]:
+        return [self.invoke(cur_inputs, run_manager, **kwargs) for cur_inputs in inputs]
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[bool]:
+        return list(await asyncio.gather(*(self.ainvoke(cur_inputs, run_manager, **kwargs) for cur_inputs in inputs)))
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
 
@@ -22,6 +22,17 @@ class LeqThresholdJudge(BaseComponent[InputType, bool]):
     ) -> bool:
         return inputs["backbone_output"] <= self.threshold
 
+    def batch(self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs) -> List[bool]:
+        return [cur_inputs["backbone_output"] <= self.threshold for cur_inputs in inputs]
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[bool]:
+        return self.batch(inputs)
+
 
 class GeqThresholdJudge(BaseComponent[InputType, bool]):
     def __init__(self, threshold: float):
@@ -37,3 +48,14 @@ class GeqThresholdJudge(BaseComponent[InputType, bool]):
         **kwargs,
     ) -> bool:
         return inputs["backbone_output"] >= self.threshold
+
+    def batch(self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs) -> List[bool]:
+        return [cur_inputs["backbone_output"] >= self.threshold for cur_inputs in inputs]
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[bool]:
+        return self.batch(inputs)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+PreprocessingStep = Tuple[Callable[[Any], Any], Optional[Callable[[Any], Awaitable[Any]]]]
+
+
+class PreprocessingPipeline:
+    """Preprocessing steps registered on a component, fused into a single callable.
+
+    Wrapping each step into its own `RunnableLambda` adds a layer of callback events, config merging and
+    input copies on every call. Instead, steps are collected here and applied one after another by a single
+    function (`__call__` for sync calls, `acall` for async ones), which is added to the component's runnable
+    as one step.
+
+    Steps without an async version are called directly in async calls as well: preprocessing steps are
+    expected to be cheap transformations of inputs/outputs, so they are not worth a trip to a thread pool.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[PreprocessingStep] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+
+    def prepend(
+        self, preprocess: Callable[[Any], Any], apreprocess: Optional[Callable[[Any], Awaitable[Any]]] = None
+    ) -> None:
+        """Adds a step that runs before all the steps registered so far."""
+        self.steps.insert(0, (preprocess, apreprocess))
+
+    def append(
+        self, preprocess: Callable[[Any], Any], apreprocess: Optional[Callable[[Any], Awaitable[Any]]] = None
+    ) -> None:
+        """Adds a step that runs after all the steps registered so far."""
+        self.steps.append((preprocess, apreprocess))
+
+    def __call__(self, value: Any) -> Any:
+        for preprocess, _ in self.steps:
+            value = preprocess(value)
+        return value
+
+    async def acall(self, value: Any) -> Any:
+        for preprocess, apreprocess in self.steps:
+            value = await apreprocess(value) if apreprocess is not None else preprocess(value)
+        return value
+
+    def as_runnable(self, name: str, trace: bool = True) -> Runnable:
+        """Wraps the fused steps into a runnable.
+
+        Args:
+            name: Name of the runnable (used as a run name when tracing).
+            trace: If False, the runnable doesn't start runs of its own, so callback handlers
+              (e.g., tracers) don't receive any events for preprocessing.
+        """
+        if trace:
+            return RunnableLambda(self.__call__, afunc=self.acall, name=name)
+        return _UntracedRunnable(self, name=name)
+
+
+class _UntracedRunnable(Runnable[Any, Any]):
+    """Calls fused preprocessing steps without starting a run (and thus without any callback events)."""
+
+    def __init__(self, pipeline: PreprocessingPipeline, name: str):
+        self.pipeline = pipeline
+        self.name = name
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        return self.pipeline(input)
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        return await self.pipeline.acall(input)
+
+    def batch(
+        self, inputs: List[Any], config: Any = None, *, return_exceptions: bool = False, **kwargs: Any
+    ) -> List[Any]:
+        outputs: List[Any] = []
+        for input in inputs:
+            try:
+                outputs.append(self.pipeline(input))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                outputs.append(e)
+        return outputs
+
+    async def abatch(
+        self, inputs: List[Any], config: Any = None, *, return_exceptions: bool = False, **kwargs: Any
+    ) -> List[Any]:
+        outputs: List[Any] = []
+        for input in inputs:
+            try:
+                outputs.append(await self.pipeline.acall(input))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                outputs.append(e)
+        return outputs
@@ -1,16 +1,46 @@
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import BaseOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables import Runnable
 
+from ..instrumentation.metrics import COMPONENT_INVOCATIONS
+from ..primitives.output_parsers import StreamingOutputParser
 from .base_component import BaseComponent, InputType, OutputType
+from .preprocessing import PreprocessingPipeline
 
 
 class RunnableComponent(BaseComponent[InputType, OutputType]):
-    def __init__(self, runnable: Runnable[InputType, OutputType]):
+    """Component powered by a runnable.
+
+    Input and output preprocessing steps are fused into a single step before and after the runnable
+    (see `PreprocessingPipeline`).
+
+    Args:
+        runnable: The runnable to call.
+        trace_preprocessing: If False, preprocessing steps don't start runs of their own,
+          so callback handlers (e.g., tracers) only see the runnable itself.
+    """
+
+    def __init__(self, runnable: Runnable[InputType, OutputType], trace_preprocessing: bool = True):
+        self._base_runnable = runnable
+        self._input_preprocessing = PreprocessingPipeline()
+        self._output_preprocessing = PreprocessingPipeline()
+        self._trace_preprocessing = trace_preprocessing
+        self.runnable = runnable
+
+    def _build_runnable(self) -> None:
+        runnable: Runnable = self._base_runnable
+        if self._input_preprocessing:
+            runnable = (
+                self._input_preprocessing.as_runnable("preprocess_inputs", trace=self._trace_preprocessing) | runnable
+            )
+        if self._output_preprocessing:
+            runnable = runnable | self._output_preprocessing.as_runnable(
+                "preprocess_outputs", trace=self._trace_preprocessing
+            )
         self.runnable = runnable
 
     @classmethod
@@ -21,26 +51,43 @@ class RunnableComponent(BaseComponent[InputType, OutputType]):
         prompt: Optional[ChatPromptTemplate] = None,
         user_message: Optional[str] = None,
         system_message: Optional[str] = None,
+        trace_preprocessing: bool = True,
+        stream_parsing: bool = False,
     ) -> "RunnableComponent":
+        """Creates a component from a prompt, an LLM and an optional output parser.
+
+        Args:
+            stream_parsing: If True, the LLM output is parsed while it's being generated and the generation
+              is stopped as soon as the output parser gets a result (see `StreamingOutputParser`).
+        """
         prompt = cls._process_prompt(prompt=prompt, user_message=user_message, system_message=system_message)
+        if stream_parsing:
+            if output_parser is None:
+                raise ValueError("`output_parser` must be provided when `stream_parsing` is True.")
+            return RunnableComponent(
+                prompt | StreamingOutputParser(llm, output_parser), trace_preprocessing=trace_preprocessing
+            )
+
         runnable = prompt | llm
         if output_parser is not None:
             runnable = runnable | output_parser
-        return RunnableComponent(runnable)
+        return RunnableComponent(runnable, trace_preprocessing=trace_preprocessing)
 
     def add_input_preprocessing(
         self,
         preprocess: Callable[[InputType], Dict],
         apreprocess: Optional[Callable[[InputType], Awaitable[Dict]]] = None,
     ) -> None:
-        self.runnable = RunnableLambda(preprocess, afunc=apreprocess) | self.runnable
+        self._input_preprocessing.prepend(preprocess, apreprocess)
+        self._build_runnable()
 
     def add_output_preprocessing(
         self,
         preprocess: Callable[[OutputType], OutputType],
         apreprocess: Optional[Callable[[OutputType], Awaitable[OutputType]]] = None,
     ) -> None:
-        self.runnable = self.runnable | RunnableLambda(preprocess, afunc=apreprocess)
+        self._output_preprocessing.append(preprocess, apreprocess)
+        self._build_runnable()
 
     def invoke(self, inputs: InputType, run_manager: Optional[CallbackManager] = None, **kwargs) -> OutputType:
         config = kwargs
@@ -50,6 +97,7 @@ class RunnableComponent(BaseComponent[InputType, OutputType]):
         if "run_name" not in config and self.name:
             config["run_name"] = self.name
 
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc()
         outputs = self.runnable.invoke(
             inputs,
             config=config,  # type: ignore[arg-type]
@@ -69,8 +117,52 @@ class RunnableComponent(BaseComponent[InputType, OutputType]):
         if "run_name" not in config and self.name:
             config["run_name"] = self.name
 
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc()
         outputs = await self.runnable.ainvoke(
             inputs,
             config=config,  # type: ignore[arg-type]
         )
         return outputs
+
+    def batch(
+        self, inputs: List[InputType], run_manager: Optional[CallbackManager] = None, **kwargs
+    ) -> List[OutputType]:
+        """Passes a list of inputs through the runnable in a single `batch` call."""
+        if not inputs:
+            return []
+
+        config = kwargs
+        if "callbacks" not in config and run_manager:
+            config["callbacks"] = run_manager
+
+        if "run_name" not in config and self.name:
+            config["run_name"] = self.name
+
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc(len(inputs))
+        return self.runnable.batch(
+            inputs,
+            config=config,  # type: ignore[arg-type]
+        )
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        run_manager: Optional[AsyncCallbackManager] = None,
+        **kwargs,
+    ) -> List[OutputType]:
+        """Passes a list of inputs through the runnable in a single `abatch` call."""
+        if not inputs:
+            return []
+
+        config = kwargs
+        if "callbacks" not in config and run_manager:
+            config["callbacks"] = run_manager
+
+        if "run_name" not in config and self.name:
+            config["run_name"] = self.name
+
+        COMPONENT_INVOCATIONS.labels(self.name or type(self).__name__).inc(len(inputs))
+        return await self.runnable.abatch(
+            inputs,
+            config=config,  # type: ignore[arg-type]
+        )
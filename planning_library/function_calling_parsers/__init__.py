@@ -1,10 +1,12 @@
-from .base_parser import (
-    BaseFunctionCallingMultiActionParser,
-    BaseFunctionCallingSingleActionParser,
-)
-from .openai_functions_parser import OpenAIFunctionsParser
-from .openai_tools_parser import OpenAIToolsParser
-from .parser_registry import ParserRegistry
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_parser import BaseFunctionCallingMultiActionParser, BaseFunctionCallingSingleActionParser
+    from .openai_functions_parser import OpenAIFunctionsParser
+    from .openai_tools_parser import OpenAIToolsParser
+    from .parser_registry import ParserRegistry
 
 __all__ = [
     "BaseFunctionCallingMultiActionParser",
@@ -13,3 +15,15 @@ __all__ = [
     "OpenAIFunctionsParser",
     "ParserRegistry",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseFunctionCallingMultiActionParser": ".base_parser",
+        "BaseFunctionCallingSingleActionParser": ".base_parser",
+        "OpenAIFunctionsParser": ".openai_functions_parser",
+        "OpenAIToolsParser": ".openai_tools_parser",
+        "ParserRegistry": ".parser_registry",
+    },
+)
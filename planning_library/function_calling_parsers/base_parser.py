@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 
-from langchain.agents.agent import AgentOutputParser, MultiActionAgentOutputParser
 from langchain_core.agents import AgentAction
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
@@ -9,6 +10,9 @@ from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from typing_extensions import TypedDict
 
+if TYPE_CHECKING:
+    from langchain.agents.agent import AgentOutputParser, MultiActionAgentOutputParser
+
 
 class AgentInputs(TypedDict):
     inputs: Dict[str, Any]
@@ -1,6 +1,7 @@
+import importlib
 from typing import Dict, List, Type, Union
 
-from planning_library.function_calling_parsers import (
+from planning_library.function_calling_parsers.base_parser import (
     BaseFunctionCallingMultiActionParser,
     BaseFunctionCallingSingleActionParser,
 )
@@ -12,10 +13,18 @@ class ParserRegistry:
         Union[BaseFunctionCallingSingleActionParser, BaseFunctionCallingMultiActionParser],
     ] = {}
 
+    # built-in parsers register themselves when their modules are imported; modules are only imported on demand
+    builtin_parsers: Dict[str, str] = {
+        "openai-functions": "planning_library.function_calling_parsers.openai_functions_parser",
+        "openai-tools": "planning_library.function_calling_parsers.openai_tools_parser",
+    }
+
     @classmethod
     def get_parser(
         cls, parser_name
     ) -> Union[BaseFunctionCallingSingleActionParser, BaseFunctionCallingMultiActionParser]:
+        if parser_name not in cls.registry and parser_name in cls.builtin_parsers:
+            importlib.import_module(cls.builtin_parsers[parser_name])
         try:
             return cls.registry[parser_name]
         except KeyError:
@@ -23,7 +32,7 @@ class ParserRegistry:
 
     @classmethod
     def get_available_parsers(cls) -> List[str]:
-        return list(cls.registry.keys())
+        return list(cls.registry.keys()) + [name for name in cls.builtin_parsers if name not in cls.registry]
 
     @classmethod
     def register(
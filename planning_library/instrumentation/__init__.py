@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .chrome_trace import ChromeTraceRecorder
+    from .metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+    from .run_stats import (
+        LatencyHistogram,
+        PhaseStats,
+        RunStats,
+        RunStatsCallbackHandler,
+        get_current_phase,
+        get_current_run_stats,
+        observe_phases,
+        record_tool_calls,
+        track_phase,
+        track_run_stats,
+    )
+
+__all__ = [
+    "ChromeTraceRecorder",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "LatencyHistogram",
+    "PhaseStats",
+    "RunStats",
+    "RunStatsCallbackHandler",
+    "get_current_phase",
+    "get_current_run_stats",
+    "observe_phases",
+    "record_tool_calls",
+    "track_phase",
+    "track_run_stats",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChromeTraceRecorder": ".chrome_trace",
+        "REGISTRY": ".metrics",
+        "Counter": ".metrics",
+        "Gauge": ".metrics",
+        "Histogram": ".metrics",
+        "MetricsRegistry": ".metrics",
+        "LatencyHistogram": ".run_stats",
+        "PhaseStats": ".run_stats",
+        "RunStats": ".run_stats",
+        "RunStatsCallbackHandler": ".run_stats",
+        "get_current_phase": ".run_stats",
+        "get_current_run_stats": ".run_stats",
+        "observe_phases": ".run_stats",
+        "record_tool_calls": ".run_stats",
+        "track_phase": ".run_stats",
+        "track_run_stats": ".run_stats",
+    },
+)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .run_stats import observe_phases
+
+
+def _get_track() -> Tuple[str, int]:
+    """Returns the kind and the id of the current execution track: an asyncio task or a thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return "task", id(task)
+    return "thread", threading.get_ident()
+
+
+class ChromeTraceRecorder(BaseCallbackHandler):
+    """Records a timeline of a run and exports it in Chrome trace event format (viewable in Perfetto or chrome://tracing).
+
+    Spans are recorded for chains and runnables (e.g., component invocations), LLM calls and tool calls
+    (via callbacks) and for strategy phases (via `track_phase`). Each asyncio task and each thread gets its own track,
+    so concurrent spans are shown side by side; nesting is shown within a track and via parent run ids in span args.
+
+    Usage:
+        recorder = ChromeTraceRecorder()
+        with recorder.record():
+            strategy.invoke(inputs, config={"callbacks": [recorder]})
+        recorder.save("trace.json")
+    """
+
+    # has to run in the caller's context to determine the current task/thread
+    run_inline: bool = True
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._tracks: Dict[Tuple[str, int], int] = {}
+        self._runs: Dict[UUID, Tuple[str, str, float, int, Dict[str, Any]]] = {}
+
+    def _get_tid(self) -> int:
+        track = _get_track()
+        with self._lock:
+            if track not in self._tracks:
+                self._tracks[track] = len(self._tracks) + 1
+            return self._tracks[track]
+
+    def _timestamp(self, t: float) -> float:
+        return (t - self._start) * 1e6
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        tid: Optional[int] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Adds a span; `start` and `end` are taken from `time.perf_counter`."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._timestamp(start),
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": tid if tid is not None else self._get_tid(),
+            "args": args or {},
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def _on_phase(self, name: str, start: float, end: float, error: bool) -> None:
+        self.add_span(name, "phase", start, end, args={"error": error} if error else None)
+
+    @contextmanager
+    def record(self) -> Iterator[ChromeTraceRecorder]:
+        """Records strategy phases inside the block (callbacks are recorded whenever the recorder receives them)."""
+        with observe_phases(self._on_phase):
+            yield self
+
+    # callbacks
+
+    def _on_start(
+        self,
+        name: str,
+        category: str,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        args: Dict[str, Any] = {"run_id": str(run_id)}
+        if parent_run_id is not None:
+            args["parent_run_id"] = str(parent_run_id)
+        if tags:
+            args["tags"] = tags
+        tid = self._get_tid()
+        with self._lock:
+            self._runs[run_id] = (name, category, time.perf_counter(), tid, args)
+
+    def _on_end(self, run_id: UUID, error: Optional[BaseException] = None) -> None:
+        end = time.perf_counter()
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        name, category, start, tid, args = run
+        if error is not None:
+            args["error"] = repr(error)
+        self.add_span(name, category, start, end, tid=tid, args=args)
+
+    @staticmethod
+    def _get_name(serialized: Optional[Dict[str, Any]], kwargs: Dict[str, Any], default: str) -> str:
+        if kwargs.get("name"):
+            return kwargs["name"]
+        if serialized:
+            if serialized.get("name"):
+                return serialized["name"]
+            if serialized.get("id"):
+                return serialized["id"][-1]
+        return default
+
+    def on_chain_start(
+        self, serialized: Dict[str, Any], inputs: Dict[str, Any], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._on_start(
+            self._get_name(serialized, kwargs, "chain"),
+            "chain",
+            run_id,
+            kwargs.get("parent_run_id"),
+            kwargs.get("tags"),
+        )
+
+    def on_chain_end(self, outputs: Dict[str, Any], *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id, error)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_start(
+            self._get_name(serialized, kwargs, "llm"), "llm", run_id, kwargs.get("parent_run_id"), kwargs.get("tags")
+        )
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List[Any], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._on_start(
+            self._get_name(serialized, kwargs, "chat_model"),
+            "llm",
+            run_id,
+            kwargs.get("parent_run_id"),
+            kwargs.get("tags"),
+        )
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id, error)
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_start(
+            self._get_name(serialized, kwargs, "tool"), "tool", run_id, kwargs.get("parent_run_id"), kwargs.get("tags")
+        )
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._on_end(run_id, error)
+
+    # export
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Returns the recorded spans in Chrome trace event format."""
+        with self._lock:
+            events = sorted(self._events, key=lambda event: event["ts"])
+            tracks = dict(self._tracks)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": f"{kind} {tid}"},
+            }
+            for (kind, _), tid in tracks.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
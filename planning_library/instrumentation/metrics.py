@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Generic, List, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Default upper bounds of histogram buckets (in seconds); the last implicit bucket is unbounded."""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+ChildType = TypeVar("ChildType", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(Generic[ChildType]):
+    type: str
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._children: Dict[Tuple[str, ...], ChildType] = {}
+        self._lock = threading.Lock()
+
+    def _create_child(self) -> ChildType:
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> ChildType:
+        """Returns the metric for given label values (in the order of `label_names`)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {values}.")
+            with self._lock:
+                child = self._children.setdefault(values, self._create_child())
+        return child
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape(self.description)}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(self._render_samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing counter."""
+
+    type = "counter"
+
+    def _create_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def _create_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, values)} {_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution of values over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def _create_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        bucket_label_names = self.label_names + ("le",)
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(bucket_label_names, values + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """A collection of process-level metrics that can be exposed in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different type or labels.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        """Returns a counter with a given name (creates it if it doesn't exist yet)."""
+        return self._register(Counter(name, description, label_names))  # type: ignore[return-value]
+
+    def gauge(self, name: str, description: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Returns a gauge with a given name (creates it if it doesn't exist yet)."""
+        return self._register(Gauge(name, description, label_names))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Returns a histogram with a given name (creates it if it doesn't exist yet)."""
+        return self._register(Histogram(name, description, label_names, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Returns all the metrics in Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+    def write_to_file(self, path: str | Path) -> None:
+        """Writes the metrics to a file atomically (e.g., for node exporter's textfile collector)."""
+        path = Path(path)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(f.name, path)
+
+    def start_http_server(self, port: int, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serves the metrics over HTTP in a background thread. Call `shutdown` on the returned server to stop it."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((addr, port), _Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        return server
+
+
+REGISTRY = MetricsRegistry()
+"""The default registry with the metrics of the library."""
+
+STRATEGY_RUNS = REGISTRY.counter(
+    "planning_library_strategy_runs_total",
+    "Number of strategy runs by status (success, error or stopped for streams closed before the end).",
+    ("strategy", "status"),
+)
+STRATEGY_RUN_DURATION = REGISTRY.histogram(
+    "planning_library_strategy_run_duration_seconds", "Duration of strategy runs.", ("strategy",)
+)
+COMPONENT_INVOCATIONS = REGISTRY.counter(
+    "planning_library_component_invocations_total",
+    "Number of invocations of LLM-backed components, per input for batches (not LLM calls: an invocation can make "
+    "several LLM calls, e.g., via retries or a model router, or none, e.g., when served from a cache).",
+    ("component",),
+)
+TOOL_CALL_DURATION = REGISTRY.histogram(
+    "planning_library_tool_call_duration_seconds", "Duration of tool calls made by action executors.", ("tool",)
+)
+TOOL_CALL_TIMEOUTS = REGISTRY.counter(
+    "planning_library_tool_call_timeouts_total", "Number of tool calls that have timed out.", ("tool",)
+)
+RESET_REPLAY_LENGTH = REGISTRY.histogram(
+    "planning_library_reset_replay_actions",
+    "Number of actions replayed after an environment reset.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+TOT_FRONTIER_SIZE = REGISTRY.histogram(
+    "planning_library_tot_frontier_size",
+    "Size of Tree of Thoughts frontier on each DFS step.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+TOT_NODES_CREATED = REGISTRY.counter(
+    "planning_library_tot_nodes_created_total", "Number of Tree of Thoughts nodes created.", ("kind",)
+)
+CASCADE_VERDICTS = REGISTRY.counter(
+    "planning_library_cascade_verdicts_total",
+    "Number of outputs accepted from each stage of cascade evaluators.",
+    ("stage",),
+)
+STREAMING_EARLY_STOPS = REGISTRY.counter(
+    "planning_library_streaming_early_stops_total",
+    "Number of LLM generations stopped as soon as the output parser got a result.",
+    ("parser",),
+)
+COMPONENT_CACHE_REQUESTS = REGISTRY.counter(
+    "planning_library_component_cache_requests_total",
+    "Number of calls of cached components, by result (hit, miss or bypass of the cache).",
+    ("component", "result"),
+)
+SINGLE_FLIGHT_CALLS = REGISTRY.counter(
+    "planning_library_single_flight_calls_total",
+    "Number of calls of single-flight runnables, by result (made or coalesced with an identical call in flight).",
+    ("runnable", "result"),
+)
+MICRO_BATCH_SIZE = REGISTRY.histogram(
+    "planning_library_micro_batch_size",
+    "Number of requests dispatched together by micro-batching runnables.",
+    ("runnable",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+SCHEDULER_REQUESTS = REGISTRY.counter(
+    "planning_library_scheduler_requests_total",
+    "Number of requests made through rate-limited schedulers, by priority and outcome.",
+    ("priority", "outcome"),
+)
+SCHEDULER_QUEUE_WAIT = REGISTRY.histogram(
+    "planning_library_scheduler_queue_wait_seconds",
+    "Time requests wait in rate-limited schedulers before being made.",
+    ("priority",),
+)
+SCHEDULER_CONCURRENCY_LIMIT = REGISTRY.gauge(
+    "planning_library_scheduler_concurrency_limit",
+    "Current (adaptive) limit on requests in flight of rate-limited schedulers.",
+    ("scheduler",),
+)
+ROUTER_DECISIONS = REGISTRY.counter(
+    "planning_library_router_decisions_total",
+    "Number of replies of each model of model routers, by decision (accepted or escalated to the next model).",
+    ("router", "model", "decision"),
+)
+ROUTER_COST = REGISTRY.counter(
+    "planning_library_router_cost_total",
+    "Cost of calls made by model routers (tokens times the cost of a token of a model).",
+    ("router", "model"),
+)
+SELF_CONSISTENCY_VOTES = REGISTRY.counter(
+    "planning_library_self_consistency_votes_total",
+    "Number of votes of self-consistency evaluators: used for the verdict, cancelled in flight, abandoned "
+    "(left running in the background after an error in a sync call) or never requested.",
+    ("outcome",),
+)
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Upper bounds (in seconds) of latency histogram buckets; the last implicit bucket is unbounded."""
+
+UNKNOWN_PHASE = "other"
+"""The phase for the events that happen outside of any tracked phase."""
+
+
+@dataclass
+class LatencyHistogram:
+    """Latency histogram with fixed buckets.
+
+    Args:
+        buckets: Upper bounds (in seconds) of the buckets; the last implicit bucket is unbounded.
+        counts: The number of observations in each bucket (including the unbounded one).
+    """
+
+    buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates a given quantile as the upper bound of the bucket it falls into."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max) if self.max is not None else bound
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(bound): count for bound, count in zip(self.buckets + (float("inf"),), self.counts)},
+        }
+
+
+@dataclass
+class PhaseStats:
+    """Statistics for a single phase of a run (e.g., thought generation in Tree of Thoughts).
+
+    Args:
+        calls: The number of times the phase has been entered.
+        errors: The number of times the phase has finished with an exception.
+        llm_calls: The number of LLM calls made inside the phase.
+        prompt_tokens: The number of prompt tokens used by LLM calls inside the phase (if reported by LLM).
+        completion_tokens: The number of completion tokens used by LLM calls inside the phase (if reported by LLM).
+        tool_calls: The number of tool calls made inside the phase.
+        latency: Histogram of the phase durations.
+        llm_latency: Histogram of the durations of LLM calls made inside the phase.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    tool_calls: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    llm_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "tool_calls": self.tool_calls,
+            "latency": self.latency.to_dict(),
+            "llm_latency": self.llm_latency.to_dict(),
+        }
+
+
+class RunStats:
+    """Statistics for a single run of a strategy, grouped by phases.
+
+    Phases are tracked via `track_phase`; LLM calls and tokens are collected via `callback_handler`,
+    which has to receive the callbacks of the run.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, PhaseStats] = {}
+        self.wall_time: Optional[float] = None
+        self._lock = threading.Lock()
+        self.callback_handler = RunStatsCallbackHandler(self)
+
+    def phase(self, name: str) -> PhaseStats:
+        if name not in self.phases:
+            self.phases[name] = PhaseStats()
+        return self.phases[name]
+
+    def record_phase(self, name: str, duration: float, error: bool = False) -> None:
+        with self._lock:
+            stats = self.phase(name)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.latency.observe(duration)
+
+    def record_tool_calls(self, name: str, num_calls: int = 1) -> None:
+        with self._lock:
+            self.phase(name).tool_calls += num_calls
+
+    def record_llm_call(self, name: str, duration: float, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        with self._lock:
+            stats = self.phase(name)
+            stats.llm_calls += 1
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.llm_latency.observe(duration)
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        """Counters summed over all phases."""
+        return {
+            "llm_calls": sum(stats.llm_calls for stats in self.phases.values()),
+            "prompt_tokens": sum(stats.prompt_tokens for stats in self.phases.values()),
+            "completion_tokens": sum(stats.completion_tokens for stats in self.phases.values()),
+            "total_tokens": sum(stats.total_tokens for stats in self.phases.values()),
+            "tool_calls": sum(stats.tool_calls for stats in self.phases.values()),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_time": self.wall_time,
+            "totals": self.totals,
+            "phases": {name: stats.to_dict() for name, stats in self.phases.items()},
+        }
+
+    def __repr__(self) -> str:
+        return f"RunStats(wall_time={self.wall_time}, totals={self.totals}, phases={list(self.phases)})"
+
+
+PhaseObserver = Callable[[str, float, float, bool], None]
+"""A callable that is notified about each finished phase: accepts its name, start and end time
+(from `time.perf_counter`) and whether it has finished with an exception."""
+
+_run_stats_var: contextvars.ContextVar[Optional[RunStats]] = contextvars.ContextVar("run_stats", default=None)
+_phase_var: contextvars.ContextVar[str] = contextvars.ContextVar("run_stats_phase", default=UNKNOWN_PHASE)
+_phase_observers_var: contextvars.ContextVar[Tuple[PhaseObserver, ...]] = contextvars.ContextVar(
+    "run_stats_phase_observers", default=()
+)
+
+
+def get_current_run_stats() -> Optional[RunStats]:
+    """Returns the statistics of the current run or None if statistics are not being collected."""
+    return _run_stats_var.get()
+
+
+def get_current_phase() -> str:
+    return _phase_var.get()
+
+
+@contextmanager
+def track_run_stats(stats: Optional[RunStats] = None) -> Iterator[RunStats]:
+    """Collects statistics for all the phases inside the block.
+
+    Note that LLM calls are only counted when `stats.callback_handler` receives the callbacks of the run.
+    """
+    stats = stats if stats is not None else RunStats()
+    token = _run_stats_var.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.wall_time = (stats.wall_time or 0.0) + time.perf_counter() - start
+        _run_stats_var.reset(token)
+
+
+@contextmanager
+def observe_phases(observer: PhaseObserver) -> Iterator[None]:
+    """Notifies a given observer about all the phases finished inside the block (e.g., to record them on a timeline)."""
+    token = _phase_observers_var.set(_phase_observers_var.get() + (observer,))
+    try:
+        yield
+    finally:
+        _phase_observers_var.reset(token)
+
+
+@contextmanager
+def track_phase(name: str) -> Iterator[None]:
+    """Attributes everything inside the block to a given phase.
+    It's a no-op when statistics are not being collected and phases are not being observed.
+
+    Phases can be nested: events are attributed to the innermost phase, and durations are recorded for all of them.
+    """
+    stats = _run_stats_var.get()
+    observers = _phase_observers_var.get()
+    if stats is None and not observers:
+        yield
+        return
+
+    token = _phase_var.set(name)
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        _phase_var.reset(token)
+        end = time.perf_counter()
+        if stats is not None:
+            stats.record_phase(name, end - start, error=error)
+        for observer in observers:
+            observer(name, start, end, error)
+
+
+def record_tool_calls(num_calls: int = 1) -> None:
+    """Records tool calls in the current phase. It's a no-op when statistics are not being collected."""
+    stats = _run_stats_var.get()
+    if stats is not None:
+        stats.record_tool_calls(_phase_var.get(), num_calls)
+
+
+class RunStatsCallbackHandler(BaseCallbackHandler):
+    """Counts LLM calls and tokens and attributes them to the phase that was current when a call started."""
+
+    # has to run in the caller's context to see the current phase
+    run_inline: bool = True
+
+    def __init__(self, stats: RunStats):
+        self.stats = stats
+        self._runs: Dict[UUID, Tuple[str, float]] = {}
+
+    def _on_start(self, run_id: UUID, parent_run_id: Optional[UUID] = None) -> None:
+        # an LLM call made inside another one (e.g., by a model router) is counted instead of the wrapping call
+        if parent_run_id is not None:
+            self._runs.pop(parent_run_id, None)
+        self._runs[run_id] = (_phase_var.get(), time.perf_counter())
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._on_start(run_id, parent_run_id)
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._on_start(run_id, parent_run_id)
+
+    @staticmethod
+    def _get_token_usage(response: LLMResult) -> Tuple[int, int]:
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        if token_usage:
+            return token_usage.get("prompt_tokens", 0) or 0, token_usage.get("completion_tokens", 0) or 0
+
+        prompt_tokens, completion_tokens = 0, 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+        return prompt_tokens, completion_tokens
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        if run_id not in self._runs:
+            return
+        phase, start = self._runs.pop(run_id)
+        prompt_tokens, completion_tokens = self._get_token_usage(response)
+        self.stats.record_llm_call(phase, time.perf_counter() - start, prompt_tokens, completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        if run_id not in self._runs:
+            return
+        phase, start = self._runs.pop(run_id)
+        self.stats.record_llm_call(phase, time.perf_counter() - start)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManager,
+    AsyncCallbackManagerForLLMRun,
+    BaseCallbackManager,
+    CallbackManager,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableConfig
+
+from ..instrumentation.metrics import ROUTER_COST, ROUTER_DECISIONS
+
+
+def _get_child_callbacks(
+    run_manager: Optional[CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun],
+) -> Optional[BaseCallbackManager]:
+    """Returns callbacks for calls made inside an LLM call (LLM run managers have no `get_child`)."""
+    if run_manager is None:
+        return None
+    manager_cls = AsyncCallbackManager if isinstance(run_manager, AsyncCallbackManagerForLLMRun) else CallbackManager
+    manager = manager_cls(handlers=[], parent_run_id=run_manager.run_id)
+    manager.set_handlers(run_manager.inheritable_handlers)
+    manager.add_tags(run_manager.inheritable_tags)
+    manager.add_metadata(run_manager.inheritable_metadata)
+    return manager
+
+
+def near_threshold(threshold: float, margin: float) -> Callable[[float], bool]:
+    """Returns a function that tells whether a score is borderline, i.e., closer to the threshold than `margin`."""
+    return lambda score: abs(score - threshold) < margin
+
+
+class ModelRouter(BaseChatModel):
+    """Chat model that routes each call through models ordered from the cheapest to the most capable one:
+    the reply of a model is accepted unless it fails to parse or `should_escalate` says it's not reliable
+    (e.g., a borderline score), in which case the next model is called. The reply of the last model is always
+    accepted, so parsing errors are raised by the component's own output parser as usual.
+
+    It can be passed as `llm` to any component config, e.g., a small model for `ThoughtEvaluator`
+    and `ThoughtSorter` that escalates to a larger one when a verdict is borderline or can't be parsed.
+
+    Decisions and costs of each model are recorded in `planning_library_router_decisions_total`
+    and `planning_library_router_cost_total` metrics. Callback handlers see the calls of each model
+    as children of the router's call; the router's call reports the token usage summed over them.
+
+    Args:
+        models: Models in the order of escalation.
+        output_parser: Parser applied to replies to decide on escalation.
+        should_escalate: Function of a parsed reply that returns True when the next model should be called.
+          By default, only replies that fail to parse are escalated.
+        costs: Costs of a single token for each model; a cost of a call is its total number of tokens
+          times the cost of a token. By default, each token costs 1.
+        model_names: Names of the models used in metrics. By default, `model_name` or the type of a model is used.
+        router_name: Name used in metrics.
+    """
+
+    models: List[BaseChatModel]
+    output_parser: BaseOutputParser
+    should_escalate: Optional[Callable[[Any], bool]] = None
+    costs: Optional[List[float]] = None
+    model_names: Optional[List[str]] = None
+    router_name: str = "router"
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        if not self.models:
+            raise ValueError("At least one model must be provided to ModelRouter.")
+        if self.costs is not None and len(self.costs) != len(self.models):
+            raise ValueError(f"Expected {len(self.models)} costs (one for each model), got {len(self.costs)}.")
+        if self.model_names is not None and len(self.model_names) != len(self.models):
+            raise ValueError(f"Expected {len(self.models)} model names, got {len(self.model_names)}.")
+
+    @property
+    def _llm_type(self) -> str:
+        return "model-router"
+
+    def _model_name(self, model_idx: int) -> str:
+        if self.model_names is not None:
+            return self.model_names[model_idx]
+        model = self.models[model_idx]
+        return getattr(model, "model_name", None) or model._llm_type
+
+    @staticmethod
+    def _get_token_usage(message: BaseMessage) -> Dict[str, int]:
+        token_usage = message.response_metadata.get("token_usage") or {}
+        usage_metadata = getattr(message, "usage_metadata", None) or {}
+        if not token_usage and usage_metadata:
+            token_usage = {
+                "prompt_tokens": usage_metadata.get("input_tokens", 0),
+                "completion_tokens": usage_metadata.get("output_tokens", 0),
+                "total_tokens": usage_metadata.get("total_tokens", 0),
+            }
+        return {key: value for key, value in token_usage.items() if isinstance(value, int)}
+
+    def _decide(self, model_idx: int, message: BaseMessage) -> bool:
+        """Records the cost of a model call and decides whether the reply should be escalated."""
+        model_name = self._model_name(model_idx)
+        cost = self.costs[model_idx] if self.costs is not None else 1.0
+        ROUTER_COST.labels(self.router_name, model_name).inc(
+            cost * self._get_token_usage(message).get("total_tokens", 0)
+        )
+
+        if model_idx == len(self.models) - 1:
+            ROUTER_DECISIONS.labels(self.router_name, model_name, "accepted").inc()
+            return False
+
+        try:
+            parsed = self.output_parser.parse(str(message.content))
+        except OutputParserException:
+            ROUTER_DECISIONS.labels(self.router_name, model_name, "escalated_parse_error").inc()
+            return True
+
+        if self.should_escalate is not None and self.should_escalate(parsed):
+            ROUTER_DECISIONS.labels(self.router_name, model_name, "escalated_borderline").inc()
+            return True
+
+        ROUTER_DECISIONS.labels(self.router_name, model_name, "accepted").inc()
+        return False
+
+    def _make_result(self, model_idx: int, replies: List[BaseMessage]) -> ChatResult:
+        token_usage: Dict[str, int] = {}
+        for reply in replies:
+            for key, value in self._get_token_usage(reply).items():
+                token_usage[key] = token_usage.get(key, 0) + value
+
+        model_name = self._model_name(model_idx)
+        return ChatResult(
+            generations=[ChatGeneration(message=replies[-1], generation_info={"routed_to": model_name})],
+            llm_output={"token_usage": token_usage, "model_name": model_name, "num_attempts": len(replies)},
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # calls of the models are reported as children of the router's call
+        config = RunnableConfig(callbacks=_get_child_callbacks(run_manager))
+        replies: List[BaseMessage] = []
+        for model_idx, model in enumerate(self.models):
+            replies.append(model.invoke(messages, config, stop=stop, **kwargs))
+            if not self._decide(model_idx, replies[-1]):
+                break
+        return self._make_result(model_idx, replies)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # calls of the models are reported as children of the router's call
+        config = RunnableConfig(callbacks=_get_child_callbacks(run_manager))
+        replies: List[BaseMessage] = []
+        for model_idx, model in enumerate(self.models):
+            replies.append(await model.ainvoke(messages, config, stop=stop, **kwargs))
+            if not self._decide(model_idx, replies[-1]):
+                break
+        return self._make_result(model_idx, replies)
@@ -1,3 +1,4 @@
-from .evaluation_output_parser import SimpleEvaluateOutputParser
+from .evaluation_output_parser import SimpleEvaluateOutputParser, SimpleSortOutputParser
+from .streaming_output_parser import StreamingOutputParser
 
-__all__ = ["SimpleEvaluateOutputParser"]
+__all__ = ["SimpleEvaluateOutputParser", "SimpleSortOutputParser", "StreamingOutputParser"]
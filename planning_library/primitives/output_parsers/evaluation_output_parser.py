@@ -1,15 +1,18 @@
 import re
+from typing import Optional
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import BaseOutputParser
 
+_PATTERN = re.compile(r"\[\[(.*?)\]\]")
+
 
 class SimpleEvaluateOutputParser(BaseOutputParser[float]):
     """Searches for a pattern [[number]] and return the number."""
 
     def parse(self, text: str) -> float:
         try:
-            match = re.search(r"\[\[(.*?)\]\]", text.strip())
+            match = _PATTERN.search(text.strip())
             if not match:
                 raise ValueError("Pattern [[number]] not found.")
             result = float(match.groups()[0])
@@ -18,3 +21,38 @@ class SimpleEvaluateOutputParser(BaseOutputParser[float]):
             return result
         except ValueError:
             raise OutputParserException(f"Couldn't convert {text} to float between 0 and 1.")
+
+    def parse_partial(self, text: str) -> Optional[float]:
+        """Parses a prefix of the output: returns None while the pattern [[number]] is incomplete,
+        the same result as `parse` on the full output otherwise (further text doesn't change it)."""
+        if not _PATTERN.search(text):
+            return None
+        return self.parse(text)
+
+
+class SimpleSortOutputParser(BaseOutputParser[str]):
+    """Searches for a pattern [[1]] or [[2]] (the better of two compared options) and returns the number as a string.
+
+    Other verdicts (e.g., [[0]] or a missing pattern) are returned as an empty string, which ThoughtSorter
+    counts as a tie, so a single malformed comparison doesn't abort the whole run.
+
+    Args:
+        strict: If True, other verdicts raise OutputParserException instead (e.g., to escalate them in ModelRouter).
+    """
+
+    strict: bool = False
+
+    def parse(self, text: str) -> str:
+        match = _PATTERN.search(text.strip())
+        if not match or match.groups()[0].strip() not in ("1", "2"):
+            if self.strict:
+                raise OutputParserException(f"Couldn't find [[1]] or [[2]] in {text}.")
+            return ""
+        return match.groups()[0].strip()
+
+    def parse_partial(self, text: str) -> Optional[str]:
+        """Parses a prefix of the output: returns None while the pattern [[number]] is incomplete,
+        the same result as `parse` on the full output otherwise (further text doesn't change it)."""
+        if not _PATTERN.search(text):
+            return None
+        return self.parse(text)
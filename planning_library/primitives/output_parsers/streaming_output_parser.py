@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Any, Generic, Optional, TypeVar
+
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from ...instrumentation.metrics import STREAMING_EARLY_STOPS
+
+T = TypeVar("T")
+
+
+class StreamingOutputParser(Generic[T], Runnable[LanguageModelInput, T]):
+    """Calls an LLM in a streaming mode and parses its output incrementally: as soon as the output parser
+    gets a result from the text generated so far, the generation is stopped (the stream is closed,
+    so the remaining tokens are never requested).
+
+    It replaces `llm | output_parser` in a chain, e.g., `prompt | StreamingOutputParser(llm, output_parser)`.
+
+    Note:
+        LLM runs stopped early are reported to callback handlers as errors (`GeneratorExit`).
+
+    Args:
+        llm: The LLM to call. Models without streaming support return the whole output at once.
+        output_parser: The output parser. It must implement `parse_partial(text)` which returns None
+          until a prefix of the output is enough for the final result.
+    """
+
+    def __init__(self, llm: BaseChatModel, output_parser: BaseOutputParser[T]):
+        if not callable(getattr(output_parser, "parse_partial", None)):
+            raise ValueError(f"{type(output_parser).__name__} doesn't support parsing partial outputs.")
+        self.llm = llm
+        self.output_parser = output_parser
+
+    def _parse_partial(self, text: str) -> Optional[T]:
+        result = self.output_parser.parse_partial(text)  # type: ignore[attr-defined]
+        if result is not None:
+            STREAMING_EARLY_STOPS.labels(type(self.output_parser).__name__).inc()
+        return result
+
+    def invoke(self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any) -> T:
+        text = ""
+        stream = self.llm.stream(input, config, **kwargs)
+        try:
+            for chunk in stream:
+                text += str(chunk.content)
+                result = self._parse_partial(text)
+                if result is not None:
+                    return result
+        finally:
+            stream.close()  # type: ignore[attr-defined]
+        return self.output_parser.parse(text)
+
+    async def ainvoke(self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any) -> T:
+        text = ""
+        stream = self.llm.astream(input, config, **kwargs)
+        try:
+            async for chunk in stream:
+                text += str(chunk.content)
+                result = self._parse_partial(text)
+                if result is not None:
+                    return result
+        finally:
+            # unlike sync generators, async ones are not closed when the loop is left
+            await stream.aclose()  # type: ignore[attr-defined]
+        return self.output_parser.parse(text)
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .batch_runner import BatchTaskResult, arelease, arun_batch
+    from .dataset_runner import load_results, run_dataset
+
+__all__ = [
+    "BatchTaskResult",
+    "arun_batch",
+    "arelease",
+    "run_dataset",
+    "load_results",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchTaskResult": ".batch_runner",
+        "arelease": ".batch_runner",
+        "arun_batch": ".batch_runner",
+        "load_results": ".dataset_runner",
+        "run_dataset": ".dataset_runner",
+    },
+)
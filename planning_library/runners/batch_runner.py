@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, Type
+
+
+@dataclass
+class BatchTaskResult:
+    """A result of a single task from a batch run.
+
+    Args:
+        index: The position of the task in the inputs.
+        inputs: The inputs of the task.
+        outputs: The outputs of the task (None if the task has failed).
+        error: The exception raised on the last attempt (None if the task has succeeded).
+        num_attempts: The number of attempts made.
+    """
+
+    index: int
+    inputs: Dict[str, Any]
+    outputs: Optional[Any] = None
+    error: Optional[BaseException] = None
+    num_attempts: int = 0
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+async def _run_task(
+    index: int,
+    inputs: Dict[str, Any],
+    run_task: Callable[[Dict[str, Any]], Awaitable[Any]],
+    max_retries: int,
+    retry_on: Tuple[Type[Exception], ...],
+    retry_delay: float,
+    max_retry_delay: float,
+) -> BatchTaskResult:
+    result = BatchTaskResult(index=index, inputs=inputs)
+    while True:
+        result.num_attempts += 1
+        try:
+            result.outputs = await run_task(inputs)
+            result.error = None
+            return result
+        except retry_on as e:
+            result.error = e
+        except Exception as e:
+            result.error = e
+            return result
+
+        if result.num_attempts > max_retries:
+            return result
+        await asyncio.sleep(retry_backoff(result.num_attempts, retry_delay, max_retry_delay))
+
+
+def retry_backoff(num_attempts: int, retry_delay: float, max_retry_delay: float) -> float:
+    """Returns the delay before the next retry: exponential backoff with jitter, so that tasks failed at the same
+    time (e.g., on a rate limit) don't retry at the same time. The delay is drawn from [d / 2, d],
+    where d = min(max_retry_delay, retry_delay * 2 ** (num_attempts - 1))."""
+    delay = min(max_retry_delay, retry_delay * 2 ** (num_attempts - 1))
+    return random.uniform(delay / 2, delay)
+
+
+async def arun_batch(
+    inputs: Iterable[Dict[str, Any]],
+    run_task: Callable[[Dict[str, Any]], Awaitable[Any]],
+    max_concurrency: int = 8,
+    max_retries: int = 0,
+    retry_on: Tuple[Type[Exception], ...] = (Exception,),
+    retry_delay: float = 1.0,
+    max_retry_delay: float = 60.0,
+) -> AsyncIterator[BatchTaskResult]:
+    """Runs a task for each of the inputs with bounded concurrency and yields the results as soon as they complete.
+
+    Inputs are consumed lazily, so at most `max_concurrency` tasks exist at any moment. Failures are isolated:
+    an exception in one task is retried (if allowed) and then reported in its result without affecting the others.
+    If the consumer stops early, pending tasks are cancelled.
+
+    Args:
+        inputs: The inputs for the tasks.
+        run_task: An asynchronous function that runs a single task and returns its outputs.
+        max_concurrency: The maximum number of tasks running at the same time.
+        max_retries: The maximum number of retries for a single task.
+        retry_on: The exceptions that should be retried; other exceptions fail the task immediately.
+        retry_delay: The delay before the first retry (in seconds); it's doubled for each next retry
+          and randomized (see `retry_backoff`).
+        max_retry_delay: The maximum delay before a retry (in seconds).
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency should be positive.")
+
+    inputs_iterator = enumerate(inputs)
+    pending: Set[asyncio.Task] = set()
+
+    def _fill() -> None:
+        while len(pending) < max_concurrency:
+            try:
+                index, task_inputs = next(inputs_iterator)
+            except StopIteration:
+                return
+            pending.add(
+                asyncio.create_task(
+                    _run_task(index, task_inputs, run_task, max_retries, retry_on, retry_delay, max_retry_delay)
+                )
+            )
+
+    try:
+        _fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            _fill()
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def arelease(obj: Any) -> None:
+    """Releases the resources of a per-task object (e.g., stops a worker process of an action executor)."""
+    close = getattr(obj, "aclose", None) or getattr(obj, "close", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
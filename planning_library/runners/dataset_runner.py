@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.load.dump import dumpd
+
+from .batch_runner import BatchTaskResult, arun_batch
+
+TaskRunner = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def load_results(output_dir: str | Path) -> Dict[str, Dict[str, Any]]:
+    """Loads the results written by `run_dataset` from all JSONL files in a given directory.
+
+    If a task has several records (e.g., it has failed and then has been rerun), a successful one takes precedence.
+    Lines that can't be parsed (e.g., the last line written before a crash) are skipped.
+
+    Returns:
+        Mapping from task ids to the records.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(Path(output_dir).glob("*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                task_id = record["task_id"]
+                if task_id not in results or results[task_id]["error"] is not None:
+                    results[task_id] = record
+    return results
+
+
+def _to_record(task_id: str, result: BatchTaskResult) -> Dict[str, Any]:
+    return {
+        "task_id": task_id,
+        "inputs": dumpd(result.inputs),
+        "outputs": dumpd(result.outputs) if result.is_successful else None,
+        "error": None if result.is_successful else repr(result.error),
+        "num_attempts": result.num_attempts,
+    }
+
+
+def _truncate_partial_line(path: Path, block_size: int = 65536) -> None:
+    """Removes an incomplete last line (e.g., written before a crash), so new records start on a line of their own."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            block = f.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            f.truncate(position)
+
+
+async def _arun_shard(
+    tasks: List[Tuple[str, Dict[str, Any]]],
+    run_task: TaskRunner,
+    output_path: Path,
+    max_concurrency: int,
+    max_retries: int,
+) -> None:
+    _truncate_partial_line(output_path)
+    with open(output_path, "a", encoding="utf-8") as f:
+        async for result in arun_batch(
+            (inputs for _, inputs in tasks),
+            run_task,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+        ):
+            f.write(json.dumps(_to_record(tasks[result.index][0], result)) + "\n")
+            # makes sure that finished tasks survive a crash of the worker (or the whole machine)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _run_shard(
+    tasks: List[Tuple[str, Dict[str, Any]]],
+    create_task_runner: Callable[[], TaskRunner],
+    output_path: Path,
+    max_concurrency: int,
+    max_retries: int,
+) -> None:
+    """Main function of a worker process: creates its own task runner (e.g., strategy and environment) and runs the tasks."""
+    run_task = create_task_runner()
+    asyncio.run(_arun_shard(tasks, run_task, output_path, max_concurrency, max_retries))
+
+
+def run_dataset(
+    tasks: Sequence[Dict[str, Any]],
+    create_task_runner: Callable[[], TaskRunner],
+    output_dir: str | Path,
+    task_ids: Optional[Sequence[str]] = None,
+    num_workers: Optional[int] = None,
+    max_concurrency: int = 8,
+    max_retries: int = 0,
+    start_method: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Runs tasks from a dataset in several worker processes and writes the results to JSONL files.
+
+    Tasks are split into shards (one per worker process). Each worker creates its own task runner via
+    `create_task_runner` (so strategies and environments are not shared between processes), runs its shard with
+    `arun_batch` and appends a record to its own JSONL file as soon as a task finishes. Tasks that have already
+    been completed successfully in `output_dir` are skipped, so an interrupted run can be resumed by calling
+    this function again with the same arguments.
+
+    Note:
+        * `create_task_runner` has to be picklable (e.g., a top-level function or a `functools.partial` of one);
+        * the returned task runner is an asynchronous function that accepts the inputs of a task
+          and returns its outputs (e.g., `strategy.ainvoke`);
+        * tasks have to be picklable, and tasks and outputs have to be serializable with `dumpd`.
+
+    Args:
+        tasks: The inputs for the tasks.
+        create_task_runner: Creates a task runner inside a worker process.
+        output_dir: The directory to write the results to.
+        task_ids: Unique ids of the tasks used to determine the completed ones. If None, positions in `tasks` are used.
+        num_workers: The number of worker processes. If None, the number of CPUs is used.
+        max_concurrency: The maximum number of tasks running at the same time in each worker.
+        max_retries: The maximum number of retries for a single task.
+        start_method: Multiprocessing start method (`spawn`, `fork` or `forkserver`). If None, the default one is used.
+
+    Returns:
+        Mapping from task ids to the records (see `load_results`).
+    """
+    if task_ids is None:
+        task_ids = [str(i) for i in range(len(tasks))]
+    if len(task_ids) != len(tasks):
+        raise ValueError(f"Expected {len(tasks)} task ids, got {len(task_ids)}.")
+    if len(set(task_ids)) != len(task_ids):
+        raise ValueError("Task ids should be unique.")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    completed = {task_id for task_id, record in load_results(output_dir).items() if record["error"] is None}
+    remaining = [(task_id, inputs) for task_id, inputs in zip(task_ids, tasks) if task_id not in completed]
+
+    num_workers = min(num_workers or os.cpu_count() or 1, len(remaining))
+    shards = [remaining[i::num_workers] for i in range(num_workers)]
+
+    context = multiprocessing.get_context(start_method)
+    processes = [
+        context.Process(  # type: ignore[attr-defined]
+            target=_run_shard,
+            args=(shard, create_task_runner, output_dir / f"shard-{i}.jsonl", max_concurrency, max_retries),
+        )
+        for i, shard in enumerate(shards)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    failed_workers = [i for i, process in enumerate(processes) if process.exitcode != 0]
+    if failed_workers:
+        raise RuntimeError(
+            f"Worker processes for shards {failed_workers} have exited with an error; "
+            "completed tasks are saved, rerun to resume."
+        )
+
+    return load_results(output_dir)
@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .micro_batching import MicroBatchingRunnable
+    from .rate_limited_scheduler import (
+        PRIORITY_HIGH,
+        PRIORITY_LOW,
+        PRIORITY_NORMAL,
+        RateLimitedScheduler,
+        ScheduledRunnable,
+        request_priority,
+    )
+    from .single_flight import SingleFlightRunnable
+
+__all__ = [
+    "MicroBatchingRunnable",
+    "PRIORITY_HIGH",
+    "PRIORITY_LOW",
+    "PRIORITY_NORMAL",
+    "RateLimitedScheduler",
+    "ScheduledRunnable",
+    "request_priority",
+    "SingleFlightRunnable",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MicroBatchingRunnable": ".micro_batching",
+        "PRIORITY_HIGH": ".rate_limited_scheduler",
+        "PRIORITY_LOW": ".rate_limited_scheduler",
+        "PRIORITY_NORMAL": ".rate_limited_scheduler",
+        "RateLimitedScheduler": ".rate_limited_scheduler",
+        "ScheduledRunnable": ".rate_limited_scheduler",
+        "request_priority": ".rate_limited_scheduler",
+        "SingleFlightRunnable": ".single_flight",
+    },
+)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from ..components.caching.hashing import canonical_hash
+from ..instrumentation.metrics import MICRO_BATCH_SIZE
+
+
+class _Request:
+    def __init__(self, input: Any, config: Optional[RunnableConfig], future: Union[Future, asyncio.Future]):
+        self.input = input
+        self.config = config
+        self.future = future
+
+
+class _Batch:
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.kwargs = kwargs
+        self.requests: List[_Request] = []
+        self.full = threading.Event()
+
+
+class MicroBatchingRunnable(Runnable[Any, Any]):
+    """Wraps a runnable (usually an LLM) so that calls made at about the same time are dispatched together
+    via `batch`/`abatch` of the runnable: requests are collected for up to `max_wait` seconds after the first
+    one or until `max_batch_size` of them are collected, then the results are fanned back to the callers.
+
+    It pays off for runnables that process batches more efficiently than separate calls (e.g., self-hosted
+    model servers) when shared by many concurrent strategy runs. A longer window and a larger batch size
+    trade latency for throughput.
+
+    Only calls with the same keyword arguments (e.g., tools bound via `bind`) are batched together.
+    Each request keeps its own config, so callback handlers of each caller see its own call.
+
+    Args:
+        runnable: The runnable to wrap.
+        max_batch_size: Maximum number of requests in a batch.
+        max_wait: Maximum time to wait for more requests after the first one (in seconds).
+        name: Name used in metrics.
+    """
+
+    def __init__(
+        self, runnable: Runnable, max_batch_size: int = 8, max_wait: float = 0.01, name: str = "micro_batching"
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"`max_batch_size` should be positive, got {max_batch_size}.")
+        if max_wait < 0:
+            raise ValueError(f"`max_wait` should be non-negative, got {max_wait}.")
+        self.runnable = runnable
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+        self._lock = threading.Lock()
+        self._batches: Dict[str, _Batch] = {}
+        self._async_batches: Dict[Tuple[int, str], _Batch] = {}
+        self._tasks: Set[asyncio.Future] = set()
+
+    def _key(self, kwargs: Dict[str, Any]) -> Optional[str]:
+        try:
+            return canonical_hash(kwargs)
+        except TypeError:
+            return None
+
+    def _observe(self, batch: _Batch) -> None:
+        MICRO_BATCH_SIZE.labels(self.name or type(self).__name__).observe(len(batch.requests))
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        key = self._key(kwargs)
+        if key is None or self.max_batch_size == 1:
+            return self.runnable.invoke(input, config, **kwargs)
+
+        request = _Request(input, config, Future())
+        with self._lock:
+            batch = self._batches.get(key)
+            is_dispatcher = batch is None
+            if batch is None:
+                batch = self._batches[key] = _Batch(kwargs)
+            batch.requests.append(request)
+            if len(batch.requests) >= self.max_batch_size:
+                # no more requests are accepted into a full batch
+                del self._batches[key]
+                batch.full.set()
+
+        if is_dispatcher:
+            # the first caller waits for the window to close and dispatches the whole batch
+            batch.full.wait(self.max_wait)
+            with self._lock:
+                if self._batches.get(key) is batch:
+                    del self._batches[key]
+            self._dispatch(batch)
+        return request.future.result()
+
+    def _dispatch(self, batch: _Batch) -> None:
+        self._observe(batch)
+        try:
+            outputs = self.runnable.batch(
+                [request.input for request in batch.requests],
+                [request.config or {} for request in batch.requests],
+                return_exceptions=True,
+                **batch.kwargs,
+            )
+        except BaseException as e:
+            outputs = [e] * len(batch.requests)
+        for request, output in zip(batch.requests, outputs):
+            if isinstance(output, BaseException):
+                request.future.set_exception(output)
+            else:
+                request.future.set_result(output)
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        key = self._key(kwargs)
+        if key is None or self.max_batch_size == 1:
+            return await self.runnable.ainvoke(input, config, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        # futures are bound to event loops, so requests are only batched within a loop
+        loop_key = (id(loop), key)
+        future = loop.create_future()
+        request = _Request(input, config, future)
+        batch = self._async_batches.get(loop_key)
+        if batch is None:
+            batch = self._async_batches[loop_key] = _Batch(kwargs)
+            loop.call_later(self.max_wait, self._close_async_batch, loop_key, batch)
+        batch.requests.append(request)
+        if len(batch.requests) >= self.max_batch_size:
+            self._close_async_batch(loop_key, batch)
+        return await future
+
+    def _close_async_batch(self, loop_key: Tuple[int, str], batch: _Batch) -> None:
+        if self._async_batches.get(loop_key) is not batch:
+            # already dispatched because it got full
+            return
+        del self._async_batches[loop_key]
+        task = asyncio.ensure_future(self._adispatch(batch))
+        # the event loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _adispatch(self, batch: _Batch) -> None:
+        # requests cancelled by their callers while waiting are not sent
+        requests = [request for request in batch.requests if not request.future.done()]
+        if not requests:
+            return
+        batch.requests = requests
+        self._observe(batch)
+        try:
+            outputs = await self.runnable.abatch(
+                [request.input for request in requests],
+                [request.config or {} for request in requests],
+                return_exceptions=True,
+                **batch.kwargs,
+            )
+        except BaseException as e:
+            outputs = [e] * len(requests)
+        for request, output in zip(requests, outputs):
+            if request.future.done():
+                continue
+            if isinstance(output, BaseException):
+                request.future.set_exception(output)
+            else:
+                request.future.set_result(output)
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from ..instrumentation.metrics import SCHEDULER_CONCURRENCY_LIMIT, SCHEDULER_QUEUE_WAIT, SCHEDULER_REQUESTS
+
+# lower values are served first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+_priority_var: ContextVar[Optional[int]] = ContextVar("planning_library_request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Sets the priority of all the scheduled requests made inside the block, overriding the default priority
+    of scheduled runnables (e.g., to let a nearly finished run go before new ones)."""
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def estimate_tokens(input: Any) -> int:
+    """Rough estimate of the number of tokens in a request: a token per 4 characters of its text."""
+    if hasattr(input, "to_string"):
+        input = input.to_string()
+    return max(1, len(str(input)) // 4)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Checks whether an error comes from a provider's rate limit (HTTP 429)."""
+    status_code = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status_code == 429 or "ratelimit" in type(error).__name__.lower() or "rate limit" in str(error).lower()
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        if per_minute <= 0:
+            raise ValueError(f"Rate limits should be positive, got {per_minute}.")
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Returns the time until a given amount is available (requests larger than the capacity
+        go through when the bucket is full)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        # can go below zero, e.g., when actual usage exceeds an estimate
+        self.tokens -= amount
+
+
+class _Waiter:
+    def __init__(self, priority: int, num_tokens: int, notify: Callable[[], None]):
+        self.priority = priority
+        self.num_tokens = num_tokens
+        self.notify = notify
+        self.granted = False
+        self.cancelled = False
+        self.enqueued = time.perf_counter()
+
+
+class RateLimitedScheduler:
+    """Scheduler shared by all the LLM calls of a process (or a group of strategy runs) that keeps them
+    within provider rate limits. Wrap component runnables (usually LLMs) with `wrap` to schedule their calls.
+
+    * Rate limits: token buckets on requests and on tokens per minute. Token usage of a request is estimated
+      before the call and corrected after it when the output reports the actual usage.
+    * Priorities: waiting requests are served in the order of priority (lower values first), then in the order
+      of arrival; a priority can be set per wrapped runnable or per block of code (see `request_priority`).
+    * Adaptive concurrency (AIMD): the limit on requests in flight grows by `additive_increase / limit` after
+      each successful request and is multiplied by `multiplicative_decrease` after a rate limit error or
+      a request slower than `target_latency` (at most once per `decrease_cooldown` seconds).
+      A rate limit error also empties the request bucket, so the following requests wait for a refill.
+
+    Args:
+        requests_per_minute: Limit on requests per minute. If None, requests are not limited.
+        tokens_per_minute: Limit on tokens per minute. If None, tokens are not limited.
+        max_concurrency: Maximum limit on requests in flight.
+        initial_concurrency: Initial limit on requests in flight. Defaults to `max_concurrency`.
+        min_concurrency: Minimum limit on requests in flight.
+        target_latency: Latency (in seconds) above which the concurrency limit is decreased. If None,
+          only rate limit errors decrease it.
+        additive_increase: Increase of the concurrency limit per its value after successful requests.
+        multiplicative_decrease: Factor of the concurrency limit after rate limit errors or slow requests.
+        decrease_cooldown: Minimum time between decreases of the concurrency limit (in seconds).
+        token_estimator: Function that estimates the number of tokens of a request from its input.
+        name: Name used in metrics.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 16,
+        initial_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        target_latency: Optional[float] = None,
+        additive_increase: float = 1.0,
+        multiplicative_decrease: float = 0.5,
+        decrease_cooldown: float = 1.0,
+        token_estimator: Callable[[Any], int] = estimate_tokens,
+        name: str = "scheduler",
+    ):
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Expected 1 <= `min_concurrency` <= `max_concurrency`, got {min_concurrency} and {max_concurrency}."
+            )
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError(f"`multiplicative_decrease` should be in (0, 1), got {multiplicative_decrease}.")
+
+        self.request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+        self.token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute is not None else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit = float(initial_concurrency if initial_concurrency is not None else max_concurrency)
+        self.target_latency = target_latency
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.decrease_cooldown = decrease_cooldown
+        self.token_estimator = token_estimator
+        self.name = name
+
+        self.num_in_flight = 0
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._counter = itertools.count()
+        self._last_decrease = -float("inf")
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_deadline = 0.0
+        SCHEDULER_CONCURRENCY_LIMIT.labels(name).set(self.concurrency_limit)
+
+    def wrap(self, runnable: Runnable, priority: int = PRIORITY_NORMAL) -> ScheduledRunnable:
+        """Returns a runnable whose calls go through the scheduler.
+
+        Args:
+            runnable: The runnable to wrap.
+            priority: Default priority of the calls (lower values are served first).
+        """
+        return ScheduledRunnable(runnable, scheduler=self, priority=priority)
+
+    def _grant(self) -> None:
+        """Grants the waiting requests that fit into the limits, in the order of priority.
+
+        When the first waiting request doesn't fit into the rate limits yet, another attempt is scheduled for
+        the time it does; when it's waiting for a request in flight to finish, the attempt is made on `release`.
+        """
+        while self._queue:
+            waiter = self._queue[0][2]
+            if waiter.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            if self.num_in_flight >= max(self.min_concurrency, int(self.concurrency_limit)):
+                return
+
+            now = time.monotonic()
+            delay = max(
+                self.request_bucket.delay(1, now) if self.request_bucket is not None else 0.0,
+                self.token_bucket.delay(waiter.num_tokens, now) if self.token_bucket is not None else 0.0,
+            )
+            if delay > 0:
+                self._schedule_grant(now + delay)
+                return
+
+            heapq.heappop(self._queue)
+            if self.request_bucket is not None:
+                self.request_bucket.consume(1)
+            if self.token_bucket is not None:
+                self.token_bucket.consume(waiter.num_tokens)
+            self.num_in_flight += 1
+            waiter.granted = True
+            SCHEDULER_QUEUE_WAIT.labels(str(waiter.priority)).observe(time.perf_counter() - waiter.enqueued)
+            waiter.notify()
+
+    def _schedule_grant(self, deadline: float) -> None:
+        """Makes sure that `_grant` is called at a given time (a single timer serves both sync and async waiters)."""
+        if self._timer is not None and self._timer_deadline <= deadline:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(max(0.0, deadline - time.monotonic()), self._on_timer)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if threading.current_thread() is self._timer:
+                self._timer = None
+            self._grant()
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        heapq.heappush(self._queue, (waiter.priority, next(self._counter), waiter))
+        self._grant()
+
+    def acquire(self, priority: int, num_tokens: int) -> None:
+        """Blocks until a request with a given priority and an estimated number of tokens can be made."""
+        event = threading.Event()
+        waiter = _Waiter(priority, num_tokens, event.set)
+        with self._lock:
+            self._enqueue(waiter)
+        event.wait()
+
+    async def aacquire(self, priority: int, num_tokens: int) -> None:
+        """Waits until a request with a given priority and an estimated number of tokens can be made."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _set_result() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def _notify() -> None:
+            # requests can be granted from other threads (e.g., by sync calls finishing or by the timer)
+            loop.call_soon_threadsafe(_set_result)
+
+        waiter = _Waiter(priority, num_tokens, _notify)
+        with self._lock:
+            self._enqueue(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # the slot was granted, but won't be used
+                    self.num_in_flight -= 1
+                else:
+                    waiter.cancelled = True
+                self._grant()
+            raise
+
+    def release(
+        self,
+        priority: int,
+        latency: float,
+        error: Optional[BaseException] = None,
+        extra_tokens: int = 0,
+    ) -> None:
+        """Reports a finished request and adapts the concurrency limit to its outcome.
+
+        Args:
+            priority: Priority of the request.
+            latency: Duration of the request (in seconds).
+            error: Error raised by the request, if any.
+            extra_tokens: Actual number of tokens used minus the estimated one.
+        """
+        with self._lock:
+            self.num_in_flight -= 1
+            if self.token_bucket is not None and extra_tokens:
+                self.token_bucket.consume(extra_tokens)
+
+            rate_limited = error is not None and is_rate_limit_error(error)
+            if rate_limited and self.request_bucket is not None:
+                self.request_bucket.tokens = min(self.request_bucket.tokens, 0.0)
+
+            now = time.monotonic()
+            if rate_limited or (self.target_latency is not None and latency > self.target_latency):
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self._last_decrease = now
+                    self.concurrency_limit = max(
+                        float(self.min_concurrency), self.concurrency_limit * self.multiplicative_decrease
+                    )
+            elif error is None:
+                self.concurrency_limit = min(
+                    float(self.max_concurrency),
+                    self.concurrency_limit + self.additive_increase / self.concurrency_limit,
+                )
+            SCHEDULER_CONCURRENCY_LIMIT.labels(self.name).set(self.concurrency_limit)
+            outcome = "rate_limited" if rate_limited else "error" if error is not None else "ok"
+            SCHEDULER_REQUESTS.labels(str(priority), outcome).inc()
+            self._grant()
+
+
+def _get_total_tokens(output: Any) -> Optional[int]:
+    metadata = getattr(output, "response_metadata", None) or {}
+    usage = metadata.get("token_usage") or metadata.get("usage") or {}
+    total_tokens = usage.get("total_tokens") if isinstance(usage, dict) else None
+    return total_tokens if isinstance(total_tokens, int) else None
+
+
+class ScheduledRunnable(Runnable[Any, Any]):
+    """Runnable whose calls go through a `RateLimitedScheduler` (see `RateLimitedScheduler.wrap`).
+
+    It can be passed as `llm` to component configs, e.g., the generator's LLM wrapped with a higher priority
+    than the evaluator's one, both sharing a single scheduler.
+
+    Args:
+        runnable: The runnable to wrap.
+        scheduler: The scheduler.
+        priority: Default priority of the calls; overridden by `request_priority`.
+    """
+
+    def __init__(self, runnable: Runnable, scheduler: RateLimitedScheduler, priority: int = PRIORITY_NORMAL):
+        self.runnable = runnable
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def _get_priority(self) -> int:
+        priority = _priority_var.get()
+        return priority if priority is not None else self.priority
+
+    def _release(
+        self, priority: int, start: float, num_tokens: int, output: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        total_tokens = _get_total_tokens(output) if output is not None else None
+        self.scheduler.release(
+            priority,
+            latency=time.perf_counter() - start,
+            error=error,
+            extra_tokens=total_tokens - num_tokens if total_tokens is not None else 0,
+        )
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        priority, num_tokens = self._get_priority(), self.scheduler.token_estimator(input)
+        self.scheduler.acquire(priority, num_tokens)
+        start = time.perf_counter()
+        try:
+            output = self.runnable.invoke(input, config, **kwargs)
+        except BaseException as e:
+            self._release(priority, start, num_tokens, error=e)
+            raise
+        self._release(priority, start, num_tokens, output=output)
+        return output
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        priority, num_tokens = self._get_priority(), self.scheduler.token_estimator(input)
+        await self.scheduler.aacquire(priority, num_tokens)
+        start = time.perf_counter()
+        try:
+            output = await self.runnable.ainvoke(input, config, **kwargs)
+        except BaseException as e:
+            self._release(priority, start, num_tokens, error=e)
+            raise
+        self._release(priority, start, num_tokens, output=output)
+        return output
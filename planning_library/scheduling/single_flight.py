@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from ..components.caching.cached_component import is_deterministic
+from ..components.caching.hashing import canonical_hash
+from ..instrumentation.metrics import SINGLE_FLIGHT_CALLS
+
+
+class SingleFlightRunnable(Runnable[Any, Any]):
+    """Wraps a runnable (usually an LLM) so that concurrent calls with identical inputs share a single call:
+    the first call is made, the others wait for its result (or error). Nothing is stored after the call is
+    finished, so unlike caching, there is no staleness: a later identical call is made again.
+
+    Inputs and keyword arguments (e.g., tools bound via `bind`) are compared by a canonical hash
+    (see `canonical_hash`); calls with inputs that can't be hashed are made as is. Config isn't compared:
+    only the first call is reported to callback handlers.
+
+    Calls of models that sample (with a temperature above 0) aren't coalesced by default: identical inputs
+    are expected to give different outputs there, e.g., self-consistency votes.
+
+    It can be passed as `llm` to component configs, and shared between components and strategy runs
+    to coalesce their calls, e.g., `llm = SingleFlightRunnable(ChatOpenAI(...))`.
+
+    Args:
+        runnable: The runnable to wrap.
+        name: Name used in metrics.
+        deterministic_only: If True, calls are only coalesced when all the language models of the runnable
+          have a temperature of 0 and the call doesn't set a temperature above 0; other calls are made as is.
+    """
+
+    def __init__(self, runnable: Runnable, name: str = "single_flight", deterministic_only: bool = True):
+        self.runnable = runnable
+        self.name = name
+        self.deterministic_only = deterministic_only
+        self.enabled = not deterministic_only or is_deterministic(runnable)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._async_calls: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    def _key(self, input: Any, kwargs: Dict[str, Any]) -> Optional[str]:
+        if not self.enabled or (self.deterministic_only and (kwargs.get("temperature") or 0) > 0):
+            return None
+        try:
+            return canonical_hash({"input": input, "kwargs": kwargs})
+        except TypeError:
+            return None
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        key = self._key(input, kwargs)
+        if key is None:
+            return self.runnable.invoke(input, config, **kwargs)
+
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not is_leader:
+            SINGLE_FLIGHT_CALLS.labels(self.name or type(self).__name__, "coalesced").inc()
+            return copy.deepcopy(future.result())
+
+        SINGLE_FLIGHT_CALLS.labels(self.name or type(self).__name__, "made").inc()
+        try:
+            output = self.runnable.invoke(input, config, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(output)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return output
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        key = self._key(input, kwargs)
+        if key is None:
+            return await self.runnable.ainvoke(input, config, **kwargs)
+
+        # futures are bound to event loops, so calls are only shared within a loop
+        loop_key = (id(asyncio.get_running_loop()), key)
+        task = self._async_calls.get(loop_key)
+        if task is not None:
+            SINGLE_FLIGHT_CALLS.labels(self.name or type(self).__name__, "coalesced").inc()
+            # shielded: cancelling one of the callers doesn't cancel the call shared with the others
+            return copy.deepcopy(await asyncio.shield(task))
+
+        SINGLE_FLIGHT_CALLS.labels(self.name or type(self).__name__, "made").inc()
+        task = asyncio.ensure_future(self.runnable.ainvoke(input, config, **kwargs))
+        self._async_calls[loop_key] = task
+        task.add_done_callback(lambda _: self._async_calls.pop(loop_key, None))
+        return await asyncio.shield(task)
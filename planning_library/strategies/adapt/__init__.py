@@ -1,3 +1,18 @@
-from .adapt_strategy import ADaPTStrategy
+from typing import TYPE_CHECKING
 
-__all__ = ["ADaPTStrategy"]
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .adapt_strategy import ADaPTStrategy
+
+__all__ = [
+    "ADaPTStrategy",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ADaPTStrategy": ".adapt_strategy",
+    },
+)
@@ -8,7 +8,11 @@ from langchain_core.callbacks import (
     CallbackManagerForChainRun,
 )
 
-from planning_library.strategies.adapt.components import ADaPTExecutor, ADaPTPlanner
+from planning_library.action_executors import BaseActionExecutor
+from planning_library.components import BaseComponent
+from planning_library.instrumentation import track_phase
+from planning_library.strategies.adapt.components import ADaPTExecutor
+from planning_library.strategies.adapt.utils import ADaPTPlannerInput, ADaPTPlannerOutput
 
 from ..base_strategy import BaseCustomStrategy
 
@@ -20,7 +24,7 @@ class ADaPTStrategy(BaseCustomStrategy):
     """
 
     executor: ADaPTExecutor
-    planner: ADaPTPlanner
+    planner: BaseComponent[ADaPTPlannerInput, ADaPTPlannerOutput]
     max_depth: int
 
     @property
@@ -33,6 +37,10 @@ class ADaPTStrategy(BaseCustomStrategy):
         # TODO: define properly
         return []
 
+    def with_action_executor(self, action_executor: BaseActionExecutor) -> ADaPTStrategy:
+        """Returns a copy of the current strategy whose executor uses a given action executor."""
+        return self._shallow_copy(executor=self.executor.with_action_executor(action_executor))
+
     def _adapt_step(
         self,
         inputs: Dict[str, Any],
@@ -56,10 +64,11 @@ class ADaPTStrategy(BaseCustomStrategy):
             )
 
         # 2: run task through executor
-        executor_output = self.executor.invoke(
-            inputs,  # type: ignore
-            run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
-        )
+        with track_phase("executor"):
+            executor_output = self.executor.invoke(
+                inputs,  # type: ignore
+                run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
+            )
 
         is_completed, cur_agent_outcome, cur_intermediate_steps = (
             executor_output["is_completed"],
@@ -73,20 +82,22 @@ class ADaPTStrategy(BaseCustomStrategy):
             return True, cur_agent_outcome, intermediate_steps
         else:
             # 3.2: otherwise:
-            self.executor.reset(
-                actions=[a[0] for a in intermediate_steps],
-                run_manager=run_manager.get_child(tag="clean_env") if run_manager else None,
-            )
+            with track_phase("reset"):
+                self.executor.reset(
+                    actions=[a[0] for a in intermediate_steps],
+                    run_manager=run_manager.get_child(tag="clean_env") if run_manager else None,
+                )
 
             # call a planner to further decompose a current task
-            plan = self.planner.invoke(
-                dict(
-                    inputs=inputs,  # type: ignore[reportArgumentType]
-                    executor_agent_outcome=cur_agent_outcome,
-                    executor_intermediate_steps=cur_intermediate_steps,
-                ),
-                run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
-            )
+            with track_phase("planner"):
+                plan = self.planner.invoke(
+                    dict(
+                        inputs=inputs,  # type: ignore[reportArgumentType]
+                        executor_agent_outcome=cur_agent_outcome,
+                        executor_intermediate_steps=cur_intermediate_steps,
+                    ),
+                    run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
+                )
             # when AND logic is given, execute tasks sequentially
             if plan["aggregation_mode"] == "and":
                 for task_inputs in plan["subtasks"]:
@@ -172,12 +183,11 @@ class ADaPTStrategy(BaseCustomStrategy):
             )
 
         # 2: run task through executor
-        executor_output = await self.executor.ainvoke(
-            dict(
-                inputs=inputs,  # type: ignore
-            ),
-            run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
-        )
+        with track_phase("executor"):
+            executor_output = await self.executor.ainvoke(
+                inputs,  # type: ignore
+                run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
+            )
         is_completed, cur_agent_outcome, cur_intermediate_steps = (
             executor_output["is_completed"],
             executor_output["agent_outcome"],
@@ -190,19 +200,21 @@ class ADaPTStrategy(BaseCustomStrategy):
             return True, cur_agent_outcome, intermediate_steps
         else:
             # 3.2: otherwise:
-            await self.executor.areset(
-                actions=[a[0] for a in intermediate_steps],
-                run_manager=run_manager.get_child(tag="clean_env") if run_manager else None,
-            )
+            with track_phase("reset"):
+                await self.executor.areset(
+                    actions=[a[0] for a in intermediate_steps],
+                    run_manager=run_manager.get_child(tag="clean_env") if run_manager else None,
+                )
 
-            plan = await self.planner.ainvoke(
-                dict(
-                    inputs=inputs,  # type: ignore[reportArgumentType]
-                    executor_agent_outcome=cur_agent_outcome,
-                    executor_intermediate_steps=cur_intermediate_steps,
-                ),
-                run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
-            )
+            with track_phase("planner"):
+                plan = await self.planner.ainvoke(
+                    dict(
+                        inputs=inputs,  # type: ignore[reportArgumentType]
+                        executor_agent_outcome=cur_agent_outcome,
+                        executor_intermediate_steps=cur_intermediate_steps,
+                    ),
+                    run_manager=run_manager.get_child(tag=f"executor:depth_{depth}") if run_manager else None,
+                )
             # when AND logic is given, execute tasks sequentially
             if plan["aggregation_mode"] == "and":
                 for task_inputs in plan["subtasks"]:
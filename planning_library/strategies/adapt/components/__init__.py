@@ -1,4 +1,21 @@
-from .executor import ADaPTExecutor
-from .planner import ADaPTPlanner
+from typing import TYPE_CHECKING
 
-__all__ = ["ADaPTExecutor", "ADaPTPlanner"]
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .executor import ADaPTExecutor
+    from .planner import ADaPTPlanner
+
+__all__ = [
+    "ADaPTExecutor",
+    "ADaPTPlanner",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ADaPTExecutor": ".executor",
+        "ADaPTPlanner": ".planner",
+    },
+)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from textwrap import dedent
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -7,7 +8,7 @@ from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.callbacks import AsyncCallbackManager, CallbackManager
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables import Runnable, RunnableLambda, RunnableSequence
 from langchain_core.tools import BaseTool
 from typing_extensions import TypedDict
 
@@ -22,6 +23,7 @@ from planning_library.function_calling_parsers import (
     BaseFunctionCallingMultiActionParser,
     BaseFunctionCallingSingleActionParser,
 )
+from planning_library.strategies.base_strategy import BaseCustomStrategy
 from planning_library.strategies.simple import SimpleStrategy
 
 
@@ -141,6 +143,42 @@ class ADaPTExecutor(RunnableComponent[ADaPTExecutorInput, ADaPTExecutorOutput]):
 
         return cls(runnable=runnable, action_executor=action_executor)  # type: ignore[arg-type]
 
+    @staticmethod
+    def _replace_action_executor(runnable: Runnable, action_executor: BaseActionExecutor) -> Optional[Runnable]:
+        """Returns a copy of a runnable where strategies use a given action executor, or None if there are none."""
+        if isinstance(runnable, BaseCustomStrategy):
+            return runnable.with_action_executor(action_executor)
+        if isinstance(runnable, RunnableSequence):
+            steps = [ADaPTExecutor._replace_action_executor(step, action_executor) for step in runnable.steps]
+            if all(step is None for step in steps):
+                return None
+            return RunnableSequence(
+                *(new_step if new_step is not None else step for step, new_step in zip(runnable.steps, steps)),
+                name=runnable.name,
+            )
+        return None
+
+    def with_action_executor(self, action_executor: BaseActionExecutor) -> ADaPTExecutor:
+        """Returns a copy of the executor that uses a given action executor both to run the tasks and to reset
+        the environment. Strategies in the underlying runnable (e.g., the one from `create_simple_strategy`)
+        are copied with the new action executor; LLMs and other components are shared."""
+        runnable = self._replace_action_executor(self._base_runnable, action_executor)
+        if runnable is None:
+            raise NotImplementedError(
+                "The runnable of the executor doesn't contain strategies, so its action executor can't be replaced."
+            )
+
+        executor = copy.copy(self)
+        executor._action_executor = action_executor
+        executor._base_runnable = runnable
+        # preprocessing steps are shared, but adding new ones to the copy doesn't affect the original
+        executor._input_preprocessing = copy.copy(self._input_preprocessing)
+        executor._input_preprocessing.steps = list(self._input_preprocessing.steps)
+        executor._output_preprocessing = copy.copy(self._output_preprocessing)
+        executor._output_preprocessing.steps = list(self._output_preprocessing.steps)
+        executor._build_runnable()
+        return executor
+
     def reset(
         self,
         actions: Optional[List[AgentAction]] = None,
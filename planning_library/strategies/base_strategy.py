@@ -1,26 +1,53 @@
+from __future__ import annotations
+
 import asyncio
+import contextvars
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext, suppress
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
     Dict,
+    Generator,
+    Iterable,
     Iterator,
     List,
     Optional,
     Tuple,
+    Type,
+    TypeVar,
 )
 
 from langchain.chains.base import Chain
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.callbacks import (
+    AsyncCallbackManager,
     AsyncCallbackManagerForChainRun,
+    CallbackManager,
     CallbackManagerForChainRun,
 )
+from langchain_core.load.dump import dumpd
+from langchain_core.runnables import RunnableConfig, ensure_config
+
+from ..action_executors import BaseActionExecutor
+from ..instrumentation import RunStats, track_run_stats
+from ..instrumentation.metrics import STRATEGY_RUN_DURATION, STRATEGY_RUNS
+from ..runners import BatchTaskResult, arelease, arun_batch
+
+_END_OF_STREAM = object()
+
+StrategyType = TypeVar("StrategyType", bound="BaseCustomStrategy")
 
 
 class BaseCustomStrategy(Chain, ABC):
     return_intermediate_steps: bool = False
     return_finish_log: bool = False
+    return_run_stats: bool = False
+    """If True, the output will contain `run_stats` key with RunStats for the whole run
+    (LLM calls, tokens, tool calls and latencies for each phase of the strategy)."""
     max_iterations: int = 15
     verbose: bool = True
 
@@ -46,12 +73,44 @@ class BaseCustomStrategy(Chain, ABC):
         inputs: Dict[str, str],
         run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
     ) -> AsyncIterator[Tuple[AgentFinish, List[Tuple[AgentAction, str]]]]:
-        loop = asyncio.get_event_loop()
-
+        """Default asynchronous implementation: runs `_run_strategy` in a separate thread and forwards
+        each result through a queue as soon as it is produced."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
         sync_run_manager = run_manager.get_sync() if run_manager is not None else None
-        result = await loop.run_in_executor(None, self._run_strategy, inputs, sync_run_manager)
-        for item in result:
-            yield item
+
+        def _put(item: Any, error: Optional[BaseException] = None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+            except RuntimeError:
+                # the event loop has already been closed: nobody is waiting for the results
+                stop.set()
+
+        def _produce() -> None:
+            try:
+                for item in self._run_strategy(inputs, sync_run_manager):
+                    if stop.is_set():
+                        break
+                    _put(item)
+            except BaseException as e:
+                _put(_END_OF_STREAM, e)
+            else:
+                _put(_END_OF_STREAM)
+
+        producer = loop.run_in_executor(None, contextvars.copy_context().run, _produce)
+        try:
+            while True:
+                item, error = await queue.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_STREAM:
+                    break
+                yield item
+            await producer
+        finally:
+            # the strategy is stopped after the current iteration if the consumer exits early
+            stop.set()
 
     def _return(
         self,
@@ -83,6 +142,112 @@ class BaseCustomStrategy(Chain, ABC):
             final_output["finish_log"] = output.log
         return final_output
 
+    @staticmethod
+    def _merge_outputs(outputs: List[Dict[str, Any]], run_stats: Optional[RunStats] = None) -> Dict[str, Any]:
+        merged: Dict[str, Any] = {key: [output[key] for output in outputs] for key in outputs[0]} if outputs else {}
+        if run_stats is not None:
+            merged["run_stats"] = run_stats
+        return merged
+
+    @contextmanager
+    def _record_run(self) -> Iterator[None]:
+        """Updates process-level metrics for the current run. Streams closed by the consumer before the end
+        are recorded with the `stopped` status."""
+        strategy_name = type(self).__name__
+        start = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "success"
+        except (GeneratorExit, asyncio.CancelledError):
+            status = "stopped"
+            raise
+        finally:
+            STRATEGY_RUNS.labels(strategy_name, status).inc()
+            STRATEGY_RUN_DURATION.labels(strategy_name).observe(time.perf_counter() - start)
+
+    def _init_run_stats(
+        self,
+        run_manager: Optional[CallbackManagerForChainRun | AsyncCallbackManagerForChainRun] = None,
+    ) -> Optional[RunStats]:
+        """Returns the statistics for the current run if `return_run_stats` is True."""
+        if not self.return_run_stats:
+            return None
+        run_stats = RunStats()
+        if run_manager is not None:
+            # LLM calls are counted by a callback handler that is passed to all the children of the current run
+            run_manager.inheritable_handlers.append(run_stats.callback_handler)
+        return run_stats
+
+    @contextmanager
+    def _track_run(
+        self,
+        run_manager: Optional[CallbackManagerForChainRun | AsyncCallbackManagerForChainRun] = None,
+    ) -> Iterator[Optional[RunStats]]:
+        """Updates process-level metrics for the current run and collects its statistics if `return_run_stats` is True."""
+        with self._record_run():
+            run_stats = self._init_run_stats(run_manager)
+            if run_stats is None:
+                yield None
+            else:
+                with track_run_stats(run_stats):
+                    yield run_stats
+
+    def _run_strategy_with_stats(
+        self,
+        inputs: Dict[str, Any],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> Generator[Tuple[AgentFinish, List[Tuple[AgentAction, str]]], None, None]:
+        if run_stats is None:
+            yield from self._run_strategy(inputs=inputs, run_manager=run_manager)
+            return
+        with track_run_stats(run_stats):
+            yield from self._run_strategy(inputs=inputs, run_manager=run_manager)
+
+    async def _arun_strategy_in_task(
+        self,
+        inputs: Dict[str, Any],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> AsyncIterator[Tuple[AgentFinish, List[Tuple[AgentAction, str]]]]:
+        """Runs `_arun_strategy` in a separate task and forwards its results. The task has its own copy of the context,
+        so the context variables set by the strategy (e.g., the statistics of the run) don't leak to the consumer
+        between the results. The strategy runs at most one result ahead of the consumer."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def _produce() -> None:
+            try:
+                with track_run_stats(run_stats) if run_stats is not None else nullcontext():
+                    results = self._arun_strategy(inputs=inputs, run_manager=run_manager)
+                    try:
+                        async for item in results:
+                            await queue.put((item, None))
+                    finally:
+                        await results.aclose()  # type: ignore[attr-defined]
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await queue.put((_END_OF_STREAM, e))
+            else:
+                await queue.put((_END_OF_STREAM, None))
+
+        producer = asyncio.ensure_future(_produce())
+        try:
+            while True:
+                item, error = await queue.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_STREAM:
+                    break
+                yield item
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await producer
+
     def _call(
         self,
         inputs: Dict[str, Any],
@@ -90,15 +255,16 @@ class BaseCustomStrategy(Chain, ABC):
     ) -> Dict[str, Any]:
         """Run text through and get agent response."""
 
-        outputs = [
-            self._return(output, intermediate_steps, run_manager=run_manager)
-            for output, intermediate_steps in self._run_strategy(
-                inputs=inputs,
-                run_manager=run_manager,
-            )
-        ]
+        with self._track_run(run_manager) as run_stats:
+            outputs = [
+                self._return(output, intermediate_steps, run_manager=run_manager)
+                for output, intermediate_steps in self._run_strategy(
+                    inputs=inputs,
+                    run_manager=run_manager,
+                )
+            ]
 
-        return {key: [output[key] for output in outputs] for key in outputs[0]}
+        return self._merge_outputs(outputs, run_stats)
 
     async def _acall(
         self,
@@ -107,17 +273,187 @@ class BaseCustomStrategy(Chain, ABC):
     ) -> Dict[str, Any]:
         """Run text through and get agent response."""
 
-        _outputs = self._arun_strategy(
-            inputs=inputs,
-            run_manager=run_manager,
+        with self._track_run(run_manager) as run_stats:
+            _outputs = self._arun_strategy(
+                inputs=inputs,
+                run_manager=run_manager,
+            )
+
+            outputs = []
+            async for _output, _intermediate_steps in _outputs:
+                output = await self._areturn(_output, _intermediate_steps, run_manager=run_manager)
+                outputs.append(output)
+
+        return self._merge_outputs(outputs, run_stats)
+
+    def stream(
+        self,
+        input: Dict[str, Any],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Runs the strategy and yields the output for each result (e.g., each finished branch) as soon as
+        it is produced, without waiting for the whole run to complete.
+
+        Callbacks are set up the same way as in `invoke`; the chain run ends once the stream is exhausted or closed.
+        """
+        config = ensure_config(config)
+        inputs = self.prep_inputs(input)
+        callback_manager = CallbackManager.configure(
+            config.get("callbacks"),
+            self.callbacks,
+            self.verbose,
+            config.get("tags"),
+            self.tags,
+            config.get("metadata"),
+            self.metadata,
         )
+        run_manager = callback_manager.on_chain_start(
+            dumpd(self),
+            inputs,
+            name=config.get("run_name") or self.get_name(),
+        )
+
+        outputs: List[Dict[str, Any]] = []
+        run_stats = self._init_run_stats(run_manager)
+        # the strategy runs in its own context, so the context variables it sets don't leak to the consumer
+        context = contextvars.copy_context()
+        results = self._run_strategy_with_stats(inputs=inputs, run_manager=run_manager, run_stats=run_stats)
+        with self._record_run():
+            try:
+                self._validate_inputs(inputs)
+                while True:
+                    try:
+                        output, intermediate_steps = context.run(next, results)
+                    except StopIteration:
+                        break
+                    cur_output = self._return(output, intermediate_steps, run_manager=run_manager)
+                    outputs.append(cur_output)
+                    # statistics are shared between the outputs and keep updating until the stream ends
+                    yield cur_output if run_stats is None else {**cur_output, "run_stats": run_stats}
+                final_outputs = self._merge_outputs(outputs, run_stats)
+                # validates the outputs and saves the run to memory, as `invoke` does
+                self.prep_outputs(inputs, final_outputs)
+            except GeneratorExit:
+                run_manager.on_chain_end(self._merge_outputs(outputs, run_stats))
+                raise
+            except BaseException as e:
+                run_manager.on_chain_error(e)
+                raise e
+            finally:
+                context.run(results.close)
+        run_manager.on_chain_end(final_outputs)
+
+    async def astream(
+        self,
+        input: Dict[str, Any],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Runs the strategy asynchronously and yields the output for each result (e.g., each finished branch)
+        as soon as it is produced, without waiting for the whole run to complete.
+
+        Callbacks are set up the same way as in `ainvoke`; the chain run ends once the stream is exhausted or closed.
+        """
+        config = ensure_config(config)
+        inputs = self.prep_inputs(input)
+        callback_manager = AsyncCallbackManager.configure(
+            config.get("callbacks"),
+            self.callbacks,
+            self.verbose,
+            config.get("tags"),
+            self.tags,
+            config.get("metadata"),
+            self.metadata,
+        )
+        run_manager = await callback_manager.on_chain_start(
+            dumpd(self),
+            inputs,
+            name=config.get("run_name") or self.get_name(),
+        )
+
+        outputs: List[Dict[str, Any]] = []
+        run_stats = self._init_run_stats(run_manager)
+        with self._record_run():
+            results = self._arun_strategy_in_task(inputs=inputs, run_manager=run_manager, run_stats=run_stats)
+            try:
+                self._validate_inputs(inputs)
+                async for output, intermediate_steps in results:
+                    cur_output = await self._areturn(output, intermediate_steps, run_manager=run_manager)
+                    outputs.append(cur_output)
+                    # statistics are shared between the outputs and keep updating until the stream ends
+                    yield cur_output if run_stats is None else {**cur_output, "run_stats": run_stats}
+                final_outputs = self._merge_outputs(outputs, run_stats)
+                # validates the outputs and saves the run to memory, as `ainvoke` does
+                await self.aprep_outputs(inputs, final_outputs)
+            except GeneratorExit:
+                await run_manager.on_chain_end(self._merge_outputs(outputs, run_stats))
+                raise
+            except BaseException as e:
+                await run_manager.on_chain_error(e)
+                raise e
+            finally:
+                await results.aclose()  # type: ignore[attr-defined]
+        await run_manager.on_chain_end(final_outputs)
+
+    def _shallow_copy(self: StrategyType, **update: Any) -> StrategyType:
+        """Returns a shallow copy of the current strategy with some fields updated.
+
+        Unlike `copy`, it keeps the fields that are excluded from serialization (e.g., callbacks)."""
+        return self.__class__.construct(_fields_set=self.__fields_set__ | set(update), **{**self.__dict__, **update})
+
+    def with_action_executor(self, action_executor: BaseActionExecutor) -> BaseCustomStrategy:
+        """Returns a copy of the current strategy that uses a given action executor. All the other
+        components (e.g., LLMs) are shared with the current strategy."""
+        if "action_executor" not in self.__fields__:
+            raise NotImplementedError(f"{type(self).__name__} doesn't support replacing the action executor.")
+        return self._shallow_copy(action_executor=action_executor)
+
+    async def arun_batch(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        action_executor_factory: Callable[[Dict[str, Any]], BaseActionExecutor],
+        config: Optional[RunnableConfig] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 0,
+        retry_on: Tuple[Type[Exception], ...] = (Exception,),
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ) -> AsyncIterator[BatchTaskResult]:
+        """Runs the strategy over many inputs and yields the results as soon as they complete.
+
+        Each task (and each retry) gets its own action executor, so tasks don't share environment state.
+        See `arun_batch` from `planning_library.runners` for details.
+
+        Args:
+            inputs: The inputs for the tasks.
+            action_executor_factory: Creates an action executor for a given task inputs.
+              If the executor has `close` or `aclose` method, it is called once the task is finished.
+            config: The config to run the strategy with.
+            max_concurrency: The maximum number of tasks running at the same time.
+            max_retries: The maximum number of retries for a single task.
+            retry_on: The exceptions that should be retried; other exceptions fail the task immediately.
+            retry_delay: The delay before the first retry (in seconds); it grows exponentially for each next retry.
+            max_retry_delay: The maximum delay before a retry (in seconds).
+        """
 
-        outputs = []
-        async for _output, _intermediate_steps in _outputs:
-            output = await self._areturn(_output, _intermediate_steps, run_manager=run_manager)
-            outputs.append(output)
+        async def _run_task(task_inputs: Dict[str, Any]) -> Dict[str, Any]:
+            action_executor = action_executor_factory(task_inputs)
+            try:
+                return await self.with_action_executor(action_executor).ainvoke(task_inputs, config)
+            finally:
+                await arelease(action_executor)
 
-        return {key: [output[key] for output in outputs] for key in outputs[0]}
+        async for result in arun_batch(
+            inputs,
+            _run_task,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_on=retry_on,
+            retry_delay=retry_delay,
+            max_retry_delay=max_retry_delay,
+        ):
+            yield result
 
 
 # TODO: what should the interface be?
@@ -1,3 +1,18 @@
-from .reflexion_strategy import ReflexionStrategy
+from typing import TYPE_CHECKING
 
-__all__ = ["ReflexionStrategy"]
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .reflexion_strategy import ReflexionStrategy
+
+__all__ = [
+    "ReflexionStrategy",
+]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ReflexionStrategy": ".reflexion_strategy",
+    },
+)
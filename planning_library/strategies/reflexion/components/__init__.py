@@ -1,6 +1,11 @@
-from .actor import ReflexionActor, ReflexionActorInput
-from .evaluator import ReflexionEvaluator, ReflexionEvaluatorInput
-from .self_reflection import ReflexionSelfReflection, ReflexionSelfReflectionInput
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .actor import ReflexionActor, ReflexionActorInput
+    from .evaluator import ReflexionEvaluator, ReflexionEvaluatorInput
+    from .self_reflection import ReflexionSelfReflection, ReflexionSelfReflectionInput
 
 __all__ = [
     "ReflexionActor",
@@ -10,3 +15,16 @@ __all__ = [
     "ReflexionSelfReflection",
     "ReflexionSelfReflectionInput",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ReflexionActor": ".actor",
+        "ReflexionActorInput": ".actor",
+        "ReflexionEvaluator": ".evaluator",
+        "ReflexionEvaluatorInput": ".evaluator",
+        "ReflexionSelfReflection": ".self_reflection",
+        "ReflexionSelfReflectionInput": ".self_reflection",
+    },
+)
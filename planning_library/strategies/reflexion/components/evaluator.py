@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from textwrap import dedent
-from typing import Any, Dict, Generic, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type
 
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.language_models import BaseChatModel
@@ -74,6 +74,8 @@ class ReflexionEvaluator(Generic[OutputType], EvaluatorComponent[ReflexionEvalua
         output_parser: Optional[BaseOutputParser[float]] = None,
         parser: Optional[BaseFunctionCallingSingleActionParser | BaseFunctionCallingMultiActionParser] = None,
         parser_name: Optional[str] = None,
+        heuristics: Optional[Sequence[Callable[[ReflexionEvaluatorInput], Optional[float]]]] = None,
+        stream_parsing: bool = False,
     ) -> "ReflexionEvaluator[float]":
         def _preprocess_input(
             inputs: ReflexionEvaluatorInput,
@@ -100,8 +102,12 @@ class ReflexionEvaluator(Generic[OutputType], EvaluatorComponent[ReflexionEvalua
             user_message=user_message,
             system_message=system_message,
             output_parser=output_parser,
+            stream_parsing=stream_parsing,
         )
 
         evaluator.add_input_preprocessing(_preprocess_input)
+        # cheap functions tried before the LLM: return a value in a 0-1 range or None when unsure
+        if heuristics:
+            evaluator.add_cascade_stages(heuristics)
 
         return evaluator
@@ -21,6 +21,7 @@ from langgraph.graph import END, StateGraph  # type: ignore[import]
 from langgraph.pregel import Pregel  # type: ignore[import-untyped]
 
 from ...action_executors import BaseActionExecutor
+from ...instrumentation import track_phase
 from .components import (
     ReflexionActor,
     ReflexionActorInput,
@@ -84,33 +85,36 @@ class ReflexionNodes:
         )
 
         if reset_environment:
-            reset_environment(state["inputs"])
+            with track_phase("reset"):
+                reset_environment(state["inputs"])
 
         return state
 
     @staticmethod
     def act(state: ReflexionState, actor: ReflexionActor) -> ReflexionState:
         """Synchronous version of calling an agent and returning its result."""
-        agent_outcome = actor.invoke(
-            ReflexionActorInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                self_reflections=state["self_reflections"],
+        with track_phase("act"):
+            agent_outcome = actor.invoke(
+                ReflexionActorInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    self_reflections=state["self_reflections"],
+                )
             )
-        )
         state["agent_outcome"] = agent_outcome
         return state
 
     @staticmethod
     async def aact(state: ReflexionState, actor: ReflexionActor) -> ReflexionState:
         """Asynchronous version of calling an agent and returning its result."""
-        agent_outcome = await actor.ainvoke(
-            ReflexionActorInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                self_reflections=state["self_reflections"],
+        with track_phase("act"):
+            agent_outcome = await actor.ainvoke(
+                ReflexionActorInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    self_reflections=state["self_reflections"],
+                )
             )
-        )
 
         state["agent_outcome"] = agent_outcome
         return state
@@ -126,9 +130,10 @@ class ReflexionNodes:
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should not be AgentFinish on the tool execution step."
 
-        observation = action_executor.execute(
-            actions=state["agent_outcome"],
-        )
+        with track_phase("execute"):
+            observation = action_executor.execute(
+                actions=state["agent_outcome"],
+            )
 
         if isinstance(observation, AgentStep):
             state["intermediate_steps"].append((observation.action, observation.observation))
@@ -147,9 +152,10 @@ class ReflexionNodes:
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should not be AgentFinish on the tool execution step."
 
-        observation = await action_executor.aexecute(
-            actions=state["agent_outcome"],
-        )
+        with track_phase("execute"):
+            observation = await action_executor.aexecute(
+                actions=state["agent_outcome"],
+            )
 
         if isinstance(observation, AgentStep):
             state["intermediate_steps"].append((observation.action, observation.observation))
@@ -163,13 +169,14 @@ class ReflexionNodes:
         assert isinstance(
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should be AgentFinish on the evaluation step."
-        should_continue = evaluator.invoke(
-            ReflexionEvaluatorInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                agent_outcome=state["agent_outcome"],
+        with track_phase("evaluate"):
+            should_continue = evaluator.invoke(
+                ReflexionEvaluatorInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    agent_outcome=state["agent_outcome"],
+                )
             )
-        )
         state["evaluator_should_continue"] = should_continue
         return state
 
@@ -180,13 +187,14 @@ class ReflexionNodes:
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should be AgentFinish on the evaluation step."
 
-        should_continue = await evaluator.ainvoke(
-            ReflexionEvaluatorInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                agent_outcome=state["agent_outcome"],
+        with track_phase("evaluate"):
+            should_continue = await evaluator.ainvoke(
+                ReflexionEvaluatorInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    agent_outcome=state["agent_outcome"],
+                )
             )
-        )
         state["evaluator_should_continue"] = should_continue
         return state
 
@@ -197,13 +205,14 @@ class ReflexionNodes:
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should be AgentFinish on the self-reflection step."
 
-        reflection = self_reflection.invoke(
-            ReflexionSelfReflectionInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                agent_outcome=state["agent_outcome"],
+        with track_phase("reflect"):
+            reflection = self_reflection.invoke(
+                ReflexionSelfReflectionInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    agent_outcome=state["agent_outcome"],
+                )
             )
-        )
         state["self_reflection_memory"].add_messages(reflection)
         return state
 
@@ -214,13 +223,14 @@ class ReflexionNodes:
             state["agent_outcome"], AgentFinish
         ), "Agent outcome should be AgentFinish on the self-reflection step."
 
-        reflection = await self_reflection.ainvoke(
-            ReflexionSelfReflectionInput(
-                inputs=state["inputs"],
-                intermediate_steps=state["intermediate_steps"],
-                agent_outcome=state["agent_outcome"],
+        with track_phase("reflect"):
+            reflection = await self_reflection.ainvoke(
+                ReflexionSelfReflectionInput(
+                    inputs=state["inputs"],
+                    intermediate_steps=state["intermediate_steps"],
+                    agent_outcome=state["agent_outcome"],
+                )
             )
-        )
         await state["self_reflection_memory"].aadd_messages(reflection)
         return state
 
@@ -267,7 +277,11 @@ def create_reflexion_graph(
     max_iterations: Optional[int],
     reset_environment: Optional[Callable[[Dict[str, Any]], None]],
 ) -> Pregel:
-    """Builds a graph for Reflexion strategy."""
+    """Builds a graph for Reflexion strategy.
+
+    Phases of the graph (act, execute, evaluate, reflect, reset) are tracked with `track_phase`. To collect RunStats,
+    invoke the graph inside `track_run_stats()` and pass `run_stats.callback_handler` to the callbacks.
+    """
 
     builder = StateGraph(ReflexionState)
     builder.add_node("init", ReflexionNodes.init)
@@ -1,6 +1,10 @@
-from typing import Any, Callable, Dict, Optional
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple, Type
+
+from langchain_core.runnables import RunnableConfig
 
 from ...action_executors import BaseActionExecutor
+from ...runners import BatchTaskResult, arelease, arun_batch
 from ..base_strategy import BaseLangGraphStrategy
 from .components import ReflexionActor, ReflexionEvaluator, ReflexionSelfReflection
 from .reflexion_graph import create_reflexion_graph
@@ -30,3 +34,70 @@ class ReflexionStrategy(BaseLangGraphStrategy):
             max_iterations=max_iterations,
             reset_environment=reset_environment,
         )
+
+    @staticmethod
+    async def arun_batch(
+        inputs: Iterable[Dict[str, Any]],
+        actor: ReflexionActor,
+        evaluator: ReflexionEvaluator,
+        self_reflection: ReflexionSelfReflection,
+        action_executor_factory: Callable[[Dict[str, Any]], BaseActionExecutor],
+        max_iterations: int,
+        reset_environment: Optional[Callable[[BaseActionExecutor, Dict[str, Any]], None]] = None,
+        config: Optional[RunnableConfig] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 0,
+        retry_on: Tuple[Type[Exception], ...] = (Exception,),
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ) -> AsyncIterator[BatchTaskResult]:
+        """Runs Reflexion over many inputs and yields the results as soon as they complete.
+
+        Each task (and each retry) gets its own action executor and its own graph. See `arun_batch`
+        from `planning_library.runners` for details.
+
+        Args:
+            inputs: The inputs for the tasks (the same as for invoking Reflexion graph, e.g., `{"inputs": {...}}`).
+            actor: The actor component shared between the tasks.
+            evaluator: The evaluator component shared between the tasks.
+            self_reflection: The self-reflection component shared between the tasks.
+            action_executor_factory: Creates an action executor for a given task inputs.
+              If the executor has `close` or `aclose` method, it is called once the task is finished.
+            max_iterations: The maximum number of trials for a single task.
+            reset_environment: Resets the environment of a given action executor between the trials
+              (accepts the executor and the inputs of the trial). If None, `reset` of the executor is used.
+            config: The config to run the graph with.
+            max_concurrency: The maximum number of tasks running at the same time.
+            max_retries: The maximum number of retries for a single task.
+            retry_on: The exceptions that should be retried; other exceptions fail the task immediately.
+            retry_delay: The delay before the first retry (in seconds); it grows exponentially for each next retry.
+            max_retry_delay: The maximum delay before a retry (in seconds).
+        """
+
+        async def _run_task(task_inputs: Dict[str, Any]) -> Dict[str, Any]:
+            action_executor = action_executor_factory(task_inputs)
+            try:
+                graph = create_reflexion_graph(
+                    actor=actor,
+                    evaluator=evaluator,
+                    self_reflection=self_reflection,
+                    action_executor=action_executor,
+                    max_iterations=max_iterations,
+                    reset_environment=partial(reset_environment, action_executor)
+                    if reset_environment is not None
+                    else lambda _: action_executor.reset(),
+                )
+                return await graph.ainvoke(task_inputs, config)
+            finally:
+                await arelease(action_executor)
+
+        async for result in arun_batch(
+            inputs,
+            _run_task,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_on=retry_on,
+            retry_delay=retry_delay,
+            max_retry_delay=max_retry_delay,
+        ):
+            yield result
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from langchain.agents import BaseMultiActionAgent, BaseSingleActionAgent
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
 from langchain_core.callbacks import (
+    AsyncCallbackManager,
     AsyncCallbackManagerForChainRun,
+    CallbackManager,
     CallbackManagerForChainRun,
 )
+from langchain_core.load.dump import dumpd
+from langchain_core.runnables import RunnableConfig, ensure_config
 from langchain_core.tools import BaseTool
 
 from planning_library.action_executors import (
@@ -16,6 +21,7 @@ from planning_library.action_executors import (
     MetaTools,
 )
 
+from ...instrumentation import RunStats
 from ..base_strategy import BaseCustomStrategy
 
 
@@ -141,3 +147,214 @@ class SimpleStrategy(BaseCustomStrategy):
 
         yield stopped_outcome, intermediate_steps
         return
+
+    @staticmethod
+    def _add_steps(
+        intermediate_steps: List[Tuple[AgentAction, str]], action_results: Union[List[AgentStep], AgentStep]
+    ) -> None:
+        if isinstance(action_results, AgentStep):
+            intermediate_steps.append((action_results.action, action_results.observation))
+        else:
+            intermediate_steps.extend(
+                (_action_results.action, _action_results.observation) for _action_results in action_results
+            )
+
+    def _lockstep_outputs(
+        self,
+        inputs: List[Dict[str, Any]],
+        outcomes: List[Optional[AgentFinish]],
+        intermediate_steps: List[List[Tuple[AgentAction, str]]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> List[Dict[str, Any]]:
+        outputs = []
+        for cur_inputs, outcome, cur_intermediate_steps in zip(inputs, outcomes, intermediate_steps):
+            if outcome is None:
+                outcome = AgentFinish({"output": "Agent stopped due to iteration limit."}, "")
+            cur_outputs = self._merge_outputs(
+                [self._return(outcome, cur_intermediate_steps, run_manager=run_manager)], run_stats
+            )
+            outputs.append(self.prep_outputs(cur_inputs, cur_outputs))
+        return outputs
+
+    async def _alockstep_outputs(
+        self,
+        inputs: List[Dict[str, Any]],
+        outcomes: List[Optional[AgentFinish]],
+        intermediate_steps: List[List[Tuple[AgentAction, str]]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> List[Dict[str, Any]]:
+        outputs = []
+        for cur_inputs, outcome, cur_intermediate_steps in zip(inputs, outcomes, intermediate_steps):
+            if outcome is None:
+                outcome = AgentFinish({"output": "Agent stopped due to iteration limit."}, "")
+            cur_outputs = self._merge_outputs(
+                [await self._areturn(outcome, cur_intermediate_steps, run_manager=run_manager)], run_stats
+            )
+            outputs.append(self.prep_outputs(cur_inputs, cur_outputs))
+        return outputs
+
+    def _run_lockstep(
+        self,
+        sessions_inputs: List[Dict[str, Any]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Tuple[List[Optional[AgentFinish]], List[List[Tuple[AgentAction, str]]]]:
+        outcomes: List[Optional[AgentFinish]] = [None] * len(sessions_inputs)
+        intermediate_steps: List[List[Tuple[AgentAction, str]]] = [[] for _ in sessions_inputs]
+
+        cur_iteration = 0
+        while self.max_iterations is None or cur_iteration < self.max_iterations:
+            actions: List[Optional[Union[List[AgentAction], AgentAction]]] = [None] * len(sessions_inputs)
+            for session_id, cur_inputs in enumerate(sessions_inputs):
+                if outcomes[session_id] is not None:
+                    continue
+                agent_outcome = self.agent.plan(
+                    intermediate_steps[session_id],
+                    callbacks=run_manager.get_child() if run_manager else None,
+                    **cur_inputs,
+                )
+                if isinstance(agent_outcome, AgentFinish):
+                    outcomes[session_id] = agent_outcome
+                else:
+                    actions[session_id] = agent_outcome
+
+            if all(cur_actions is None for cur_actions in actions):
+                break
+
+            action_results = self.action_executor.execute_batch(
+                actions, run_manager=run_manager.get_child() if run_manager else None
+            )
+            for session_id, cur_action_results in enumerate(action_results):
+                if cur_action_results is not None:
+                    self._add_steps(intermediate_steps[session_id], cur_action_results)
+
+            cur_iteration += 1
+
+        return outcomes, intermediate_steps
+
+    async def _arun_lockstep(
+        self,
+        sessions_inputs: List[Dict[str, Any]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Tuple[List[Optional[AgentFinish]], List[List[Tuple[AgentAction, str]]]]:
+        outcomes: List[Optional[AgentFinish]] = [None] * len(sessions_inputs)
+        intermediate_steps: List[List[Tuple[AgentAction, str]]] = [[] for _ in sessions_inputs]
+
+        cur_iteration = 0
+        while self.max_iterations is None or cur_iteration < self.max_iterations:
+            active = [session_id for session_id in range(len(sessions_inputs)) if outcomes[session_id] is None]
+            agent_outcomes = await asyncio.gather(
+                *(
+                    self.agent.aplan(
+                        intermediate_steps[session_id],
+                        callbacks=run_manager.get_child() if run_manager else None,
+                        **sessions_inputs[session_id],
+                    )
+                    for session_id in active
+                )
+            )
+
+            actions: List[Optional[Union[List[AgentAction], AgentAction]]] = [None] * len(sessions_inputs)
+            for session_id, agent_outcome in zip(active, agent_outcomes):
+                if isinstance(agent_outcome, AgentFinish):
+                    outcomes[session_id] = agent_outcome
+                else:
+                    actions[session_id] = agent_outcome
+
+            if all(cur_actions is None for cur_actions in actions):
+                break
+
+            action_results = await self.action_executor.aexecute_batch(
+                actions, run_manager=run_manager.get_child() if run_manager else None
+            )
+            for session_id, cur_action_results in enumerate(action_results):
+                if cur_action_results is not None:
+                    self._add_steps(intermediate_steps[session_id], cur_action_results)
+
+            cur_iteration += 1
+
+        return outcomes, intermediate_steps
+
+    def run_lockstep(
+        self, inputs: Sequence[Dict[str, Any]], config: Optional[RunnableConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """Runs the strategy on several inputs at the same time, i-th input in i-th session of the action executor.
+
+        On each iteration, the agent plans for every unfinished session, then the actions of all sessions
+        are performed in a single `execute_batch` call (e.g., one vectorized environment step
+        with VectorizedActionExecutor). Finished sessions are not stepped anymore.
+
+        The action executor has to manage independent sessions: executors with a single environment
+        raise NotImplementedError for more than one input. All the sessions are reported as a single chain run.
+
+        Args:
+            inputs: The inputs for each session.
+            config: The config with callbacks, tags and metadata of the run.
+
+        Returns:
+            The outputs for each session, in the same format as the outputs of `invoke`.
+        """
+        config = ensure_config(config)
+        sessions_inputs = [self.prep_inputs(cur_inputs) for cur_inputs in inputs]
+        callback_manager = CallbackManager.configure(
+            config.get("callbacks"),
+            self.callbacks,
+            self.verbose,
+            config.get("tags"),
+            self.tags,
+            config.get("metadata"),
+            self.metadata,
+        )
+        run_manager = callback_manager.on_chain_start(
+            dumpd(self),
+            {"sessions": sessions_inputs},
+            name=config.get("run_name") or self.get_name(),
+        )
+
+        try:
+            with self._track_run(run_manager) as run_stats:
+                outcomes, intermediate_steps = self._run_lockstep(sessions_inputs, run_manager)
+                outputs = self._lockstep_outputs(
+                    sessions_inputs, outcomes, intermediate_steps, run_manager=run_manager, run_stats=run_stats
+                )
+        except BaseException as e:
+            run_manager.on_chain_error(e)
+            raise e
+        run_manager.on_chain_end({"sessions": outputs})
+        return outputs
+
+    async def arun_lockstep(
+        self, inputs: Sequence[Dict[str, Any]], config: Optional[RunnableConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """Runs the strategy on several inputs at the same time asynchronously, i-th input in i-th session
+        of the action executor. The agent plans for all unfinished sessions concurrently.
+        See `run_lockstep` for details."""
+        config = ensure_config(config)
+        sessions_inputs = [self.prep_inputs(cur_inputs) for cur_inputs in inputs]
+        callback_manager = AsyncCallbackManager.configure(
+            config.get("callbacks"),
+            self.callbacks,
+            self.verbose,
+            config.get("tags"),
+            self.tags,
+            config.get("metadata"),
+            self.metadata,
+        )
+        run_manager = await callback_manager.on_chain_start(
+            dumpd(self),
+            {"sessions": sessions_inputs},
+            name=config.get("run_name") or self.get_name(),
+        )
+
+        try:
+            with self._track_run(run_manager) as run_stats:
+                outcomes, intermediate_steps = await self._arun_lockstep(sessions_inputs, run_manager)
+                outputs = await self._alockstep_outputs(
+                    sessions_inputs, outcomes, intermediate_steps, run_manager=run_manager, run_stats=run_stats
+                )
+        except BaseException as e:
+            await run_manager.on_chain_error(e)
+            raise e
+        await run_manager.on_chain_end({"sessions": outputs})
+        return outputs
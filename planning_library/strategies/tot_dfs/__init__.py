@@ -1,5 +1,18 @@
-from .tot_strategy import TreeOfThoughtsDFSStrategy
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .tot_strategy import TreeOfThoughtsDFSStrategy
 
 __all__ = [
     "TreeOfThoughtsDFSStrategy",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TreeOfThoughtsDFSStrategy": ".tot_strategy",
+    },
+)
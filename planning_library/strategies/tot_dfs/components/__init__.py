@@ -1,14 +1,11 @@
-from .thought_evaluator import (
-    ThoughtEvaluator,
-    ThoughtEvaluatorConfig,
-    ThoughtEvaluatorInput,
-)
-from .thought_generator import (
-    ThoughtGenerator,
-    ThoughtGeneratorConfig,
-    ThoughtGeneratorInput,
-)
-from .thought_sorter import ThoughtSorter, ThoughtSorterConfig, ThoughtSorterInput
+from typing import TYPE_CHECKING
+
+from planning_library.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .thought_evaluator import ThoughtEvaluator, ThoughtEvaluatorConfig, ThoughtEvaluatorInput
+    from .thought_generator import ThoughtGenerator, ThoughtGeneratorConfig, ThoughtGeneratorInput
+    from .thought_sorter import ThoughtSorter, ThoughtSorterConfig, ThoughtSorterInput
 
 __all__ = [
     "ThoughtGeneratorInput",
@@ -21,3 +18,19 @@ __all__ = [
     "ThoughtSorterConfig",
     "ThoughtGeneratorConfig",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ThoughtEvaluator": ".thought_evaluator",
+        "ThoughtEvaluatorConfig": ".thought_evaluator",
+        "ThoughtEvaluatorInput": ".thought_evaluator",
+        "ThoughtGenerator": ".thought_generator",
+        "ThoughtGeneratorConfig": ".thought_generator",
+        "ThoughtGeneratorInput": ".thought_generator",
+        "ThoughtSorter": ".thought_sorter",
+        "ThoughtSorterConfig": ".thought_sorter",
+        "ThoughtSorterInput": ".thought_sorter",
+    },
+)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from textwrap import dedent
-from typing import Any, Dict, Generic, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, Union
 
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.language_models import BaseChatModel
@@ -45,6 +45,16 @@ class ThoughtEvaluatorConfig:
 
     output_parser: Optional[BaseOutputParser[float]] = None
 
+    # cheap functions tried before the LLM: return a value in a 0-1 range or None when unsure
+    heuristics: Optional[Sequence[Callable[[ThoughtEvaluatorInput], Optional[float]]]] = None
+
+    # number of sampled scores per thought (see `SelfConsistencyEvaluatorComponent`), 1 disables self-consistency
+    num_votes: int = 1
+    vote_aggregation: str = "majority"
+
+    # parse the LLM output while it's generated and stop as soon as the score is found
+    stream_parsing: bool = False
+
 
 class ThoughtEvaluatorInput(TypedDict):
     inputs: Dict[str, Any]
@@ -105,6 +115,8 @@ class ThoughtEvaluator(Generic[OutputType], EvaluatorComponent[ThoughtEvaluatorI
         output_parser: Optional[BaseOutputParser[float]] = None,
         parser: Optional[BaseFunctionCallingSingleActionParser | BaseFunctionCallingMultiActionParser] = None,
         parser_name: Optional[str] = None,
+        heuristics: Optional[Sequence[Callable[[ThoughtEvaluatorInput], Optional[float]]]] = None,
+        stream_parsing: bool = False,
     ) -> "ThoughtEvaluator[float]":
         def _preprocess_input(
             inputs: ThoughtEvaluatorInput,
@@ -132,9 +144,12 @@ class ThoughtEvaluator(Generic[OutputType], EvaluatorComponent[ThoughtEvaluatorI
             user_message=user_message,
             system_message=system_message,
             output_parser=output_parser,
+            stream_parsing=stream_parsing,
         )
 
         evaluator.add_input_preprocessing(_preprocess_input)
+        if heuristics:
+            evaluator.add_cascade_stages(heuristics)
 
         return evaluator
 
@@ -146,6 +161,8 @@ class ThoughtEvaluator(Generic[OutputType], EvaluatorComponent[ThoughtEvaluatorI
                 threshold=config.value_threshold,
                 threshold_mode="geq",
             )
+            if config.heuristics:
+                evaluator.add_cascade_stages(config.heuristics)
             return evaluator
 
         if config.llm is None:
@@ -160,4 +177,6 @@ class ThoughtEvaluator(Generic[OutputType], EvaluatorComponent[ThoughtEvaluatorI
             output_parser=config.output_parser,
             parser=config.parser,
             parser_name=config.parser_name,
+            heuristics=config.heuristics,
+            stream_parsing=config.stream_parsing,
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 from itertools import combinations
 from textwrap import dedent
@@ -21,6 +20,7 @@ from planning_library.function_calling_parsers import (
     BaseFunctionCallingSingleActionParser,
     ParserRegistry,
 )
+from planning_library.primitives.output_parsers import SimpleSortOutputParser
 from planning_library.utils import (
     format_thought,
 )
@@ -46,6 +46,9 @@ class ThoughtSorterConfig:
 
     output_parser: Optional[BaseOutputParser[str]] = None
 
+    # parse the LLM output while it's generated and stop as soon as the verdict is found
+    stream_parsing: bool = False
+
 
 class ThoughtSorterInput(TypedDict):
     inputs: Dict[str, Any]
@@ -163,27 +166,29 @@ class ThoughtSorter(BaseComponent[ThoughtSorterInput, List[Union[List[AgentActio
         run_manager: Optional[CallbackManager] = None,
         **kwargs,
     ) -> List[Union[List[AgentAction], AgentAction, AgentFinish]]:
-        scores: Dict[Union[List[AgentAction], AgentAction, AgentFinish], float] = defaultdict(float)
-        for thought1, thought2 in [pair for pair in combinations(inputs["thoughts"], 2)]:
+        # thoughts are scored by their positions: agent actions (and lists of them) aren't hashable
+        thoughts = inputs["thoughts"]
+        scores = [0.0] * len(thoughts)
+        for idx1, idx2 in combinations(range(len(thoughts)), 2):
             result = self._compare_pairwise(
                 inputs=inputs["inputs"],
                 intermediate_steps=inputs["intermediate_steps"],
-                thought1=thought1,
-                thought2=thought2,
+                thought1=thoughts[idx1],
+                thought2=thoughts[idx2],
                 run_manager=run_manager,
                 **kwargs,
             )
 
             if result == "1":
-                scores[thought1] += 1
+                scores[idx1] += 1
             elif result == "2":
-                scores[thought2] += 1
+                scores[idx2] += 1
             else:
-                scores[thought1] += 0.5
-                scores[thought2] += 0.5
+                scores[idx1] += 0.5
+                scores[idx2] += 0.5
 
-        sorted_scores = sorted(scores, key=lambda x: scores[x], reverse=True)
-        return [key for key in sorted_scores]
+        sorted_idxs = sorted(range(len(thoughts)), key=lambda idx: scores[idx], reverse=True)
+        return [thoughts[idx] for idx in sorted_idxs]
 
     async def ainvoke(
         self,
@@ -191,31 +196,33 @@ class ThoughtSorter(BaseComponent[ThoughtSorterInput, List[Union[List[AgentActio
         run_manager: Optional[AsyncCallbackManager] = None,
         **kwargs,
     ) -> List[Union[List[AgentAction], AgentAction, AgentFinish]]:
-        scores: Dict[Union[List[AgentAction], AgentAction, AgentFinish], float] = defaultdict(float)
-        for thought1, thought2 in [pair for pair in combinations(inputs["thoughts"], 2)]:
+        # thoughts are scored by their positions: agent actions (and lists of them) aren't hashable
+        thoughts = inputs["thoughts"]
+        scores = [0.0] * len(thoughts)
+        for idx1, idx2 in combinations(range(len(thoughts)), 2):
             result = await self._acompare_pairwise(
                 inputs=inputs["inputs"],
                 intermediate_steps=inputs["intermediate_steps"],
-                thought1=thought1,
-                thought2=thought2,
+                thought1=thoughts[idx1],
+                thought2=thoughts[idx2],
                 run_manager=run_manager,
             )
 
             if result == "1":
-                scores[thought1] += 1
+                scores[idx1] += 1
             elif result == "2":
-                scores[thought2] += 1
+                scores[idx2] += 1
             else:
-                scores[thought1] += 0.5
-                scores[thought2] += 0.5
+                scores[idx1] += 0.5
+                scores[idx2] += 0.5
 
-        sorted_scores = sorted(scores, key=lambda x: scores[x], reverse=True)
-        return [key for key in sorted_scores]
+        sorted_idxs = sorted(range(len(thoughts)), key=lambda idx: scores[idx], reverse=True)
+        return [thoughts[idx] for idx in sorted_idxs]
 
     @classmethod
     def create_from_config(cls, config: ThoughtSorterConfig) -> ThoughtSorter:
         def _preprocess_input(
-            inputs: ThoughtSorterInput,
+            inputs: ThoughtSorterRunnableInput,
         ) -> Dict:
             # TODO: figure out typing here
             nonlocal config
@@ -225,10 +232,10 @@ class ThoughtSorter(BaseComponent[ThoughtSorterInput, List[Union[List[AgentActio
             else:
                 parser = config.parser
 
-            intermediate_steps = parser.format_inputs(inputs)["agent_scratchpad"]
+            # inputs of a single comparison: the task inputs and both thoughts are already formatted by the sorter
+            intermediate_steps = parser.format_inputs(inputs)["agent_scratchpad"]  # type: ignore[arg-type]
             return {
-                **inputs["inputs"],
-                "thoughts": inputs["thoughts"],
+                **inputs,
                 "intermediate_steps": intermediate_steps,
             }
 
@@ -238,11 +245,6 @@ class ThoughtSorter(BaseComponent[ThoughtSorterInput, List[Union[List[AgentActio
         if config.llm is None:
             raise ValueError("`llm` must be provided when `runnable` is None.")
 
-        if config.output_parser is None:
-            raise ValueError(
-                "Default output parser for thought sorter is not implemented yet.`output_parser` must be provided when `runnable` is None."
-            )
-
         prompt = cls._process_prompt(
             prompt=config.prompt,
             user_message=config.user_message,
@@ -250,7 +252,10 @@ class ThoughtSorter(BaseComponent[ThoughtSorterInput, List[Union[List[AgentActio
         )
 
         sorter_runnable = RunnableComponent.create_from_steps(
-            prompt=prompt, llm=config.llm, output_parser=config.output_parser
+            prompt=prompt,
+            llm=config.llm,
+            output_parser=config.output_parser if config.output_parser is not None else SimpleSortOutputParser(),
+            stream_parsing=config.stream_parsing,
         )
 
         sorter_runnable.add_input_preprocessing(_preprocess_input)
@@ -18,6 +18,10 @@ from langchain_core.callbacks import (
 )
 
 from ...action_executors import BaseActionExecutor, LangchainActionExecutor, MetaTools
+from ...components import BaseComponent
+from ...components.evaluation import EvaluatorComponent, SelfConsistencyEvaluatorComponent
+from ...instrumentation import track_phase
+from ...instrumentation.metrics import TOT_FRONTIER_SIZE, TOT_NODES_CREATED
 from ..base_strategy import BaseCustomStrategy
 from .components import (
     ThoughtEvaluator,
@@ -43,8 +47,10 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
 
     action_executor: BaseActionExecutor
     thought_generator: ThoughtGenerator
-    thought_evaluator: ThoughtEvaluator
-    thought_sorter: Optional[ThoughtSorter] = None
+    thought_evaluator: EvaluatorComponent[ThoughtEvaluatorInput, float]
+    thought_sorter: Optional[BaseComponent[ThoughtSorterInput, List[List[AgentAction] | AgentAction | AgentFinish]]] = (
+        None
+    )
     do_sorting: bool = False  # True for DFS (Tree of Thoughts), False for DFSDT (ToolLLM)
     root: Optional[ToTNode] = None
     terminals: List[ToTNode] = []
@@ -64,6 +70,10 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
         else:
             return self.agent.return_values
 
+    def with_action_executor(self, action_executor: BaseActionExecutor) -> TreeOfThoughtsDFSStrategy:
+        """Returns a copy of the current strategy that uses a given action executor and starts with an empty tree."""
+        return self._shallow_copy(action_executor=action_executor, root=None, terminals=[])
+
     @classmethod
     def create(
         cls,
@@ -102,7 +112,13 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
             raise ValueError("Default thought sorter config is currently not supported.")
 
         generator = ThoughtGenerator.create_from_config(generator_config)
-        evaluator = ThoughtEvaluator.create_from_config(evaluator_config)
+        evaluator: EvaluatorComponent[ThoughtEvaluatorInput, float] = ThoughtEvaluator.create_from_config(
+            evaluator_config
+        )
+        if evaluator_config.num_votes > 1:
+            evaluator = SelfConsistencyEvaluatorComponent.from_evaluator(
+                evaluator, num_votes=evaluator_config.num_votes, aggregation=evaluator_config.vote_aggregation
+            )
         sorter = ThoughtSorter.create_from_config(sorter_config) if do_sorting else None  # type: ignore[arg-type]
 
         if action_executor is None:
@@ -141,30 +157,36 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
         """
 
         # 1: generate k possible next steps
-        thoughts = self.thought_generator.invoke(
-            ThoughtGeneratorInput(inputs=inputs, intermediate_steps=trajectory),
-            run_manager=run_manager.get_child(tag="generate_thoughts") if run_manager else None,
-        )
+        with track_phase("generate"):
+            thoughts = self.thought_generator.invoke(
+                ThoughtGeneratorInput(inputs=inputs, intermediate_steps=trajectory),
+                run_manager=run_manager.get_child(tag="generate_thoughts") if run_manager else None,
+            )
 
         # 2: (optional) sort them
         if self.do_sorting:
             assert self.thought_sorter is not None, "Sorting enabled, but thought sorter was not passed."
-            thoughts = self.thought_sorter.invoke(
-                ThoughtSorterInput(thoughts=thoughts, inputs=inputs, intermediate_steps=trajectory),
-                run_manager=run_manager.get_child(tag="sort_thoughts") if run_manager else None,
-            )
-
-        for cur_thought in thoughts:
-            # 3: evaluate each thought
-            cur_thought_should_continue = self.thought_evaluator.invoke(
-                ThoughtEvaluatorInput(
-                    inputs=inputs,
-                    intermediate_steps=trajectory,
-                    next_thought=cur_thought,
-                ),
+            with track_phase("sort"):
+                thoughts = self.thought_sorter.invoke(
+                    ThoughtSorterInput(thoughts=thoughts, inputs=inputs, intermediate_steps=trajectory),
+                    run_manager=run_manager.get_child(tag="sort_thoughts") if run_manager else None,
+                )
+
+        # 3: evaluate all thoughts in a single batched call
+        with track_phase("evaluate"):
+            should_continue = self.thought_evaluator.batch(
+                [
+                    ThoughtEvaluatorInput(
+                        inputs=inputs,
+                        intermediate_steps=trajectory,
+                        next_thought=cur_thought,
+                    )
+                    for cur_thought in thoughts
+                ],
                 run_manager=run_manager.get_child(tag="evaluate_thought") if run_manager else None,
             )
 
+        for cur_thought, cur_thought_should_continue in zip(thoughts, should_continue):
             # 4: proceed only with thoughts with value above a certain threshold
             if cur_thought_should_continue:
                 yield cur_thought
@@ -194,6 +216,7 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
 
         cur_step = 0
         while frontier and cur_step < self.max_iterations:
+            TOT_FRONTIER_SIZE.observe(len(frontier))
             cur_node = frontier.pop()
 
             # TODO: traverses from the tree root to the cur_node on each call. how to optimize?
@@ -209,22 +232,26 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
                     observation = None
                 else:
                     # reset to parent node state
-                    self.action_executor.reset(
-                        actions=[t[0] for t in trajectory],
-                        run_manager=run_manager.get_child() if run_manager else None,
-                    )
+                    with track_phase("reset"):
+                        self.action_executor.reset(
+                            actions=[t[0] for t in trajectory],
+                            run_manager=run_manager.get_child() if run_manager else None,
+                        )
                     # execute action
-                    observation = self.action_executor.execute(
-                        actions=new_thought,
-                        run_manager=run_manager.get_child() if run_manager else None,
-                    )
+                    with track_phase("execute"):
+                        observation = self.action_executor.execute(
+                            actions=new_thought,
+                            run_manager=run_manager.get_child() if run_manager else None,
+                        )
 
                 new_node = ToTNode(parent=cur_node, thought=new_thought, observation=observation)
 
                 cur_node.children.append(new_node)
                 if isinstance(new_thought, AgentFinish):
+                    TOT_NODES_CREATED.labels("terminal").inc()
                     self.terminals.append(new_node)
                 else:
+                    TOT_NODES_CREATED.labels("intermediate").inc()
                     frontier.appendleft(new_node)
 
             cur_step += 1
@@ -256,30 +283,36 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
         """
 
         # 1: generate k possible next steps
-        thoughts = await self.thought_generator.ainvoke(
-            ThoughtGeneratorInput(inputs=inputs, intermediate_steps=trajectory),
-            run_manager=run_manager.get_child(tag="generate_thoughts") if run_manager else None,
-        )
+        with track_phase("generate"):
+            thoughts = await self.thought_generator.ainvoke(
+                ThoughtGeneratorInput(inputs=inputs, intermediate_steps=trajectory),
+                run_manager=run_manager.get_child(tag="generate_thoughts") if run_manager else None,
+            )
 
         # 2: (optional) sort them
         if self.do_sorting:
             assert self.thought_sorter is not None, "Sorting enabled, but thought sorter was not passed."
-            thoughts = await self.thought_sorter.ainvoke(
-                ThoughtSorterInput(thoughts=thoughts, inputs=inputs, intermediate_steps=trajectory),
-                run_manager=run_manager.get_child(tag="sort_thoughts") if run_manager else None,
-            )
-
-        for cur_thought in thoughts:
-            # 3: evaluate each thought
-            cur_thought_should_continue = await self.thought_evaluator.ainvoke(
-                ThoughtEvaluatorInput(
-                    inputs=inputs,
-                    intermediate_steps=trajectory,
-                    next_thought=cur_thought,
-                ),
+            with track_phase("sort"):
+                thoughts = await self.thought_sorter.ainvoke(
+                    ThoughtSorterInput(thoughts=thoughts, inputs=inputs, intermediate_steps=trajectory),
+                    run_manager=run_manager.get_child(tag="sort_thoughts") if run_manager else None,
+                )
+
+        # 3: evaluate all thoughts in a single batched call
+        with track_phase("evaluate"):
+            should_continue = await self.thought_evaluator.abatch(
+                [
+                    ThoughtEvaluatorInput(
+                        inputs=inputs,
+                        intermediate_steps=trajectory,
+                        next_thought=cur_thought,
+                    )
+                    for cur_thought in thoughts
+                ],
                 run_manager=run_manager.get_child(tag="evaluate_thought") if run_manager else None,
             )
 
+        for cur_thought, cur_thought_should_continue in zip(thoughts, should_continue):
             # 4: proceed only with thoughts with value above a certain threshold
             if cur_thought_should_continue:
                 yield cur_thought
@@ -309,6 +342,7 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
 
         cur_step = 0
         while frontier and cur_step < self.max_iterations:
+            TOT_FRONTIER_SIZE.observe(len(frontier))
             cur_node = frontier.pop()
 
             # TODO: traverses from the tree root to the cur_node on each call. how to optimize?
@@ -324,21 +358,25 @@ class TreeOfThoughtsDFSStrategy(BaseCustomStrategy):
                     observation = None
                 else:
                     # reset to parent node state
-                    await self.action_executor.areset(
-                        actions=[t[0] for t in trajectory],
-                        run_manager=run_manager.get_child() if run_manager else None,
-                    )
+                    with track_phase("reset"):
+                        await self.action_executor.areset(
+                            actions=[t[0] for t in trajectory],
+                            run_manager=run_manager.get_child() if run_manager else None,
+                        )
                     # execute action
-                    observation = await self.action_executor.aexecute(
-                        actions=new_thought,
-                        run_manager=run_manager.get_child() if run_manager else None,
-                    )
+                    with track_phase("execute"):
+                        observation = await self.action_executor.aexecute(
+                            actions=new_thought,
+                            run_manager=run_manager.get_child() if run_manager else None,
+                        )
 
                 new_node = ToTNode(parent=cur_node, thought=new_thought, observation=observation)
                 cur_node.children.append(new_node)
                 if isinstance(new_thought, AgentFinish):
+                    TOT_NODES_CREATED.labels("terminal").inc()
                     self.terminals.append(new_node)
                 else:
+                    TOT_NODES_CREATED.labels("intermediate").inc()
                     frontier.appendleft(new_node)
 
             cur_step += 1
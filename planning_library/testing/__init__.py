@@ -0,0 +1,8 @@
+from .scripted_chat_model import (
+    ScriptedChatModel,
+    StreamingScriptedChatModel,
+    function_call_message,
+    tool_calls_message,
+)
+
+__all__ = ["ScriptedChatModel", "StreamingScriptedChatModel", "tool_calls_message", "function_call_message"]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.pydantic_v1 import PrivateAttr
+
+ScriptedResponse = Union[str, AIMessage]
+
+
+def tool_calls_message(*tool_calls: Tuple[str, Dict[str, Any]], content: str = "") -> AIMessage:
+    """Creates an AIMessage with tool calls in OpenAI format (understood by `openai-tools` parser).
+
+    Args:
+        tool_calls: Pairs (tool name, tool arguments).
+        content: Text content of the message.
+    """
+    return AIMessage(
+        content=content,
+        additional_kwargs={
+            "tool_calls": [
+                {
+                    "id": f"call_{i}",
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(args)},
+                }
+                for i, (name, args) in enumerate(tool_calls)
+            ]
+        },
+    )
+
+
+def function_call_message(name: str, args: Dict[str, Any], content: str = "") -> AIMessage:
+    """Creates an AIMessage with a function call in OpenAI format (understood by `openai-functions` parser).
+
+    Args:
+        name: Function name.
+        args: Function arguments.
+        content: Text content of the message.
+    """
+    return AIMessage(
+        content=content,
+        additional_kwargs={"function_call": {"name": name, "arguments": json.dumps(args)}},
+    )
+
+
+def _count_tokens(message: BaseMessage) -> int:
+    """Deterministic token estimate: a number of whitespace-separated words, including tool calls."""
+    num_tokens = len(str(message.content).split())
+    if message.additional_kwargs:
+        num_tokens += len(json.dumps(message.additional_kwargs).split())
+    return num_tokens
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Deterministic chat model that replies according to a script. Useful for tests and for
+    measuring the overhead of the library itself, separately from the latency of real models.
+
+    Replies are taken either from `respond` – a function of the input messages – or from `responses`,
+    in the order of calls. Prefer `respond` when the model is shared by concurrent runs: the order of calls
+    is not deterministic then, but the inputs are. Tools bound via `bind(tools=...)` are accepted and ignored.
+
+    Token usage is reported in `llm_output` as a number of whitespace-separated words.
+
+    Args:
+        responses: Replies returned in the order of calls. Strings are converted to AIMessages.
+        respond: Function that accepts input messages and returns a reply. Takes precedence over `responses`.
+        cycle: If True, `responses` are repeated once exhausted. Otherwise, an error is raised.
+        latency: Simulated latency of a single call in seconds (`time.sleep` for sync calls,
+          `asyncio.sleep` for async ones).
+        latency_per_token: Additional simulated latency per completion token in seconds.
+    """
+
+    responses: List[ScriptedResponse] = []
+    respond: Optional[Callable[[List[BaseMessage]], ScriptedResponse]] = None
+    cycle: bool = True
+    latency: float = 0.0
+    latency_per_token: float = 0.0
+
+    _num_calls: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-chat"
+
+    @property
+    def num_calls(self) -> int:
+        """Number of calls made so far."""
+        return self._num_calls
+
+    def reset(self) -> None:
+        """Starts `responses` from the beginning."""
+        with self._lock:
+            self._num_calls = 0
+
+    def _next_response(self, messages: List[BaseMessage]) -> AIMessage:
+        with self._lock:
+            call_idx = self._num_calls
+            self._num_calls += 1
+
+        if self.respond is not None:
+            response = self.respond(messages)
+        else:
+            if not self.responses:
+                raise ValueError("Either `responses` or `respond` must be provided.")
+            if call_idx >= len(self.responses) and not self.cycle:
+                raise ValueError(f"Script is exhausted: only {len(self.responses)} responses are available.")
+            response = self.responses[call_idx % len(self.responses)]
+
+        if isinstance(response, str):
+            return AIMessage(content=response)
+        return self._copy_response(response, call_idx)
+
+    @staticmethod
+    def _copy_response(response: AIMessage, call_idx: int) -> AIMessage:
+        """Copies a scripted reply so that each call gets its own message.
+
+        Ids of tool calls are made unique across calls: scratchpad formatting drops duplicate messages,
+        so repeated replies with the same ids would be lost from the history otherwise.
+        """
+        additional_kwargs = copy.deepcopy(response.additional_kwargs)
+        for i, tool_call in enumerate(additional_kwargs.get("tool_calls", [])):
+            tool_call["id"] = f"call_{call_idx}_{i}"
+        return AIMessage(content=response.content, additional_kwargs=additional_kwargs)
+
+    def _make_result(self, messages: Sequence[BaseMessage], message: AIMessage) -> ChatResult:
+        prompt_tokens = sum(_count_tokens(m) for m in messages)
+        completion_tokens = _count_tokens(message)
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={
+                "token_usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+                "model_name": self._llm_type,
+            },
+        )
+
+    def _combine_llm_outputs(self, llm_outputs: List[Optional[dict]]) -> dict:
+        """Sums token usage over the results of a `generate` call (as real chat models do)."""
+        token_usage: Dict[str, int] = {}
+        for llm_output in llm_outputs:
+            for key, value in (llm_output or {}).get("token_usage", {}).items():
+                token_usage[key] = token_usage.get(key, 0) + value
+        return {"token_usage": token_usage, "model_name": self._llm_type}
+
+    def _delay(self, message: AIMessage) -> float:
+        return self.latency + self.latency_per_token * _count_tokens(message)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._next_response(messages)
+        delay = self._delay(message)
+        if delay > 0:
+            time.sleep(delay)
+        return self._make_result(messages, message)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._next_response(messages)
+        delay = self._delay(message)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._make_result(messages, message)
+
+
+class StreamingScriptedChatModel(ScriptedChatModel):
+    """`ScriptedChatModel` that also supports streaming: text content is streamed word by word
+    (tool calls, if any, come with the first chunk).
+
+    Simulated latency is spread over the stream: `latency` before the first chunk, `latency_per_token`
+    before each word, so stopping a stream early saves time as with real models.
+    The number of words streamed so far is available as `num_streamed_tokens`.
+    """
+
+    _num_streamed_tokens: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-chat-streaming"
+
+    @property
+    def num_streamed_tokens(self) -> int:
+        """Number of words streamed so far (tokens that were not requested are not counted)."""
+        return self._num_streamed_tokens
+
+    def _chunks(self, message: AIMessage) -> Iterator[ChatGenerationChunk]:
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", additional_kwargs=message.additional_kwargs))
+        for word in re.findall(r"\S+\s*", str(message.content)):
+            with self._lock:
+                self._num_streamed_tokens += 1
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word))
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        message = self._next_response(messages)
+        if self.latency > 0:
+            time.sleep(self.latency)
+        for i, chunk in enumerate(self._chunks(message)):
+            if i > 0 and self.latency_per_token > 0:
+                time.sleep(self.latency_per_token)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._next_response(messages)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        for i, chunk in enumerate(self._chunks(message)):
+            if i > 0 and self.latency_per_token > 0:
+                await asyncio.sleep(self.latency_per_token)
+            yield chunk
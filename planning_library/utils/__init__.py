@@ -1,6 +1,12 @@
-from .actions_utils import aperform_agent_action, get_tools_maps, perform_agent_action
-from .convert_runnable_to_agent import convert_runnable_to_agent
-from .format_agent_outputs import format_thought, format_thoughts
+from typing import TYPE_CHECKING
+
+from .lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .actions_utils import aperform_agent_action, get_tools_maps, perform_agent_action
+    from .convert_runnable_to_agent import convert_runnable_to_agent
+    from .env_worker import arun_in_env_worker, get_env_worker
+    from .format_agent_outputs import format_thought, format_thoughts
 
 __all__ = [
     "convert_runnable_to_agent",
@@ -9,4 +15,21 @@ __all__ = [
     "get_tools_maps",
     "format_thought",
     "format_thoughts",
+    "get_env_worker",
+    "arun_in_env_worker",
 ]
+
+# submodules are only imported when their exports are accessed
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "aperform_agent_action": ".actions_utils",
+        "get_tools_maps": ".actions_utils",
+        "perform_agent_action": ".actions_utils",
+        "convert_runnable_to_agent": ".convert_runnable_to_agent",
+        "arun_in_env_worker": ".env_worker",
+        "get_env_worker": ".env_worker",
+        "format_thought": ".format_agent_outputs",
+        "format_thoughts": ".format_agent_outputs",
+    },
+)
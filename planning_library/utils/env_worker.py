@@ -0,0 +1,34 @@
+import asyncio
+import contextvars
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_env_workers: "weakref.WeakKeyDictionary[Any, ThreadPoolExecutor]" = weakref.WeakKeyDictionary()
+_env_workers_lock = threading.Lock()
+
+
+def get_env_worker(env: Any) -> ThreadPoolExecutor:
+    """Returns a dedicated single-thread worker for a given environment.
+
+    All calls for the same environment go through the same thread, so they are executed sequentially and never
+    block the default executor of the event loop. The worker is shut down once the environment is garbage-collected.
+    """
+    with _env_workers_lock:
+        worker = _env_workers.get(env)
+        if worker is None:
+            worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"env-worker-{type(env).__name__}")
+            _env_workers[env] = worker
+            weakref.finalize(env, worker.shutdown, wait=False)
+        return worker
+
+
+async def arun_in_env_worker(env: Any, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs `func` in the dedicated worker thread of a given environment without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_env_worker(env), partial(context.run, func, *args, **kwargs))
@@ -8,6 +8,8 @@ from langchain.tools import BaseTool
 from langchain_core.agents import AgentAction
 from langchain_core.callbacks import CallbackManager
 
+from .env_worker import arun_in_env_worker
+
 ObsType = TypeVar("ObsType")
 
 
@@ -18,6 +20,9 @@ class GymEnvResetTool(BaseTool, BaseModel, Generic[ObsType]):
 
     name: str = "reset"
     description: str = "Resets the environment state."
+    offload: bool = True
+    """If True, asynchronous resets are run in a dedicated worker thread of the environment, so heavy resets
+    (e.g., ALFWorld) don't block the event loop. Set to False for cheap environments to run resets inline."""
 
     class Config(BaseTool.Config):
         pass
@@ -29,3 +34,13 @@ class GymEnvResetTool(BaseTool, BaseModel, Generic[ObsType]):
         options: Dict[str, Any] | None = None,
     ) -> Tuple[ObsType, Dict[str, Any]]:
         return self.env.reset(seed=seed, options=options)  # type: ignore[reportReturnType]
+
+    async def _arun(
+        self,
+        *,
+        seed: int | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Tuple[ObsType, Dict[str, Any]]:
+        if self.offload:
+            return await arun_in_env_worker(self.env, self._run, seed=seed, options=options)
+        return self._run(seed=seed, options=options)
@@ -0,0 +1,31 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Creates module-level `__getattr__` and `__dir__` (PEP 562) that import exported names
+    from submodules on first access.
+
+    This way, importing a package doesn't import all of its submodules (and their dependencies) at once.
+    Exported names are cached on the package after the first access.
+
+    Args:
+        package: Name of the package (`__name__`).
+        exports: Mapping from exported names to relative names of the submodules that define them (e.g., `.module`).
+
+    Returns:
+        A tuple (`__getattr__`, `__dir__`).
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.agents import AgentAction
+from langchain_core.tools import StructuredTool
+
+from planning_library.action_executors import LangchainActionExecutor
+
+
+def _fail(x: str) -> str:
+    raise TimeoutError("tool's own timeout")
+
+
+def _sleep(x: str) -> str:
+    time.sleep(0.5)
+    return "done"
+
+
+async def _asleep(x: str) -> str:
+    await asyncio.sleep(0.5)
+    return "done"
+
+
+failing = StructuredTool.from_function(func=_fail, name="failing", description="Raises its own TimeoutError.")
+slow = StructuredTool.from_function(func=_sleep, name="slow", description="Takes a while.")
+aslow = StructuredTool.from_function(coroutine=_asleep, name="aslow", description="Takes a while.")
+
+
+def _action(tool_name: str) -> AgentAction:
+    return AgentAction(tool=tool_name, tool_input={"x": "1"}, log="")
+
+
+@pytest.mark.parametrize("timeout", [None, 5.0])
+def test_tool_timeout_error_is_not_an_executor_timeout(timeout) -> None:
+    action_executor = LangchainActionExecutor([failing], timeout=timeout)
+
+    with pytest.raises(TimeoutError, match="tool's own timeout"):
+        action_executor.execute(_action("failing"))
+    with pytest.raises(TimeoutError, match="tool's own timeout"):
+        asyncio.run(action_executor.aexecute(_action("failing")))
+
+
+def test_timeout_observation() -> None:
+    action_executor = LangchainActionExecutor([slow, aslow], timeout=0.05)
+
+    assert action_executor.execute(_action("slow")).observation == "Tool `slow` timed out after 0.05 seconds."
+    step = asyncio.run(action_executor.aexecute(_action("aslow")))
+    assert step.observation == "Tool `aslow` timed out after 0.05 seconds."
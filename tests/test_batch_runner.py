@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.scenarios import ENVIRONMENTS, create_run
+from planning_library.action_executors import LangchainActionExecutor
+from planning_library.runners import arun_batch
+from planning_library.runners.batch_runner import retry_backoff
+from planning_library.strategies.adapt import ADaPTStrategy
+
+
+class _CountingActionExecutor(LangchainActionExecutor):
+    def __init__(self, env: Any):
+        super().__init__(env.tools)
+        self.num_executions = 0
+
+    async def aexecute(self, actions, run_manager=None, **kwargs):  # type: ignore[override]
+        self.num_executions += 1
+        return await super().aexecute(actions, run_manager, **kwargs)
+
+
+async def _collect(results) -> List[Any]:
+    return [result async for result in results]
+
+
+def test_adapt_batch_uses_action_executor_of_each_task() -> None:
+    run = create_run("adapt", "game_of_24")
+    assert isinstance(run.runnable, ADaPTStrategy)
+    env_spec = ENVIRONMENTS["game_of_24"]
+    action_executors: List[_CountingActionExecutor] = []
+
+    def _action_executor_factory(inputs: Dict[str, Any]) -> _CountingActionExecutor:
+        env = env_spec.create_env()
+        env_spec.reset_env(env)
+        action_executors.append(_CountingActionExecutor(env))
+        return action_executors[-1]
+
+    results = asyncio.run(_collect(run.runnable.arun_batch([run.inputs] * 3, _action_executor_factory)))
+
+    assert all(result.is_successful for result in results)
+    assert len(action_executors) == 3
+    assert all(action_executor.num_executions > 0 for action_executor in action_executors)
+    assert len({action_executor.num_executions for action_executor in action_executors}) == 1
+
+
+@pytest.mark.parametrize("num_attempts", [1, 2, 3, 10])
+def test_retry_backoff_grows_exponentially(num_attempts: int) -> None:
+    delay = min(8.0, 0.5 * 2 ** (num_attempts - 1))
+    for _ in range(20):
+        assert delay / 2 <= retry_backoff(num_attempts, retry_delay=0.5, max_retry_delay=8.0) <= delay
+
+
+def test_retries_wait_before_next_attempt() -> None:
+    attempt_times: List[float] = []
+
+    async def _flaky_task(inputs: Dict[str, Any]) -> str:
+        attempt_times.append(time.perf_counter())
+        if len(attempt_times) < 3:
+            raise RuntimeError("temporary failure")
+        return "done"
+
+    results = asyncio.run(_collect(arun_batch([{}], _flaky_task, max_retries=2, retry_delay=0.05)))
+
+    assert results[0].outputs == "done" and results[0].num_attempts == 3
+    # delays are drawn from [0.025, 0.05] before the second attempt and from [0.05, 0.1] before the third one
+    assert attempt_times[1] - attempt_times[0] >= 0.025
+    assert attempt_times[2] - attempt_times[1] >= 0.05
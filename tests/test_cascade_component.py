@@ -0,0 +1,74 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from planning_library.components.evaluation import CascadeComponent, CascadeStage
+from planning_library.instrumentation.metrics import CASCADE_VERDICTS
+
+
+class _Stage:
+    """Returns a fixed score for each input and records the inputs it has been called on."""
+
+    def __init__(self, name: str, scores: Dict[str, Optional[float]]):
+        self.__name__ = name
+        self.scores = scores
+        self.calls: List[str] = []
+
+    def __call__(self, inputs: Dict[str, str]) -> Optional[float]:
+        self.calls.append(inputs["thought"])
+        return self.scores.get(inputs["thought"])
+
+
+def _create_cascade(prefix: str) -> Tuple[CascadeComponent[Dict[str, str], float], Tuple[_Stage, _Stage, _Stage]]:
+    rules = _Stage(f"{prefix}_rules", {"a": 0.0})
+    small_model = _Stage(f"{prefix}_small_model", {"a": 0.9, "b": 0.95, "c": 0.5, "d": 0.4})
+    large_model = _Stage(f"{prefix}_large_model", {"c": 0.6, "d": 0.5})
+    cascade: CascadeComponent[Dict[str, str], float] = CascadeComponent(
+        [
+            CascadeStage(rules),
+            # only the scores far from the threshold are trusted
+            CascadeStage(small_model, is_confident=lambda score: score is not None and abs(score - 0.5) > 0.3),
+            # never confident, but the last stage is accepted anyway
+            CascadeStage(large_model, is_confident=lambda score: False),
+        ]
+    )
+    return cascade, (rules, small_model, large_model)
+
+
+def test_cascade_stops_at_first_confident_stage() -> None:
+    cascade, (rules, small_model, large_model) = _create_cascade("sync")
+
+    outputs = cascade.batch([{"thought": thought} for thought in ("a", "b", "c", "d")])
+
+    assert outputs == [0.0, 0.95, 0.6, 0.5]
+    assert rules.calls == ["a", "b", "c", "d"]
+    assert small_model.calls == ["b", "c", "d"]
+    assert large_model.calls == ["c", "d"]
+    assert CASCADE_VERDICTS.labels("sync_rules").value == 1
+    assert CASCADE_VERDICTS.labels("sync_small_model").value == 1
+    assert CASCADE_VERDICTS.labels("sync_large_model").value == 2
+
+
+def test_cascade_stops_at_first_confident_stage_async() -> None:
+    cascade, (rules, small_model, large_model) = _create_cascade("async")
+
+    outputs = asyncio.run(cascade.abatch([{"thought": thought} for thought in ("a", "b", "c", "d")]))
+
+    assert outputs == [0.0, 0.95, 0.6, 0.5]
+    assert small_model.calls == ["b", "c", "d"]
+    assert large_model.calls == ["c", "d"]
+
+
+def test_last_stage_is_always_accepted() -> None:
+    cascade, (rules, small_model, large_model) = _create_cascade("last")
+
+    # no stage has a score for it, so the last stage's None is accepted
+    assert cascade.invoke({"thought": "e"}) is None
+    assert large_model.calls == ["e"]
+    assert CASCADE_VERDICTS.labels("last_large_model").value == 1
+
+
+def test_later_stages_are_skipped_when_all_inputs_are_decided() -> None:
+    cascade, (rules, small_model, large_model) = _create_cascade("skip")
+
+    assert cascade.batch([{"thought": "a"}, {"thought": "b"}]) == [0.0, 0.95]
+    assert large_model.calls == []
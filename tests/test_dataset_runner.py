@@ -0,0 +1,34 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from planning_library.runners import load_results
+from planning_library.runners.dataset_runner import _arun_shard
+
+
+async def _echo(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return {"echo": inputs["x"]}
+
+
+def test_resumed_shard_drops_partial_last_line(tmp_path: Path) -> None:
+    output_path = tmp_path / "shard-0.jsonl"
+    complete_record = {"task_id": "0", "inputs": {"x": 0}, "outputs": {"echo": 0}, "error": None, "num_attempts": 1}
+    # the worker crashed in the middle of writing the record of task 1
+    output_path.write_text(json.dumps(complete_record) + "\n" + '{"task_id": "1", "inpu', encoding="utf-8")
+
+    asyncio.run(_arun_shard([("1", {"x": 1}), ("2", {"x": 2})], _echo, output_path, 2, 0))
+
+    results = load_results(tmp_path)
+    assert sorted(results) == ["0", "1", "2"]
+    assert all(record["error"] is None for record in results.values())
+    assert output_path.read_text(encoding="utf-8").count("\n") == 3
+
+
+def test_partial_line_without_complete_records(tmp_path: Path) -> None:
+    output_path = tmp_path / "shard-0.jsonl"
+    output_path.write_text('{"task_id": "0", "inpu', encoding="utf-8")
+
+    asyncio.run(_arun_shard([("0", {"x": 0})], _echo, output_path, 1, 0))
+
+    assert sorted(load_results(tmp_path)) == ["0"]
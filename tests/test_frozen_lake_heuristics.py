@@ -0,0 +1,68 @@
+from typing import Any, List, Tuple
+
+from langchain_core.agents import AgentAction, AgentFinish
+
+from environments.frozen_lake.common.heuristics import FrozenLakeHeuristics
+from environments.frozen_lake.common.tools import MoveTool
+
+BOARD = ["SFFF", "FHFH", "FFFH", "HFFG"]
+
+
+def _move(direction: str) -> AgentAction:
+    return AgentAction(tool="move", tool_input={"direction": direction}, log="")
+
+
+def _step(direction: str, row: int, col: int, reward: float = 0.0, terminated: bool = False) -> Tuple[AgentAction, Any]:
+    # the same observation as MoveTool returns
+    position = MoveTool._convert_frozenlake_observation_to_position(
+        observation=row * len(BOARD[0]) + col, nrow=len(BOARD)
+    )
+    return _move(direction), (position, reward, terminated, False, {})
+
+
+def _inputs(next_thought: Any, *steps: Tuple[AgentAction, Any]):
+    return {"inputs": {}, "intermediate_steps": list(steps), "next_thought": next_thought}
+
+
+def test_position_is_read_as_column_then_row() -> None:
+    heuristics = FrozenLakeHeuristics(BOARD)
+    steps: List[Tuple[AgentAction, Any]] = [_step("down", row=1, col=0)]
+
+    assert heuristics._position(steps) == (1, 0)
+    assert heuristics._position([]) == (0, 0)
+
+
+def test_move_into_hole() -> None:
+    heuristics = FrozenLakeHeuristics(BOARD)
+
+    # (1, 1) is a hole
+    assert heuristics.evaluate_thought(_inputs(_move("right"), _step("down", row=1, col=0))) == 0.0
+    assert heuristics.evaluate_thought(_inputs([_move("right"), _move("down")])) == 0.0
+    # moving after the episode has ended
+    assert heuristics.evaluate_thought(_inputs(_move("up"), _step("down", row=3, col=0, terminated=True))) == 0.0
+
+
+def test_move_onto_goal() -> None:
+    heuristics = FrozenLakeHeuristics(BOARD)
+    step = _step("right", row=3, col=2)
+
+    assert heuristics.evaluate_thought(_inputs(_move("right"), step)) == 1.0
+    assert heuristics.evaluate_thought(_inputs(_move("up"), step)) is None
+
+
+def test_finish() -> None:
+    heuristics = FrozenLakeHeuristics(BOARD)
+    finish = AgentFinish(return_values={}, log="")
+
+    assert (
+        heuristics.evaluate_thought(_inputs(finish, _step("right", row=3, col=3, reward=1.0, terminated=True))) == 1.0
+    )
+    assert heuristics.evaluate_thought(_inputs(finish, _step("right", row=2, col=2))) == 0.0
+
+
+def test_evaluate_episode() -> None:
+    heuristics = FrozenLakeHeuristics(BOARD)
+
+    assert heuristics.evaluate_episode(_inputs(None, _step("right", row=3, col=3, reward=1.0, terminated=True))) == 1.0
+    assert heuristics.evaluate_episode(_inputs(None, _step("right", row=1, col=1, terminated=True))) == 0.0
+    assert heuristics.evaluate_episode(_inputs(None, _step("down", row=1, col=0))) is None
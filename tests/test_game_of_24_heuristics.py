@@ -0,0 +1,69 @@
+from typing import Any
+
+from langchain_core.agents import AgentAction, AgentFinish
+
+from environments.game_of_24.heuristics import apply_action, evaluate_episode, evaluate_thought, is_solvable
+
+
+def _action(tool: str, number1: Any, number2: Any) -> AgentAction:
+    return AgentAction(tool=tool, tool_input={"number1": number1, "number2": number2}, log="")
+
+
+def _inputs(numbers: str, next_thought: Any, *steps: AgentAction):
+    return {
+        "inputs": {"numbers": numbers},
+        "intermediate_steps": [(step, None) for step in steps],
+        "next_thought": next_thought,
+    }
+
+
+def test_is_solvable() -> None:
+    assert is_solvable([4, 9, 10, 13])
+    assert is_solvable([24])
+    # only via fractions: 8 / (3 - 8 / 3)
+    assert is_solvable([3, 3, 8, 8])
+    assert not is_solvable([1, 1, 1, 1])
+    assert not is_solvable([23])
+
+
+def test_apply_action_matches_numbers_as_floats() -> None:
+    assert apply_action([4.0, 6.0, 1.0], _action("multiply", "4", 6)) == [1.0, 24.0]
+    assert apply_action([8.0, 3.0], _action("divide", 8, 3.0)) == [8 / 3]
+    # results of previous operations are matched exactly
+    assert apply_action([8 / 3, 3.0], _action("subtract", 3, 8 / 3)) == [3 - 8 / 3]
+
+
+def test_apply_action_rejects_invalid_actions() -> None:
+    numbers = [4.0, 6.0]
+    # a number can't be used twice
+    assert apply_action(numbers, _action("add", 4, 4)) is None
+    assert apply_action(numbers, _action("add", 4, 5)) is None
+    assert apply_action(numbers, _action("power", 4, 6)) is None
+    assert apply_action(numbers, _action("add", "four", 6)) is None
+    assert apply_action([4.0, 0.0], _action("divide", 4, 0)) is None
+    assert numbers == [4.0, 6.0]
+
+
+def test_evaluate_thought() -> None:
+    # 4 + 9 leaves 10 13 13, from which 24 can't be obtained
+    assert evaluate_thought(_inputs("4 9 10 13", _action("add", 4, 9))) == 0.0
+    # 13 - 9 leaves 4 4 10, from which 24 can still be obtained: deferred to later stages
+    assert evaluate_thought(_inputs("4 9 10 13", _action("subtract", 13, 9))) is None
+    assert evaluate_thought(_inputs("4 9 10 13", _action("subtract", 13, 9)), solvable_value=0.5) == 0.5
+    assert evaluate_thought(_inputs("4 9 10 13", _action("add", 4, 5))) == 0.0
+    assert evaluate_thought(_inputs("4 6", _action("multiply", 4, 6))) == 1.0
+    assert evaluate_thought(_inputs("4 6", AgentFinish(return_values={}, log=""), _action("multiply", 4, 6))) == 1.0
+    assert evaluate_thought(_inputs("4 6", AgentFinish(return_values={}, log=""), _action("add", 4, 6))) == 0.0
+
+
+def test_evaluate_thought_replays_trajectory_with_fractions() -> None:
+    # 8 / (3 - 8 / 3): the last action refers to the result of the previous one, not to 1 / 3
+    steps = (_action("divide", 8, 3), _action("subtract", 3, 8 / 3))
+    assert evaluate_thought(_inputs("3 3 8 8", _action("divide", 8, 3 - 8 / 3), *steps)) == 1.0
+    assert evaluate_thought(_inputs("3 3 8 8", _action("divide", 8, 1 / 3), *steps)) == 0.0
+
+
+def test_evaluate_episode() -> None:
+    assert evaluate_episode(_inputs("4 6", None, _action("multiply", 4, 6))) == 1.0
+    assert evaluate_episode(_inputs("4 6", None, _action("add", 4, 6))) == 0.0
+    assert evaluate_episode(_inputs("4 6", None)) is None
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+from gymnasium.envs.toy_text.frozen_lake import FrozenLakeEnv
+
+from environments.frozen_lake.common import FrozenLakeEnvWrapper
+from planning_library.utils.gym_env_reset_tool import GymEnvResetTool
+
+
+class _RecordingEnv(FrozenLakeEnvWrapper):
+    reset_thread: threading.Thread
+
+    def reset(self, *args, **kwargs):
+        self.reset_thread = threading.current_thread()
+        return super().reset(*args, **kwargs)
+
+
+def _make_env() -> _RecordingEnv:
+    return _RecordingEnv(FrozenLakeEnv(desc=["SF", "FG"], is_slippery=False))  # type: ignore[arg-type]
+
+
+def test_async_reset_is_offloaded_by_default() -> None:
+    env = _make_env()
+    asyncio.run(GymEnvResetTool(env=env).ainvoke({}))
+
+    assert env.reset_thread is not threading.main_thread()
+
+
+def test_async_reset_inline() -> None:
+    env = _make_env()
+    asyncio.run(GymEnvResetTool(env=env, offload=False).ainvoke({}))
+
+    assert env.reset_thread is threading.main_thread()
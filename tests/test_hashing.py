@@ -0,0 +1,27 @@
+from langchain.agents.output_parsers.openai_tools import OpenAIToolAgentAction
+from langchain_core.messages import AIMessage
+
+from planning_library.components.caching import canonical_hash
+
+
+def _create_trajectory(call_id: str) -> list:
+    message = AIMessage(
+        content="",
+        id=f"run-{call_id}",
+        additional_kwargs={
+            "tool_calls": [{"id": call_id, "type": "function", "function": {"name": "move", "arguments": "{}"}}]
+        },
+    )
+    action = OpenAIToolAgentAction(tool="move", tool_input={}, log="", message_log=[message], tool_call_id=call_id)
+    return [(action, "observation")]
+
+
+def test_hash_ignores_tool_call_ids() -> None:
+    assert canonical_hash(_create_trajectory("call_1")) == canonical_hash(_create_trajectory("call_2"))
+
+
+def test_hash_depends_on_actions() -> None:
+    trajectory = _create_trajectory("call_1")
+    other_action = trajectory[0][0].copy(update={"tool_input": {"direction": "left"}})
+
+    assert canonical_hash(trajectory) != canonical_hash([(other_action, "observation")])
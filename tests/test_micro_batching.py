@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Union
+
+import pytest
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from planning_library.scheduling import MicroBatchingRunnable
+
+
+class _RecordingRunnable(Runnable[str, str]):
+    """Upper-cases inputs, records the batches it receives and fails on `bad` inputs."""
+
+    def __init__(self, fail_batches: bool = False):
+        self.fail_batches = fail_batches
+        self.batches: List[List[str]] = []
+
+    def _process(self, input: str) -> Union[str, Exception]:
+        return ValueError(input) if input == "bad" else input.upper()
+
+    def invoke(self, input: str, config: Optional[RunnableConfig] = None, **kwargs: Any) -> str:
+        self.batches.append([input])
+        output = self._process(input)
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+    def batch(self, inputs: List[str], config: Any = None, *, return_exceptions: bool = False, **kwargs: Any) -> Any:
+        self.batches.append(list(inputs))
+        if self.fail_batches:
+            raise RuntimeError("server is down")
+        return [self._process(input) for input in inputs]
+
+    async def abatch(
+        self, inputs: List[str], config: Any = None, *, return_exceptions: bool = False, **kwargs: Any
+    ) -> Any:
+        return self.batch(inputs, config, return_exceptions=return_exceptions, **kwargs)
+
+
+def _invoke_concurrently(llm: MicroBatchingRunnable, inputs: List[str]) -> List[Any]:
+    def _invoke(input: str) -> Any:
+        try:
+            return llm.invoke(input)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        return list(executor.map(_invoke, inputs))
+
+
+def _ainvoke_concurrently(llm: MicroBatchingRunnable, inputs: List[str]) -> List[Any]:
+    async def _run() -> List[Any]:
+        return await asyncio.gather(*(llm.ainvoke(input) for input in inputs), return_exceptions=True)
+
+    return asyncio.run(_run())
+
+
+def test_concurrent_calls_are_batched() -> None:
+    runnable = _RecordingRunnable()
+    llm = MicroBatchingRunnable(runnable, max_batch_size=8, max_wait=0.5)
+
+    assert _invoke_concurrently(llm, ["a", "b", "c", "d"]) == ["A", "B", "C", "D"]
+    assert [sorted(batch) for batch in runnable.batches] == [["a", "b", "c", "d"]]
+
+
+def test_concurrent_async_calls_are_batched() -> None:
+    runnable = _RecordingRunnable()
+    llm = MicroBatchingRunnable(runnable, max_batch_size=8, max_wait=0.05)
+
+    assert _ainvoke_concurrently(llm, ["a", "b", "c", "d"]) == ["A", "B", "C", "D"]
+    assert runnable.batches == [["a", "b", "c", "d"]]
+
+
+def test_batches_are_split_by_max_batch_size() -> None:
+    runnable = _RecordingRunnable()
+    llm = MicroBatchingRunnable(runnable, max_batch_size=2, max_wait=0.5)
+
+    assert _ainvoke_concurrently(llm, ["a", "b", "c", "d", "e"]) == ["A", "B", "C", "D", "E"]
+    assert runnable.batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    runnable.batches.clear()
+    assert _invoke_concurrently(llm, ["a", "b", "c", "d"]) == ["A", "B", "C", "D"]
+    assert sorted(len(batch) for batch in runnable.batches) == [2, 2]
+
+
+@pytest.mark.parametrize("run_concurrently", [_invoke_concurrently, _ainvoke_concurrently])
+def test_exceptions_are_fanned_back_to_their_callers(run_concurrently: Any) -> None:
+    llm = MicroBatchingRunnable(_RecordingRunnable(), max_batch_size=8, max_wait=0.5)
+
+    outputs = run_concurrently(llm, ["a", "bad", "c"])
+    assert outputs[0] == "A" and outputs[2] == "C"
+    assert isinstance(outputs[1], ValueError)
+
+
+@pytest.mark.parametrize("run_concurrently", [_invoke_concurrently, _ainvoke_concurrently])
+def test_failed_batch_is_reported_to_each_caller(run_concurrently: Any) -> None:
+    runnable = _RecordingRunnable(fail_batches=True)
+    llm = MicroBatchingRunnable(runnable, max_batch_size=8, max_wait=0.5)
+
+    outputs = run_concurrently(llm, ["a", "b", "c"])
+    assert len(runnable.batches) == 1
+    assert all(isinstance(output, RuntimeError) for output in outputs)
+
+
+def test_cancelled_async_caller_is_not_sent() -> None:
+    runnable = _RecordingRunnable()
+    llm = MicroBatchingRunnable(runnable, max_batch_size=8, max_wait=0.1)
+
+    async def _run() -> str:
+        cancelled = asyncio.ensure_future(llm.ainvoke("a"))
+        kept = asyncio.ensure_future(llm.ainvoke("b"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await kept
+
+    assert asyncio.run(_run()) == "B"
+    assert runnable.batches == [["b"]]
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from planning_library.instrumentation import RunStats
+from planning_library.instrumentation.metrics import ROUTER_COST, ROUTER_DECISIONS
+from planning_library.primitives.model_router import ModelRouter, near_threshold
+from planning_library.primitives.output_parsers import SimpleEvaluateOutputParser
+from planning_library.testing import ScriptedChatModel
+
+COSTS = {"small": 1.0, "large": 10.0}
+
+
+class _LLMRunsHandler(BaseCallbackHandler):
+    """Records the total tokens of each LLM call and whether it was made inside another call."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[bool, int]] = []
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, parent_run_id: Optional[UUID] = None, **kwargs: Any):
+        self.calls.append((parent_run_id is not None, (response.llm_output or {})["token_usage"]["total_tokens"]))
+
+
+def _create_router(name: str, small_reply: str, large_reply: str) -> ModelRouter:
+    return ModelRouter(
+        models=[ScriptedChatModel(responses=[small_reply]), ScriptedChatModel(responses=[large_reply])],
+        output_parser=SimpleEvaluateOutputParser(),
+        should_escalate=near_threshold(0.5, margin=0.1),
+        costs=list(COSTS.values()),
+        model_names=list(COSTS),
+        router_name=name,
+    )
+
+
+def _decisions(name: str) -> Dict[Tuple[str, str], float]:
+    return {
+        (model_name, decision): ROUTER_DECISIONS.labels(name, model_name, decision).value
+        for model_name in COSTS
+        for decision in ("accepted", "escalated_parse_error", "escalated_borderline")
+        if ROUTER_DECISIONS.labels(name, model_name, decision).value
+    }
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize(
+    "small_reply, decision",
+    [("I'm not sure.", "escalated_parse_error"), ("Hard to say. [[0.55]]", "escalated_borderline")],
+)
+def test_escalation(small_reply: str, decision: str, is_async: bool) -> None:
+    name = f"escalation-{decision}-{is_async}"
+    router = _create_router(name, small_reply, "Looks right. [[0.9]]")
+    handler = _LLMRunsHandler()
+    config = {"callbacks": [handler]}
+
+    reply = asyncio.run(router.ainvoke("question", config)) if is_async else router.invoke("question", config)  # type: ignore[arg-type]
+
+    assert reply.content == "Looks right. [[0.9]]"
+    assert _decisions(name) == {("small", decision): 1, ("large", "accepted"): 1}
+
+    # both models are reported as children of the router's call
+    (small_child, small_tokens), (large_child, large_tokens), (router_child, total_tokens) = handler.calls
+    assert small_child and large_child and not router_child
+    assert total_tokens == small_tokens + large_tokens
+    assert ROUTER_COST.labels(name, "small").value == COSTS["small"] * small_tokens
+    assert ROUTER_COST.labels(name, "large").value == COSTS["large"] * large_tokens
+
+
+def test_confident_reply_is_accepted() -> None:
+    name = "accepted"
+    router = _create_router(name, "Looks right. [[0.9]]", "Looks wrong. [[0.1]]")
+
+    assert router.invoke("question").content == "Looks right. [[0.9]]"
+    assert _decisions(name) == {("small", "accepted"): 1}
+    assert ROUTER_COST.labels(name, "large").value == 0
+
+
+def test_run_stats_count_the_calls_of_models() -> None:
+    router = _create_router("run-stats", "I'm not sure.", "Looks right. [[0.9]]")
+    stats = RunStats()
+
+    router.invoke("question", {"callbacks": [stats.callback_handler]})
+
+    assert stats.totals["llm_calls"] == 2
@@ -0,0 +1,66 @@
+import asyncio
+import os
+import threading
+
+import pytest
+from langchain_core.agents import AgentAction
+
+from benchmarks.scenarios import FROZEN_LAKE
+from planning_library.action_executors import LangchainActionExecutor, MetaTools, ProcessActionExecutor
+from planning_library.utils.gym_env_reset_tool import GymEnvResetTool
+
+MOVE_RIGHT = AgentAction(tool="move", tool_input={"direction": "right"}, log="")
+
+
+class _Executor(LangchainActionExecutor):
+    def make_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    def fail_with_lock(self) -> None:
+        raise ValueError(threading.Lock())
+
+    def exit(self) -> None:
+        os._exit(1)
+
+
+def _create_executor() -> _Executor:
+    env = FROZEN_LAKE.create_env()
+    FROZEN_LAKE.reset_env(env)
+    return _Executor(env.tools, meta_tools=MetaTools(reset=GymEnvResetTool(env=env, offload=False)))
+
+
+def _position(executor: ProcessActionExecutor, action: AgentAction = MOVE_RIGHT):
+    return executor.execute(action).observation[0]
+
+
+def test_round_trip() -> None:
+    with ProcessActionExecutor(_create_executor, start_method="spawn") as executor:
+        assert [tool.name for tool in executor.tools] == [tool.name for tool in FROZEN_LAKE.create_env().tools]
+        assert _position(executor) == (1, 0)
+        assert _position(executor) == (2, 0)
+
+        executor.reset()
+        assert _position(executor) == (1, 0)
+
+        asyncio.run(executor.areset())
+        assert asyncio.run(executor.aexecute(MOVE_RIGHT)).observation[0] == (1, 0)
+    assert not executor._process.is_alive()
+
+
+def test_unpicklable_result_and_error() -> None:
+    with ProcessActionExecutor(_create_executor, start_method="spawn") as executor:
+        with pytest.raises(RuntimeError, match="make_lock"):
+            executor.call_method("make_lock")
+        with pytest.raises(RuntimeError, match="ValueError"):
+            executor.call_method("fail_with_lock")
+
+        # the worker keeps serving requests
+        assert _position(executor) == (1, 0)
+
+
+def test_dead_worker() -> None:
+    with ProcessActionExecutor(_create_executor, start_method="spawn") as executor:
+        with pytest.raises(RuntimeError, match="has died"):
+            executor.call_method("exit")
+        with pytest.raises(RuntimeError):
+            _position(executor)
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+from langchain_core.runnables import RunnableLambda
+
+from planning_library.scheduling import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, RateLimitedScheduler
+
+# 10 requests per second: with an empty bucket, each request waits for 0.1 seconds
+REQUESTS_PER_MINUTE = 600
+
+
+def _create_scheduler() -> RateLimitedScheduler:
+    scheduler = RateLimitedScheduler(requests_per_minute=REQUESTS_PER_MINUTE, max_concurrency=1)
+    assert scheduler.request_bucket is not None
+    scheduler.request_bucket.tokens = 0.0
+    return scheduler
+
+
+def test_waiters_are_woken_up_after_refill() -> None:
+    # requests waiting for the slot have to be granted once the bucket is refilled after the slot is released
+    scheduler = _create_scheduler()
+    scheduler.acquire(PRIORITY_NORMAL, num_tokens=1)
+    granted: List[int] = []
+
+    def _call(i: int) -> None:
+        scheduler.acquire(PRIORITY_NORMAL, num_tokens=1)
+        granted.append(i)
+        scheduler.release(PRIORITY_NORMAL, latency=0.0)
+
+    threads = [threading.Thread(target=_call, args=(i,), daemon=True) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    # shorter than a refill, so the bucket is still empty when the slot is released
+    time.sleep(0.02)
+    scheduler.release(PRIORITY_NORMAL, latency=0.0)
+    for thread in threads:
+        thread.join(timeout=5.0)
+
+    assert sorted(granted) == [0, 1]
+
+
+def test_async_waiters_are_woken_up_after_refill() -> None:
+    scheduler = _create_scheduler()
+    llm = scheduler.wrap(RunnableLambda(lambda x: x))
+
+    async def _run() -> List[int]:
+        await scheduler.aacquire(PRIORITY_NORMAL, num_tokens=1)
+        calls = asyncio.gather(*(llm.ainvoke(i) for i in range(2)))
+        await asyncio.sleep(0.02)
+        scheduler.release(PRIORITY_NORMAL, latency=0.0)
+        return await asyncio.wait_for(calls, timeout=5.0)
+
+    assert asyncio.run(_run()) == [0, 1]
+
+
+def test_priorities_and_cancellation() -> None:
+    scheduler = _create_scheduler()
+    order: List[str] = []
+
+    async def _call(name: str, priority: int) -> None:
+        await scheduler.aacquire(priority, num_tokens=1)
+        order.append(name)
+        scheduler.release(priority, latency=0.0)
+
+    async def _run() -> None:
+        low = asyncio.ensure_future(_call("low", PRIORITY_LOW))
+        cancelled = asyncio.ensure_future(_call("cancelled", PRIORITY_HIGH))
+        high = asyncio.ensure_future(_call("high", PRIORITY_HIGH))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(asyncio.gather(low, high), timeout=5.0)
+
+    start = time.perf_counter()
+    asyncio.run(_run())
+
+    assert order == ["high", "low"]
+    assert scheduler.num_in_flight == 0
+    assert time.perf_counter() - start >= 2 * 60 / REQUESTS_PER_MINUTE * 0.9
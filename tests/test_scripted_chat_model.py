@@ -0,0 +1,52 @@
+import asyncio
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from planning_library.testing import ScriptedChatModel, StreamingScriptedChatModel, tool_calls_message
+
+
+def test_responses_in_order() -> None:
+    model = ScriptedChatModel(responses=["first", "second"])
+
+    assert [model.invoke("hi").content for _ in range(3)] == ["first", "second", "first"]
+    assert model.num_calls == 3
+
+
+def test_respond_function() -> None:
+    model = ScriptedChatModel(respond=lambda messages: f"got {len(messages)}")
+
+    assert model.invoke([HumanMessage(content="a"), HumanMessage(content="b")]).content == "got 2"
+    assert asyncio.run(model.ainvoke("a")).content == "got 1"
+
+
+def test_tool_call_ids_are_unique_across_calls() -> None:
+    model = ScriptedChatModel(responses=[tool_calls_message(("move", {"direction": "left"}))])
+
+    first, second = model.invoke("a"), model.invoke("a")
+
+    assert isinstance(first, AIMessage) and isinstance(second, AIMessage)
+    assert first.additional_kwargs["tool_calls"][0]["id"] != second.additional_kwargs["tool_calls"][0]["id"]
+
+
+def test_token_usage() -> None:
+    model = ScriptedChatModel(responses=["three word reply"])
+
+    result = model.generate([[HumanMessage(content="two words")]])
+
+    assert result.llm_output is not None
+    assert result.llm_output["token_usage"] == {"prompt_tokens": 2, "completion_tokens": 3, "total_tokens": 5}
+
+
+def test_streaming() -> None:
+    model = StreamingScriptedChatModel(responses=["one two three"])
+
+    stream = model.stream("a")
+    text = ""
+    for chunk in stream:
+        text += str(chunk.content)
+        if "two" in text:
+            break
+    stream.close()  # type: ignore[attr-defined]
+
+    assert text == "one two "
+    assert model.num_streamed_tokens == 2
@@ -0,0 +1,55 @@
+import asyncio
+import time
+from typing import Sequence, Tuple
+
+import pytest
+from langchain_core.prompts import ChatPromptTemplate
+
+from planning_library.components.evaluation import EvaluatorComponent, SelfConsistencyEvaluatorComponent
+from planning_library.primitives.output_parsers import SimpleEvaluateOutputParser
+from planning_library.testing import ScriptedChatModel
+
+
+def _create_evaluator(
+    responses: Sequence[str], aggregation: str = "majority"
+) -> Tuple[SelfConsistencyEvaluatorComponent, ScriptedChatModel]:
+    model = ScriptedChatModel(responses=list(responses), latency=0.01)
+    evaluator = EvaluatorComponent.create_threshold_evaluator_from_runnable(
+        runnable=ChatPromptTemplate.from_messages([("human", "{thought}")]) | model | SimpleEvaluateOutputParser(),
+        threshold=0.5,
+        threshold_mode="geq",
+    )
+    return SelfConsistencyEvaluatorComponent.from_evaluator(evaluator, num_votes=5, aggregation=aggregation), model
+
+
+def _evaluate(evaluator: SelfConsistencyEvaluatorComponent, is_async: bool) -> bool:
+    return asyncio.run(evaluator.ainvoke({"thought": "step"})) if is_async else evaluator.invoke({"thought": "step"})
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize("aggregation", ["majority", "mean"])
+def test_stops_once_the_verdict_is_known(is_async: bool, aggregation: str) -> None:
+    evaluator, model = _create_evaluator(["[[1.0]]"], aggregation=aggregation)
+
+    assert _evaluate(evaluator, is_async) is True
+    # 3 of 5 votes settle the verdict, the other samples are never requested
+    time.sleep(0.05)
+    assert model.num_calls == 3
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_requests_only_the_votes_that_can_settle_the_verdict(is_async: bool) -> None:
+    evaluator, model = _create_evaluator(["[[1.0]]", "[[0.0]]", "[[1.0]]", "[[1.0]]", "[[0.0]]"])
+
+    assert _evaluate(evaluator, is_async) is True
+    # after 2 passed votes and 1 failed vote, a single passed vote settles the verdict
+    time.sleep(0.05)
+    assert model.num_calls == 4
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_uses_all_votes_when_needed(is_async: bool) -> None:
+    evaluator, model = _create_evaluator(["[[1.0]]", "[[0.0]]", "[[1.0]]", "[[0.0]]", "[[0.0]]"])
+
+    assert _evaluate(evaluator, is_async) is False
+    assert model.num_calls == 5
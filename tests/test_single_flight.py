@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, List
+
+from planning_library.scheduling import SingleFlightRunnable
+from planning_library.testing import ScriptedChatModel
+
+
+class _SampledChatModel(ScriptedChatModel):
+    temperature: float = 0.0
+
+
+def _run_concurrently(llm: SingleFlightRunnable, num_calls: int = 3, **kwargs: Any) -> List[str]:
+    async def _run() -> List[str]:
+        outputs = await asyncio.gather(*(llm.ainvoke("question", **kwargs) for _ in range(num_calls)))
+        return [output.content for output in outputs]
+
+    return asyncio.run(_run())
+
+
+def test_deterministic_calls_are_coalesced() -> None:
+    model = _SampledChatModel(responses=["a", "b", "c"], latency=0.05)
+
+    assert _run_concurrently(SingleFlightRunnable(model)) == ["a", "a", "a"]
+    assert model.num_calls == 1
+
+
+def test_sampled_calls_are_not_coalesced() -> None:
+    # e.g., self-consistency votes: each of them needs its own sample
+    model = _SampledChatModel(responses=["a", "b", "c"], latency=0.05, temperature=0.7)
+
+    assert sorted(_run_concurrently(SingleFlightRunnable(model))) == ["a", "b", "c"]
+    assert model.num_calls == 3
+
+
+def test_calls_with_temperature_are_not_coalesced() -> None:
+    model = _SampledChatModel(responses=["a", "b", "c"], latency=0.05)
+
+    assert sorted(_run_concurrently(SingleFlightRunnable(model), temperature=0.7)) == ["a", "b", "c"]
+    assert model.num_calls == 3
+
+
+def test_sampled_calls_are_coalesced_when_requested() -> None:
+    model = _SampledChatModel(responses=["a", "b", "c"], latency=0.05, temperature=0.7)
+
+    assert _run_concurrently(SingleFlightRunnable(model, deterministic_only=False)) == ["a", "a", "a"]
+    assert model.num_calls == 1
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from benchmarks.scenarios import ENVIRONMENTS, STRATEGIES, create_run
+
+# number of LLM calls each strategy makes on the default scenarios (the same for both environments)
+EXPECTED_NUM_LLM_CALLS = {"simple": 4, "tot_dfs": 60, "adapt": 13, "reflexion": 12}
+
+
+def _final_answers(strategy: str, outputs) -> list:
+    if strategy in ("simple", "tot_dfs"):
+        return outputs["output"]
+    if strategy == "reflexion":
+        return [outputs["agent_outcome"].return_values["output"]]
+    return []
+
+
+@pytest.mark.parametrize("environment", list(ENVIRONMENTS))
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_strategy_run(strategy: str, environment: str) -> None:
+    run = create_run(strategy, environment)
+    outputs = run.invoke()
+
+    assert run.num_llm_calls == EXPECTED_NUM_LLM_CALLS[strategy]
+    assert all(answer == ENVIRONMENTS[environment].answer for answer in _final_answers(strategy, outputs))
+
+
+@pytest.mark.parametrize("environment", list(ENVIRONMENTS))
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_strategy_run_async(strategy: str, environment: str) -> None:
+    run = create_run(strategy, environment)
+    outputs = asyncio.run(run.ainvoke())
+
+    assert run.num_llm_calls == EXPECTED_NUM_LLM_CALLS[strategy]
+    assert all(answer == ENVIRONMENTS[environment].answer for answer in _final_answers(strategy, outputs))
+
+
+def test_tot_self_consistency_votes() -> None:
+    run = create_run("tot_dfs", "game_of_24", num_votes=3)
+    outputs = run.invoke()
+
+    assert outputs["output"]
+    assert run.num_llm_calls > EXPECTED_NUM_LLM_CALLS["tot_dfs"]
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from langchain_core.memory import BaseMemory
+
+from benchmarks.scenarios import create_run
+from planning_library.instrumentation import RunStats, get_current_run_stats
+from planning_library.instrumentation.metrics import STRATEGY_RUNS
+from planning_library.strategies.base_strategy import BaseCustomStrategy
+
+
+def _create_strategy() -> BaseCustomStrategy:
+    run = create_run("tot_dfs", "game_of_24")
+    assert isinstance(run.runnable, BaseCustomStrategy)
+    return run.runnable._shallow_copy(return_run_stats=True)
+
+
+class _RecordingMemory(BaseMemory):
+    saved: List[Dict[str, Any]] = []
+
+    @property
+    def memory_variables(self) -> List[str]:
+        return []
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        self.saved.append(outputs)
+
+    def clear(self) -> None:
+        self.saved.clear()
+
+
+def _num_runs(strategy: BaseCustomStrategy, status: str) -> float:
+    return STRATEGY_RUNS.labels(type(strategy).__name__, status).value
+
+
+@pytest.mark.parametrize("close_early", [False, True])
+def test_stream_doesnt_leak_run_stats(close_early: bool) -> None:
+    strategy = _create_strategy()
+    num_runs = _num_runs(strategy, "stopped" if close_early else "success")
+
+    stream = strategy.stream({"numbers": "1 2 3 4"})
+    for output in stream:
+        assert isinstance(output["run_stats"], RunStats)
+        assert get_current_run_stats() is None
+        if close_early:
+            break
+    stream.close()  # type: ignore[attr-defined]
+
+    assert get_current_run_stats() is None
+    assert _num_runs(strategy, "stopped" if close_early else "success") == num_runs + 1
+
+
+@pytest.mark.parametrize("close_early", [False, True])
+def test_astream_doesnt_leak_run_stats(close_early: bool) -> None:
+    strategy = _create_strategy()
+    num_runs = _num_runs(strategy, "stopped" if close_early else "success")
+
+    async def _consume() -> RunStats:
+        stream = strategy.astream({"numbers": "1 2 3 4"})
+        run_stats = None
+        async for output in stream:
+            run_stats = output["run_stats"]
+            assert get_current_run_stats() is None
+            if close_early:
+                break
+        await stream.aclose()  # type: ignore[attr-defined]
+        assert isinstance(run_stats, RunStats)
+        return run_stats
+
+    run_stats = asyncio.run(_consume())
+
+    assert run_stats.totals["llm_calls"] > 0
+    assert get_current_run_stats() is None
+    assert _num_runs(strategy, "stopped" if close_early else "success") == num_runs + 1
+
+
+def test_streams_save_outputs_to_memory() -> None:
+    memory = _RecordingMemory(saved=[])
+    strategy = _create_strategy()._shallow_copy(memory=memory)
+
+    outputs = list(strategy.stream({"numbers": "1 2 3 4"}))
+    assert len(memory.saved) == 1
+    assert memory.saved[0]["output"] == [output["output"] for output in outputs]
+
+    async def _consume() -> None:
+        async for _ in strategy.astream({"numbers": "1 2 3 4"}):
+            pass
+
+    asyncio.run(_consume())
+    assert len(memory.saved) == 2
+
+
+def test_streams_closed_early_dont_save_outputs_to_memory() -> None:
+    memory = _RecordingMemory(saved=[])
+    strategy = _create_strategy()._shallow_copy(memory=memory)
+
+    stream = strategy.stream({"numbers": "1 2 3 4"})
+    next(stream)
+    stream.close()  # type: ignore[attr-defined]
+
+    assert memory.saved == []
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+from langchain_core.agents import AgentAction
+from langchain_core.exceptions import OutputParserException
+
+from planning_library.primitives.output_parsers import SimpleSortOutputParser
+from planning_library.strategies.tot_dfs.components import ThoughtSorter
+from planning_library.strategies.tot_dfs.components.thought_sorter import ThoughtSorterConfig
+from planning_library.testing import ScriptedChatModel
+
+THOUGHTS = [AgentAction(tool=tool, tool_input={}, log="") for tool in ("a", "b", "c")]
+
+
+def test_sort_output_parser_returns_tie_on_other_verdicts() -> None:
+    parser = SimpleSortOutputParser()
+
+    assert parser.parse("The second one. [[2]]") == "2"
+    assert parser.parse("Both are equally good. [[0]]") == ""
+    assert parser.parse("Both are equally good.") == ""
+    with pytest.raises(OutputParserException):
+        SimpleSortOutputParser(strict=True).parse("Both are equally good.")
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_thought_sorter_counts_other_verdicts_as_ties(is_async: bool) -> None:
+    # comparisons: (a, b), (a, c), (b, c)
+    llm = ScriptedChatModel(responses=["[[2]]", "no verdict", "[[0]]"])
+    sorter = ThoughtSorter.create_from_config(
+        ThoughtSorterConfig(llm=llm, user_message="Solve the task.", parser_name="openai-tools")
+    )
+    inputs = {"inputs": {}, "thoughts": THOUGHTS, "intermediate_steps": []}
+
+    sorted_thoughts = asyncio.run(sorter.ainvoke(inputs)) if is_async else sorter.invoke(inputs)  # type: ignore[arg-type]
+
+    # scores: a = 0.5, b = 1.5, c = 1.0
+    assert [thought.tool for thought in sorted_thoughts] == ["b", "c", "a"]  # type: ignore[union-attr]
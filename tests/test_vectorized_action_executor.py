@@ -0,0 +1,159 @@
+import asyncio
+from typing import Any, Dict, List
+
+import gymnasium as gym
+import pytest
+from gymnasium.envs.toy_text.frozen_lake import FrozenLakeEnv
+from langchain_core.agents import AgentAction
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+from environments.frozen_lake.common.tools import MoveTool
+from planning_library.action_executors import LangchainActionExecutor, VectorizedActionExecutor
+from planning_library.components.agent_component import AgentFactory
+from planning_library.instrumentation.metrics import STRATEGY_RUNS
+from planning_library.strategies.simple import SimpleStrategy
+from planning_library.testing import ScriptedChatModel, tool_calls_message
+
+BOARD = ["SFFF", "FFFF", "FFFF", "FFFG"]
+# each session follows its own path: sessions finish after a different number of steps
+PATHS = {"a": ["right"], "b": ["right", "right", "down"], "c": []}
+
+
+def _make_vector_env(num_envs: int) -> gym.vector.SyncVectorEnv:
+    env = gym.vector.SyncVectorEnv(
+        [lambda: FrozenLakeEnv(desc=BOARD, is_slippery=False) for _ in range(num_envs)]  # type: ignore[arg-type]
+    )
+    env.reset(seed=0)
+    return env
+
+
+def _convert_action(action: AgentAction) -> int:
+    assert isinstance(action.tool_input, dict)
+    return MoveTool._convert_direction_to_frozenlake(action.tool_input["direction"])
+
+
+def _make_action_executor(env: gym.vector.VectorEnv) -> VectorizedActionExecutor:
+    return VectorizedActionExecutor.from_gym_vector_env(
+        env,
+        tools=[MoveTool(env=env)],  # type: ignore[call-arg]
+        convert_action=_convert_action,
+    )
+
+
+def _move(direction: str) -> AgentAction:
+    return AgentAction(tool="move", tool_input={"direction": direction}, log="")
+
+
+def _positions(env: gym.vector.SyncVectorEnv) -> List[int]:
+    return [sub_env.unwrapped.s for sub_env in env.envs]  # type: ignore[attr-defined]
+
+
+def test_execute_batch_skips_idle_sessions() -> None:
+    env = _make_vector_env(3)
+    action_executor = _make_action_executor(env)
+
+    results = action_executor.execute_batch([_move("right"), None, [_move("down"), _move("down")]])
+
+    assert results[1] is None
+    assert _positions(env) == [1, 0, 8]
+
+
+def test_single_session_execute_and_reset() -> None:
+    env = _make_vector_env(2)
+    action_executor = _make_action_executor(env)
+    session = action_executor.session(1)
+
+    session.execute(_move("down"))
+    assert _positions(env) == [0, 4]
+
+    action_executor.execute_batch([_move("right"), _move("right")])
+    session.reset()
+    assert _positions(env) == [1, 0]
+
+    session.reset(actions=[_move("right")])
+    assert _positions(env) == [1, 1]
+
+
+def test_async_vector_env_rejects_partial_steps() -> None:
+    env = gym.vector.AsyncVectorEnv([lambda: FrozenLakeEnv(desc=BOARD, is_slippery=False) for _ in range(2)])
+    try:
+        env.reset(seed=0)
+        action_executor = _make_action_executor(env)
+        with pytest.raises(ValueError, match="SyncVectorEnv"):
+            action_executor.execute_batch([_move("right"), None])
+    finally:
+        env.close()
+
+
+def _respond(messages: List[BaseMessage]) -> AIMessage:
+    session = next(str(m.content) for m in messages if isinstance(m, HumanMessage)).split()[-1]
+    num_steps = sum(isinstance(m, ToolMessage) for m in messages)
+    if num_steps < len(PATHS[session]):
+        return tool_calls_message(("move", {"direction": PATHS[session][num_steps]}))
+    return AIMessage(content=f"Session {session} is done.")
+
+
+class _ChainRunsHandler(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.events: List[str] = []
+
+    def on_chain_start(self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs: Any) -> None:
+        if kwargs.get("parent_run_id") is None:
+            self.events.append("start")
+
+    def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:
+        if kwargs.get("parent_run_id") is None:
+            self.events.append("end")
+
+
+def _make_strategy(env: gym.vector.SyncVectorEnv) -> SimpleStrategy:
+    prompt = ChatPromptTemplate.from_messages(
+        [("human", "Walk the board. Session: {session}"), MessagesPlaceholder("agent_scratchpad")]
+    )
+    agent = AgentFactory.create_agent(
+        llm=ScriptedChatModel(respond=_respond),
+        tools=[MoveTool(env=env)],  # type: ignore[call-arg]
+        prompt=prompt,
+        parser_name="openai-tools",
+    )
+    return SimpleStrategy.create(
+        agent=agent, action_executor=_make_action_executor(env), return_intermediate_steps=True, verbose=False
+    )
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_simple_strategy_lockstep(is_async: bool) -> None:
+    env = _make_vector_env(3)
+    strategy = _make_strategy(env)
+    inputs = [{"session": session} for session in PATHS]
+
+    handler = _ChainRunsHandler()
+    num_runs = STRATEGY_RUNS.labels("SimpleStrategy", "success").value
+    config = {"callbacks": [handler]}
+
+    outputs = (
+        asyncio.run(strategy.arun_lockstep(inputs, config))  # type: ignore[arg-type]
+        if is_async
+        else strategy.run_lockstep(inputs, config)  # type: ignore[arg-type]
+    )
+
+    assert [output["output"] for output in outputs] == [[f"Session {session} is done."] for session in PATHS]
+    assert [len(output["intermediate_steps"][0]) for output in outputs] == [len(path) for path in PATHS.values()]
+    assert _positions(env) == [1, 6, 0]
+    # all the sessions are reported as a single run
+    assert handler.events == ["start", "end"]
+    assert STRATEGY_RUNS.labels("SimpleStrategy", "success").value == num_runs + 1
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_lockstep_rejects_executors_without_sessions(is_async: bool) -> None:
+    env = FrozenLakeEnv(desc=BOARD, is_slippery=False)  # type: ignore[arg-type]
+    env.reset(seed=0)
+    strategy = _make_strategy(_make_vector_env(3))
+    strategy = strategy._shallow_copy(action_executor=LangchainActionExecutor([MoveTool(env=env)]))  # type: ignore[call-arg]
+    inputs = [{"session": session} for session in PATHS]
+
+    with pytest.raises(NotImplementedError, match="sessions"):
+        asyncio.run(strategy.arun_lockstep(inputs)) if is_async else strategy.run_lockstep(inputs)